@@ -0,0 +1,33 @@
+"""add_local_ad_model
+
+Revision ID: 011_add_local_ad_model
+Revises: 010_add_write_intents
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "011_add_local_ad_model"
+down_revision: Union[str, None] = "010_add_write_intents"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per hashed feature (ad, not-ad) counts; feature -1 holds document counts
+    op.create_table(
+        "ai_local_model",
+        sa.Column("feature", sa.Integer(), nullable=False),
+        sa.Column("ad", sa.Float(), nullable=False),
+        sa.Column("ham", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("feature"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ai_local_model")
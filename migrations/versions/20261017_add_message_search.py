@@ -0,0 +1,41 @@
+"""add_message_search
+
+Revision ID: 009_add_message_search
+Revises: 008_add_messages
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "009_add_message_search"
+down_revision: Union[str, None] = "008_add_messages"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per indexed message; its rowid is the rowid of the FTS document
+    op.create_table(
+        "search_docs",
+        sa.Column("rowid", sa.Integer(), nullable=False),
+        sa.Column("chat_id", sa.Integer(), nullable=False),
+        sa.Column("msg_id", sa.Integer(), nullable=False),
+        sa.Column("chat_name", sa.Text(), nullable=True),
+        sa.Column("date", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("rowid"),
+        sa.UniqueConstraint("chat_id", "msg_id", name="uq_search_docs_message"),
+    )
+    op.execute(
+        "CREATE VIRTUAL TABLE message_fts USING fts5("
+        "text, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE message_fts")
+    op.drop_table("search_docs")
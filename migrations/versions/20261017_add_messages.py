@@ -0,0 +1,42 @@
+"""add_messages
+
+Revision ID: 008_add_messages
+Revises: 007_add_sync_state
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "008_add_messages"
+down_revision: Union[str, None] = "007_add_sync_state"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "messages",
+        sa.Column("chat_id", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("topic_id", sa.Integer(), nullable=True),
+        # Id of the previous message in the chat when known (0 = chat start);
+        # lets a local page prove it has no gaps
+        sa.Column("prev_id", sa.Integer(), nullable=True),
+        sa.Column("date", sa.Text(), nullable=False),
+        sa.Column("data", sa.Text(), nullable=False),
+        sa.Column("reactions", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("chat_id", "id"),
+    )
+    op.create_index(
+        "ix_messages_chat_topic_id", "messages", ["chat_id", "topic_id", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_messages_chat_topic_id", table_name="messages")
+    op.drop_table("messages")
@@ -0,0 +1,45 @@
+"""add_write_intents
+
+Revision ID: 010_add_write_intents
+Revises: 009_add_message_search
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "010_add_write_intents"
+down_revision: Union[str, None] = "009_add_message_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # topic_key is the topic id, or 0 for the whole chat (NULLs never conflict)
+    op.create_table(
+        "pending_reads",
+        sa.Column("chat_id", sa.Integer(), nullable=False),
+        sa.Column("topic_key", sa.Integer(), nullable=False),
+        sa.Column("max_id", sa.Integer(), nullable=True),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("chat_id", "topic_key"),
+    )
+    op.create_table(
+        "pending_reactions",
+        sa.Column("chat_id", sa.Integer(), nullable=False),
+        sa.Column("msg_id", sa.Integer(), nullable=False),
+        sa.Column("emoji", sa.Text(), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("chat_id", "msg_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("pending_reactions")
+    op.drop_table("pending_reads")
@@ -0,0 +1,56 @@
+"""reaction_intent_ops
+
+Revision ID: 012_reaction_intent_ops
+Revises: 011_add_local_ad_model
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "012_reaction_intent_ops"
+down_revision: Union[str, None] = "011_add_local_ad_model"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per queued reaction write. present is the desired end state of
+    # the emoji (NULL = toggle not resolved against the message yet)
+    op.create_table(
+        "pending_reaction_ops",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("chat_id", sa.Integer(), nullable=False),
+        sa.Column("msg_id", sa.Integer(), nullable=False),
+        sa.Column("emoji", sa.Text(), nullable=False),
+        sa.Column("present", sa.Boolean(), nullable=True),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(
+        """
+        INSERT INTO pending_reaction_ops
+            (chat_id, msg_id, emoji, present, priority, created_at)
+        SELECT chat_id, msg_id, emoji, NULL, priority, created_at
+        FROM pending_reactions ORDER BY created_at
+        """
+    )
+    op.drop_table("pending_reactions")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "pending_reactions",
+        sa.Column("chat_id", sa.Integer(), nullable=False),
+        sa.Column("msg_id", sa.Integer(), nullable=False),
+        sa.Column("emoji", sa.Text(), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("chat_id", "msg_id"),
+    )
+    op.drop_table("pending_reaction_ops")
@@ -5,11 +5,13 @@ from telethon import types, utils
 from telethon.tl.functions.messages import GetPeerDialogsRequest
 from telethon.tl.types import InputDialogPeer
 
+from src.adapters.telegram.entity_cache import EntityCache
+from src.adapters.telegram.message_cache import ParsedMessageCache
 from src.adapters.telethon_mappers import (
     format_message_preview,
     map_telethon_dialog_to_chat_type,
 )
-from src.domain.models import Chat, ChatType, Message
+from src.domain.models import Chat, Message
 from src.infrastructure.logging import get_logger
 
 if TYPE_CHECKING:
@@ -18,6 +20,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Upper bound on messages of one history page parsed at the same time
+_PARSE_CONCURRENCY = 8
+
 
 class ChatQueryOps:
     def __init__(
@@ -25,13 +30,22 @@ class ChatQueryOps:
         client: Any,
         parser: "MessageParser",
         media: "MediaManager",
+        entity_cache: Optional[EntityCache] = None,
+        message_cache: Optional[ParsedMessageCache] = None,
     ) -> None:
         self.client = client
         self._parser = parser
         self._media = media
+        self._entities = (
+            entity_cache if entity_cache is not None else EntityCache(client)
+        )
+        self._messages = (
+            message_cache if message_cache is not None else ParsedMessageCache()
+        )
 
     async def get_chats(self, limit: int) -> list[Chat]:
         dialogs = await self.client.get_dialogs(limit=limit)
+        self._entities.put_dialogs(dialogs)
         results = []
         for d in dialogs:
             chat_type = map_telethon_dialog_to_chat_type(d)
@@ -62,6 +76,7 @@ class ChatQueryOps:
 
     async def get_all_unread_chats(self) -> List[Chat]:
         results = []
+        unread_dialogs = []
         try:
             folders = [0, 1]
             for folder_id in folders:
@@ -70,6 +85,7 @@ class ChatQueryOps:
                     limit=None, ignore_migrated=True, folder=folder_id
                 ):
                     count += 1
+                    self._entities.put_dialog(d)
                     if count % 50 == 0:
                         await asyncio.sleep(0)
 
@@ -82,29 +98,57 @@ class ChatQueryOps:
                             type=chat_type,
                         )
                         results.append(chat)
+                        unread_dialogs.append(d)
 
+            top_messages = await self._parse_top_messages(unread_dialogs)
+            for chat in results:
+                chat.last_message = top_messages.get(chat.id)
         except Exception as e:
             logger.error("get_all_unread_chats_failed", error=str(e))
 
         return results
 
+    async def _parse_top_messages(self, dialogs: List[Any]) -> Dict[int, Message]:
+        """Parse the top message iter_dialogs already delivered with each dialog.
+
+        Senders missing from the dialog response are resolved in one batch, so
+        this costs at most one request per sender kind, not one per chat.
+        """
+        parsed: Dict[int, Message] = {}
+        raw: Dict[int, Any] = {}
+        for d in dialogs:
+            msg = getattr(d, "message", None)
+            if msg is None:
+                continue
+            cached = self._messages.get(d.id, msg.id, getattr(msg, "edit_date", None))
+            if cached is not None:
+                parsed[d.id] = cached
+            else:
+                raw[d.id] = msg
+        if not raw:
+            return parsed
+
+        senders = await self._parser.resolve_senders(list(raw.values()))
+        for chat_id, msg in raw.items():
+            try:
+                message = await self._parser._parse_message(
+                    msg, chat_id=chat_id, senders_map=senders
+                )
+            except Exception as e:
+                logger.warning(
+                    "top_message_parse_failed", chat_id=chat_id, error=str(e)
+                )
+                continue
+            self._messages.put(chat_id, getattr(msg, "edit_date", None), message)
+            parsed[chat_id] = message
+        return parsed
+
     async def get_chat(self, chat_id: int) -> Optional[Chat]:
         try:
-            entity = await self.client.get_entity(chat_id)
-            name = utils.get_display_name(entity)
-
-            c_type = ChatType.GROUP
-            if isinstance(entity, types.User):
-                c_type = ChatType.USER
-            elif isinstance(entity, types.Chat):
-                c_type = ChatType.GROUP
-            elif isinstance(entity, types.Channel):
-                if getattr(entity, "forum", False):
-                    c_type = ChatType.FORUM
-                elif getattr(entity, "broadcast", False):
-                    c_type = ChatType.CHANNEL
-                else:
-                    c_type = ChatType.GROUP
+            cached = await self._entities.resolve(chat_id)
+            entity = cached.entity
+            name = cached.display_name
+            c_type = cached.chat_type
 
             image_url = await self._media._get_chat_image(entity, chat_id)
 
@@ -165,15 +209,31 @@ class ChatQueryOps:
         ids: Optional[List[int]] = None,
     ) -> List[Message]:
         try:
-            entity = await self.client.get_entity(chat_id)
+            entity = await self._entities.get_entity(chat_id)
             messages = await self.client.get_messages(
                 entity, limit=limit, reply_to=topic_id, offset_id=offset_id, ids=ids
             )
-            reply_ids = []
-            for msg in messages:
-                if not msg:
-                    continue
+            page = [msg for msg in messages if msg]
+
+            # Unchanged messages come from the parsed-message cache; reactions
+            # are not covered by edit_date, so they are re-read from the raw one
+            cached: Dict[int, Message] = {}
+            misses = []
+            for msg in page:
                 self._parser._cache_message_chat(msg.id, chat_id)
+                hit = self._messages.get(
+                    chat_id, msg.id, getattr(msg, "edit_date", None)
+                )
+                if hit is not None:
+                    hit.reactions = self._parser._extract_reactions(
+                        getattr(msg, "reactions", None)
+                    )
+                    cached[msg.id] = hit
+                else:
+                    misses.append(msg)
+
+            reply_ids = []
+            for msg in misses:
                 reply_header = getattr(msg, "reply_to", None)
                 if reply_header:
                     rid = getattr(reply_header, "reply_to_msg_id", None)
@@ -191,14 +251,30 @@ class ChatQueryOps:
                 except Exception:
                     pass
 
-            result_messages = []
-            for msg in messages:
-                if msg:
+            senders_map = await self._parser.resolve_senders(misses)
+
+            # CPU-only stage in one batch, then the awaiting stage concurrently
+            texts = [self._parser.render_text(msg) for msg in misses]
+            semaphore = asyncio.Semaphore(_PARSE_CONCURRENCY)
+
+            async def _parse(msg: Any, text: str) -> Message:
+                async with semaphore:
                     parsed = await self._parser._parse_message(
-                        msg, replies_map, chat_id=chat_id
+                        msg,
+                        replies_map,
+                        chat_id=chat_id,
+                        senders_map=senders_map,
+                        text=text,
                     )
-                    result_messages.append(parsed)
-            return result_messages
+                self._messages.put(chat_id, getattr(msg, "edit_date", None), parsed)
+                return parsed
+
+            parsed = await asyncio.gather(
+                *(_parse(msg, text) for msg, text in zip(misses, texts))
+            )
+            cached.update((m.id, m) for m in parsed)
+            # Original page order
+            return [cached[msg.id] for msg in page]
         except Exception as e:
             logger.error("get_messages_failed", chat_id=chat_id, error=str(e))
             return []
@@ -1,6 +1,6 @@
 import asyncio
 import os
-from typing import Any, Awaitable, Callable, List, Optional
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
 
 from telethon import TelegramClient
 from telethon.errors import SessionPasswordNeededError
@@ -8,26 +8,48 @@ from telethon.sessions import StringSession
 from telethon.tl.functions.account import GetPasswordRequest
 
 from src.adapters.telegram.chat_query_ops import ChatQueryOps
+from src.adapters.telegram.entity_cache import EntityCache
+from src.adapters.telegram.message_cache import ParsedMessageCache
 from src.adapters.telegram.event_handlers import EventHandlers
 from src.adapters.telegram.forum_ops import ForumOps
+from src.adapters.telegram.write_intents import WriteIntentStore
 from src.adapters.telegram.write_ops import WriteOps
 from src.adapters.telegram.media import MediaManager
 from src.adapters.telegram.message_parser import MessageParser
 from src.adapters.telegram.types import ITelethonClient
 from src.domain.models import SystemEvent
 from src.domain.ports import ChatRepository
+from src.infrastructure.coalescer import EventCoalescer
+from src.infrastructure.ingest_queue import IngestQueue
 from src.infrastructure.logging import get_logger
-from src.infrastructure.telegram_queue import TelegramWriteQueue
+from src.infrastructure.telegram_queue import TelegramWriteScheduler
 
 logger = get_logger(__name__)
 
 
+class _ReconnectAwareClient(TelegramClient):
+    """TelegramClient that reports its automatic reconnects.
+
+    Updates sent while the connection was down may never arrive, so the
+    adapter tells its listeners that the update stream had a gap.
+    """
+
+    def __init__(self, *args: Any, on_reconnect: Callable[[], None], **kwargs: Any):
+        self._on_reconnect = on_reconnect
+        super().__init__(*args, **kwargs)
+
+    async def _handle_auto_reconnect(self) -> None:
+        self._on_reconnect()
+        await super()._handle_auto_reconnect()
+
+
 class TelethonAdapter(ChatRepository):
     def __init__(
         self,
         session_string: Optional[str],
         api_id: Optional[int],
         api_hash: Optional[str],
+        intent_store: Optional[WriteIntentStore] = None,
     ):
         self.session = StringSession(session_string or "")
         self.api_id = api_id
@@ -37,13 +59,19 @@ class TelethonAdapter(ChatRepository):
         self._self_id: Optional[int] = None
 
         if self.api_id and self.api_hash:
-            self.client = TelegramClient(self.session, self.api_id, self.api_hash)  # type: ignore
+            self.client = _ReconnectAwareClient(  # type: ignore
+                self.session,
+                self.api_id,
+                self.api_hash,
+                on_reconnect=self._notify_reconnect,
+            )
         else:
             logger.info("adapter_initialized_no_credentials")
 
         self.images_dir = os.path.join(os.getcwd(), "cache")
         self._event_handler_registered = False
         self._is_connected_flag = False
+        self._reconnect_listeners: List[Callable[[], None]] = []
 
         # QR Login State
         self._qr_login: Any = None
@@ -52,16 +80,30 @@ class TelethonAdapter(ChatRepository):
             "none"  # none, waiting, authorized, needs_password, expired, error
         )
 
-        # Write queue
-        self._write_queue = TelegramWriteQueue()
+        # Write queue: paced per method/peer, concurrent across peers
+        self._write_queue = TelegramWriteScheduler()
+        # Incoming updates are processed off Telethon's handler loop
+        self._ingest_queue = IngestQueue()
+        # Edit/reaction storms collapse to the latest state per message
+        self._coalescer = EventCoalescer()
 
         os.makedirs(self.images_dir, exist_ok=True)
 
         # Build collaborators
-        self._media = MediaManager(self.client, self.images_dir)
-        self._parser = MessageParser(self.client, self._media)
+        self._entities = EntityCache(self.client)
+        self._messages = ParsedMessageCache()
+        self._media = MediaManager(
+            self.client, self.images_dir, entity_cache=self._entities
+        )
+        self._parser = MessageParser(
+            self.client, self._media, entity_cache=self._entities
+        )
         self._chat_query_ops = ChatQueryOps(
-            client=self.client, parser=self._parser, media=self._media
+            client=self.client,
+            parser=self._parser,
+            media=self._media,
+            entity_cache=self._entities,
+            message_cache=self._messages,
         )
         self._forum_ops = ForumOps(client=self.client)
         self._write_ops = WriteOps(
@@ -70,17 +112,33 @@ class TelethonAdapter(ChatRepository):
             write_queue=self._write_queue,
             dispatch_fn=None,
             get_topic_name_fn=self._forum_ops.get_topic_name,
+            entity_cache=self._entities,
+            intent_store=intent_store,
         )
+        self._intents_restored = False
         self._event_handlers = EventHandlers(
             client=self.client,
             parser=self._parser,
             media=self._media,
             get_topic_name_fn=self._forum_ops.get_topic_name,
+            ingest_queue=self._ingest_queue,
+            coalescer=self._coalescer,
+            entity_cache=self._entities,
+            message_cache=self._messages,
         )
         self._write_ops.set_dispatch_fn(self._event_handlers._dispatch)
 
         self._media.cleanup_startup_cache()
 
+    def ingest_queue_size(self) -> int:
+        return self._ingest_queue.queue_size()
+
+    def message_cache_stats(self) -> dict[str, int]:
+        return self._messages.stats()
+
+    def coalescing_stats(self) -> dict[str, int]:
+        return self._coalescer.stats()
+
     def is_connected(self) -> bool:
         return (
             self._is_connected_flag
@@ -99,7 +157,8 @@ class TelethonAdapter(ChatRepository):
 
             if await self.client.is_user_authorized():
                 self._is_connected_flag = True
-                await self._write_queue.start()
+                self._notify_reconnect()
+                await self._start_queues()
                 await self._fetch_self_id()
                 self._register_handlers()
             else:
@@ -109,6 +168,14 @@ class TelethonAdapter(ChatRepository):
             logger.error("connect_failed", error=str(e))
             self._is_connected_flag = False
 
+    async def _start_queues(self):
+        await self._write_queue.start()
+        await self._ingest_queue.start()
+        # Writes persisted before a restart are replayed once per process
+        if not self._intents_restored:
+            self._intents_restored = True
+            await self._write_ops.restore_pending()
+
     async def _fetch_self_id(self):
         """Cache the authenticated user ID for reaction parsing."""
         try:
@@ -130,10 +197,19 @@ class TelethonAdapter(ChatRepository):
         if self._qr_task:
             self._qr_task.cancel()
             self._qr_task = None
+        # Flush coalesced updates into the ingest queue, drain it, and only
+        # then stop the writes its jobs may still enqueue
+        await self._coalescer.stop()
+        await self._ingest_queue.stop()
         await self._write_queue.stop()
         if self.client and self.client.is_connected():
             await self.client.disconnect()
         self._is_connected_flag = False
+        self._notify_reconnect()
+
+    async def discard_pending_writes(self) -> None:
+        """Drop persisted writes of this account (call after disconnect())."""
+        await self._write_ops.discard_pending()
 
     # --- Auth Methods ---
 
@@ -155,7 +231,7 @@ class TelethonAdapter(ChatRepository):
             logger.info("2fa_attempt")
             await self.client.sign_in(password=password)
             self._is_connected_flag = True
-            await self._write_queue.start()
+            await self._start_queues()
             await self._fetch_self_id()
             self._register_handlers()
             logger.info("2fa_success")
@@ -197,7 +273,7 @@ class TelethonAdapter(ChatRepository):
             await self._qr_login.wait()
             self._qr_status = "authorized"
             self._is_connected_flag = True
-            await self._write_queue.start()
+            await self._start_queues()
             await self._fetch_self_id()
             self._register_handlers()
             logger.info("qr_login_success")
@@ -260,6 +336,9 @@ class TelethonAdapter(ChatRepository):
     ) -> None:
         return await self._write_ops.mark_as_read(chat_id, topic_id, max_id)
 
+    async def mark_many_as_read(self, targets: List[Tuple[int, Optional[int]]]) -> None:
+        return await self._write_ops.mark_many_as_read(targets)
+
     async def send_reaction(self, chat_id: int, msg_id: int, emoji: str) -> bool:
         return await self._write_ops.send_reaction(chat_id, msg_id, emoji)
 
@@ -282,6 +361,18 @@ class TelethonAdapter(ChatRepository):
     ) -> None:
         self._event_handlers.add_event_listener(callback)
 
+    def add_reconnect_listener(self, callback: Callable[[], None]) -> None:
+        """Call callback whenever live updates may have been missed: on
+        connect, on disconnect and after an automatic reconnect."""
+        self._reconnect_listeners.append(callback)
+
+    def _notify_reconnect(self) -> None:
+        for listener in self._reconnect_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error("reconnect_listener_error", error=str(e))
+
     # --- Additional methods used by routes ---
 
     async def get_custom_emoji_media(self, doc_id: int) -> Optional[str]:
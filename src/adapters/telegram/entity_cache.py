@@ -0,0 +1,122 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from telethon import utils
+
+from src.adapters.telethon_mappers import (
+    map_telethon_dialog_to_chat_type,
+    map_telethon_entity_to_chat_type,
+)
+from src.domain.models import ChatType
+
+_DEFAULT_TTL = 3600.0
+_DEFAULT_MAX_ENTRIES = 5000
+
+
+@dataclass(frozen=True)
+class CachedEntity:
+    entity: Any
+    input_peer: Optional[Any]
+    display_name: str
+    chat_type: ChatType
+    expires_at: float
+
+
+class EntityCache:
+    """Adapter-wide cache of resolved Telegram peers.
+
+    Maps peer id -> entity, input peer, display name and chat type so event
+    handlers, read/write ops and media downloads stop re-resolving the same
+    chats (get_entity may miss Telethon's session cache and hit the network).
+    Entries expire after ttl seconds; beyond max_entries the least recently
+    used entry is evicted. Dialog listings fill the cache in bulk.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        ttl: float = _DEFAULT_TTL,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.client = client
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[int, CachedEntity] = OrderedDict()
+
+    def get(self, peer_id: int) -> Optional[CachedEntity]:
+        cached = self._entries.get(peer_id)
+        if cached is None:
+            return None
+        if cached.expires_at <= time.monotonic():
+            del self._entries[peer_id]
+            return None
+        self._entries.move_to_end(peer_id)
+        return cached
+
+    def put(
+        self,
+        peer_id: int,
+        entity: Any,
+        display_name: Optional[str] = None,
+        chat_type: Optional[ChatType] = None,
+    ) -> CachedEntity:
+        try:
+            input_peer = utils.get_input_peer(entity)
+        except TypeError:
+            input_peer = None
+
+        cached = CachedEntity(
+            entity=entity,
+            input_peer=input_peer,
+            display_name=(
+                display_name
+                if display_name is not None
+                else utils.get_display_name(entity)
+            ),
+            chat_type=chat_type or map_telethon_entity_to_chat_type(entity),
+            expires_at=time.monotonic() + self._ttl,
+        )
+        self._entries[peer_id] = cached
+        self._entries.move_to_end(peer_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return cached
+
+    def put_dialogs(self, dialogs: Iterable[Any]) -> None:
+        """Bulk-fill from get_dialogs / iter_dialogs results."""
+        for d in dialogs:
+            self.put_dialog(d)
+
+    def put_dialog(self, dialog: Any) -> None:
+        self.put(
+            dialog.id,
+            dialog.entity,
+            display_name=dialog.name,
+            chat_type=map_telethon_dialog_to_chat_type(dialog),
+        )
+
+    def invalidate(self, peer_id: int) -> None:
+        self._entries.pop(peer_id, None)
+
+    async def resolve(self, peer_id: int) -> CachedEntity:
+        """Cached entry for peer_id, resolving it via get_entity on a miss.
+
+        Errors from get_entity (e.g. ValueError for unknown peers) propagate.
+        """
+        cached = self.get(peer_id)
+        if cached is not None:
+            return cached
+        entity = await self.client.get_entity(peer_id)
+        return self.put(peer_id, entity)
+
+    async def get_entity(self, peer_id: int) -> Any:
+        return (await self.resolve(peer_id)).entity
+
+    async def get_display_name(self, peer_id: int, default: str) -> str:
+        """Display name of peer_id, or default if it cannot be resolved."""
+        try:
+            return (await self.resolve(peer_id)).display_name
+        except Exception:
+            return default
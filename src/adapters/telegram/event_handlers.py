@@ -1,20 +1,25 @@
 import traceback
 from collections.abc import Awaitable, Callable
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from telethon import types, utils
 from telethon.tl.types import (
     MessageActionChatDeletePhoto,
     MessageActionChatEditPhoto,
+    MessageActionChatEditTitle,
     PeerChannel,
     PeerChat,
     PeerUser,
     UpdateMessageReactions,
 )
 
+from src.adapters.telegram.entity_cache import EntityCache
+from src.adapters.telegram.message_cache import ParsedMessageCache
 from src.adapters.telethon_mappers import get_message_action_text
 from src.domain.models import Message, Reaction, SystemEvent
+from src.infrastructure.coalescer import EventCoalescer
+from src.infrastructure.ingest_queue import IngestQueue
 from src.infrastructure.logging import get_logger
 from src.infrastructure.html import sanitize_html
 
@@ -32,11 +37,23 @@ class EventHandlers:
         parser: "MessageParser",
         media: "MediaManager",
         get_topic_name_fn: Callable[[int, int], Awaitable[Optional[str]]],
+        ingest_queue: Optional[IngestQueue] = None,
+        coalescer: Optional[EventCoalescer] = None,
+        entity_cache: Optional[EntityCache] = None,
+        message_cache: Optional[ParsedMessageCache] = None,
     ) -> None:
         self.client = client
         self._parser = parser
         self._media = media
         self._get_topic_name_fn = get_topic_name_fn
+        self._ingest_queue = ingest_queue
+        self._coalescer = coalescer
+        self._entities = (
+            entity_cache if entity_cache is not None else EntityCache(client)
+        )
+        self._messages = (
+            message_cache if message_cache is not None else ParsedMessageCache()
+        )
         self.listeners: List[Callable[[SystemEvent], Awaitable[None]]] = []
 
     def add_event_listener(
@@ -55,6 +72,21 @@ class EventHandlers:
                     traceback=traceback.format_exc(),
                 )
 
+    async def _get_event_chat(self, event: Any) -> Tuple[Any, str]:
+        """Chat entity and display name of event, served from the entity cache."""
+        if event.chat_id:
+            cached = self._entities.get(event.chat_id)
+            if cached is not None:
+                return cached.entity, cached.display_name
+
+        try:
+            chat = await event.get_chat()
+        except Exception:
+            return None, "Unknown"
+        if chat is not None and event.chat_id:
+            return chat, self._entities.put(event.chat_id, chat).display_name
+        return chat, utils.get_display_name(chat)
+
     def _extract_forum_topic_id(self, chat: Any, message: Any) -> Optional[int]:
         if not getattr(chat, "forum", False):
             return None
@@ -64,24 +96,125 @@ class EventHandlers:
         """Register all Telethon event handlers on the given client."""
         from telethon import events
 
-        client.add_event_handler(self._handle_new_message, events.NewMessage())
-        client.add_event_handler(self._handle_edited_message, events.MessageEdited())
-        client.add_event_handler(self._handle_deleted_message, events.MessageDeleted())
-        client.add_event_handler(self._handle_chat_action, events.ChatAction())
-        client.add_event_handler(self._handle_other_updates)
+        client.add_event_handler(
+            self._enqueued(self._handle_new_message), events.NewMessage()
+        )
+        client.add_event_handler(
+            self._coalesced(self._handle_edited_message, self._edit_coalesce_key),
+            events.MessageEdited(),
+        )
+        client.add_event_handler(
+            self._deletion_enqueued(self._handle_deleted_message),
+            events.MessageDeleted(),
+        )
+        client.add_event_handler(
+            self._enqueued(self._handle_chat_action), events.ChatAction()
+        )
+        # Only reaction updates; typing/status updates never reach the queue
+        client.add_event_handler(
+            self._coalesced(self._handle_other_updates, self._reaction_coalesce_key),
+            events.Raw(types=[UpdateMessageReactions]),
+        )
+
+    def _enqueued(
+        self,
+        handler: Callable[[Any], Awaitable[None]],
+        key_fn: Optional[Callable[[Any], int]] = None,
+    ) -> Callable[[Any], Awaitable[None]]:
+        """Wrap handler so Telethon only hands the update to the ingest queue.
+
+        Parsing and bus dispatch (rules, AI, persistence, SSE) then run on the
+        ingest workers and cannot stall update processing for the account.
+        """
+        queue = self._ingest_queue
+        if queue is None:
+            return handler
+        ingest_key = key_fn or self._ingest_key
+
+        async def _submit(event: Any) -> None:
+            await queue.submit(ingest_key(event), lambda: handler(event))
+
+        return _submit
+
+    def _deletion_enqueued(
+        self, handler: Callable[[Any], Awaitable[None]]
+    ) -> Callable[[Any], Awaitable[None]]:
+        """Like _enqueued, for MessageDeleted.
+
+        Edits and reactions of the deleted messages still waiting in a
+        coalescing window are cancelled first: they would otherwise reach
+        the ingest queue after the deletion and resurrect the message.
+        The deletion is queued on its chat's worker like every other update.
+        """
+        enqueue = self._enqueued(handler, key_fn=self._deleted_chat_id)
+        coalescer = self._coalescer
+        if coalescer is None:
+            return enqueue
+
+        async def _submit(event: Any) -> None:
+            chat_id = self._deleted_chat_id(event)
+            deleted = set(event.deleted_ids or [])
+            if chat_id and deleted:
+                coalescer.cancel(lambda key: key[0] == chat_id and key[1] in deleted)
+            await enqueue(event)
+
+        return _submit
+
+    def _coalesced(
+        self,
+        handler: Callable[[Any], Awaitable[None]],
+        key_fn: Callable[[Any], Optional[Tuple[int, int, str]]],
+    ) -> Callable[[Any], Awaitable[None]]:
+        """Like _enqueued, but bursts for one (chat_id, msg_id, type) collapse.
+
+        Only the latest update of a burst is parsed, persisted and broadcast.
+        """
+        enqueue = self._enqueued(handler)
+        coalescer = self._coalescer
+        if coalescer is None:
+            return enqueue
+
+        async def _submit(event: Any) -> None:
+            key = key_fn(event)
+            if key is None:
+                await enqueue(event)
+                return
+            await coalescer.submit(key, lambda: enqueue(event))
+
+        return _submit
+
+    @staticmethod
+    def _edit_coalesce_key(event: Any) -> Optional[Tuple[int, int, str]]:
+        if not event.chat_id:
+            return None
+        return (event.chat_id, event.message.id, "edited")
+
+    @classmethod
+    def _reaction_coalesce_key(cls, event: Any) -> Optional[Tuple[int, int, str]]:
+        if not isinstance(event, UpdateMessageReactions):
+            return None
+        chat_id = cls._ingest_key(event)
+        if not chat_id:
+            return None
+        return (chat_id, event.msg_id, "reaction_update")
+
+    @staticmethod
+    def _ingest_key(event: Any) -> int:
+        """Chat the update belongs to, so one chat always lands on one worker."""
+        chat_id = getattr(event, "chat_id", None)
+        if chat_id:
+            return chat_id
+        peer = getattr(event, "peer", None)
+        if isinstance(peer, (PeerUser, PeerChat, PeerChannel)):
+            return utils.get_peer_id(peer)
+        return 0
 
     async def _handle_new_message(self, event: Any) -> None:
         try:
             if event.chat_id:
                 self._parser._cache_message_chat(event.message.id, event.chat_id)
 
-            chat = None
-            chat_name = "Unknown"
-            try:
-                chat = await event.get_chat()
-                chat_name = utils.get_display_name(chat)
-            except Exception:
-                pass
+            chat, chat_name = await self._get_event_chat(event)
 
             domain_msg = await self._parser._parse_message(
                 event.message, chat_id=event.chat_id
@@ -115,14 +248,9 @@ class EventHandlers:
         try:
             if event.chat_id:
                 self._parser._cache_message_chat(event.message.id, event.chat_id)
+                self._messages.invalidate(event.chat_id, event.message.id)
 
-            chat = None
-            chat_name = "Unknown"
-            try:
-                chat = await event.get_chat()
-                chat_name = utils.get_display_name(chat)
-            except Exception:
-                pass
+            chat, chat_name = await self._get_event_chat(event)
 
             domain_msg = await self._parser._parse_message(
                 event.message, chat_id=event.chat_id
@@ -152,28 +280,39 @@ class EventHandlers:
                 traceback=traceback.format_exc(),
             )
 
+    def _deleted_chat_id(self, event: Any) -> int:
+        """Chat of a MessageDeleted update (0 if unknown).
+
+        Deletions outside channels carry no chat; it is looked up from the
+        message ids seen earlier.
+        """
+        chat_id = getattr(event, "chat_id", None)
+        if not chat_id and event.deleted_ids:
+            for did in event.deleted_ids:
+                if did in self._parser._msg_id_to_chat_id:
+                    chat_id = self._parser._msg_id_to_chat_id[did]
+                    break
+
+        if not chat_id and hasattr(event, "original_update"):
+            if hasattr(event.original_update, "channel_id"):
+                chat_id = utils.get_peer_id(
+                    types.PeerChannel(event.original_update.channel_id)
+                )
+        return chat_id or 0
+
     async def _handle_deleted_message(self, event: Any) -> None:
         try:
-            chat_id = getattr(event, "chat_id", None)
-            if not chat_id and event.deleted_ids:
-                for did in event.deleted_ids:
-                    if did in self._parser._msg_id_to_chat_id:
-                        chat_id = self._parser._msg_id_to_chat_id[did]
-                        break
-
-            if not chat_id and hasattr(event, "original_update"):
-                if hasattr(event.original_update, "channel_id"):
-                    chat_id = utils.get_peer_id(
-                        types.PeerChannel(event.original_update.channel_id)
-                    )
+            chat_id = self._deleted_chat_id(event)
+
+            if chat_id:
+                for did in event.deleted_ids or []:
+                    self._messages.invalidate(chat_id, did)
 
             chat_name = "Unknown"
             if chat_id:
-                try:
-                    entity = await self.client.get_entity(chat_id)
-                    chat_name = utils.get_display_name(entity)
-                except Exception:
-                    chat_name = f"Chat {chat_id}"
+                chat_name = await self._entities.get_display_name(
+                    chat_id, f"Chat {chat_id}"
+                )
 
             if chat_id and event.deleted_ids:
                 sys_event = SystemEvent(
@@ -190,6 +329,7 @@ class EventHandlers:
                         sender_name="",
                         is_outgoing=False,
                     ),
+                    deleted_ids=list(event.deleted_ids),
                 )
                 await self._dispatch(sys_event)
 
@@ -208,14 +348,18 @@ class EventHandlers:
             ):
                 if event.chat_id:
                     self._media.clear_chat_avatar(event.chat_id)
+            if isinstance(
+                action,
+                (
+                    MessageActionChatEditTitle,
+                    MessageActionChatEditPhoto,
+                    MessageActionChatDeletePhoto,
+                ),
+            ):
+                if event.chat_id:
+                    self._entities.invalidate(event.chat_id)
 
-            chat = None
-            chat_name = "Unknown"
-            try:
-                chat = await event.get_chat()
-                chat_name = utils.get_display_name(chat)
-            except Exception:
-                pass
+            chat, chat_name = await self._get_event_chat(event)
 
             msg_model = None
             topic_id = None
@@ -272,13 +416,8 @@ class EventHandlers:
         if not chat_id:
             return
 
-        chat_name = "Unknown"
         link = f"/chat/{chat_id}"
-        try:
-            chat_entity = await self.client.get_entity(chat_id)
-            chat_name = utils.get_display_name(chat_entity)
-        except Exception:
-            pass
+        chat_name = await self._entities.get_display_name(chat_id, "Unknown")
 
         reactions_list: List[Reaction] = self._parser._extract_reactions(
             event.reactions
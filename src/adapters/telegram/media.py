@@ -10,15 +10,24 @@ from telethon.tl.types import (
     MessageMediaDocument,
 )
 
+from src.adapters.telegram.entity_cache import EntityCache
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
 
 class MediaManager:
-    def __init__(self, client: Any, images_dir: str) -> None:
+    def __init__(
+        self,
+        client: Any,
+        images_dir: str,
+        entity_cache: Optional[EntityCache] = None,
+    ) -> None:
         self.client = client
         self.images_dir = images_dir
+        self._entities = (
+            entity_cache if entity_cache is not None else EntityCache(client)
+        )
 
     def _get_avatar_path(self, chat_id: int) -> str:
         return os.path.join(self.images_dir, f"{chat_id}.jpg")
@@ -124,7 +133,7 @@ class MediaManager:
 
         try:
             try:
-                entity = await self.client.get_entity(chat_id)
+                entity = await self._entities.get_entity(chat_id)
             except ValueError:
                 logger.debug("avatar_entity_not_found", chat_id=chat_id)
                 return None
@@ -143,7 +152,7 @@ class MediaManager:
         self, chat_id: int, message_id: int, size_type: str = "preview"
     ) -> Optional[str]:
         try:
-            entity = await self.client.get_entity(chat_id)
+            entity = await self._entities.get_entity(chat_id)
             messages = await self.client.get_messages(entity, ids=[message_id])
             if not messages:
                 return None
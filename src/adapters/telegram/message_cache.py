@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime
+from typing import Optional, Tuple
+
+from src.domain.models import Message
+
+_DEFAULT_MAX_ENTRIES = 2000
+
+MessageKey = Tuple[int, int]
+
+
+class ParsedMessageCache:
+    """Bounded LRU of parsed domain Messages keyed by (chat_id, msg_id, edit_date).
+
+    A raw Telegram message whose edit_date differs from the cached one is a
+    miss, so edited content is always re-parsed. MessageEdited and
+    MessageDeleted events drop entries explicitly. Callers get a shallow copy
+    so the cached object is never mutated in place.
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[MessageKey, Tuple[Optional[datetime], Message]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, chat_id: int, msg_id: int, edit_date: Optional[datetime]
+    ) -> Optional[Message]:
+        key = (chat_id, msg_id)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != edit_date:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return replace(entry[1])
+
+    def put(
+        self, chat_id: int, edit_date: Optional[datetime], message: Message
+    ) -> None:
+        key = (chat_id, message.id)
+        self._entries[key] = (edit_date, replace(message))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, chat_id: int, msg_id: int) -> None:
+        self._entries.pop((chat_id, msg_id), None)
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -1,10 +1,11 @@
+import asyncio
 from datetime import datetime
 from html import escape as html_escape
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 from telethon import utils
 from telethon.extensions import html
-from telethon.tl import types
+from telethon.tl import functions, types
 from telethon.tl.types import (
     DocumentAttributeAudio,
     DocumentAttributeSticker,
@@ -18,6 +19,7 @@ from telethon.tl.types import (
     ReactionEmoji,
 )
 
+from src.adapters.telegram.entity_cache import EntityCache
 from src.adapters.telethon_mappers import get_message_action_text
 from src.domain.models import Message, Reaction
 from src.infrastructure.html import sanitize_html
@@ -27,9 +29,17 @@ if TYPE_CHECKING:
 
 
 class MessageParser:
-    def __init__(self, client: Any, media: "MediaManager") -> None:
+    def __init__(
+        self,
+        client: Any,
+        media: "MediaManager",
+        entity_cache: Optional[EntityCache] = None,
+    ) -> None:
         self.client = client
         self._media = media
+        self._entities = (
+            entity_cache if entity_cache is not None else EntityCache(client)
+        )
         self._msg_id_to_chat_id: Dict[int, int] = {}
         self.self_id: Optional[int] = None
 
@@ -87,6 +97,16 @@ class MessageParser:
                 return sanitize_html(html_escape(raw_text))
         return ""
 
+    def render_text(self, msg: Any) -> str:
+        """Sanitized HTML body of msg: the CPU-only part of parsing.
+
+        Kept separate from _parse_message so callers can render a whole page
+        in one batch and pass the result in via text=.
+        """
+        if isinstance(msg, types.MessageService):
+            return sanitize_html(get_message_action_text(msg) or "Service message")
+        return self._extract_text(msg)
+
     def _extract_reactions(self, reactions: Any) -> List[Reaction]:
         """Extract Reaction list from a Telethon MessageReactions object."""
         results = []
@@ -142,25 +162,103 @@ class MessageParser:
                 )
         return results
 
+    async def resolve_senders(self, messages: List[Any]) -> Dict[int, Any]:
+        """Resolve every sender missing from messages in one request per kind.
+
+        Returns entities keyed by peer id, ready to pass to _parse_message as
+        senders_map so a history page costs O(1) lookups instead of one
+        get_entity call per unknown sender.
+        """
+        senders: Dict[int, Any] = {}
+        user_peers: Dict[int, Any] = {}
+        channel_peers: Dict[int, Any] = {}
+        for msg in messages:
+            from_id = getattr(msg, "from_id", None) if msg else None
+            if getattr(msg, "sender", None) or not isinstance(
+                from_id, (types.PeerUser, types.PeerChannel)
+            ):
+                continue
+            peer_id = utils.get_peer_id(from_id)
+            cached = self._entities.get(peer_id)
+            if cached is not None:
+                senders[peer_id] = cached.entity
+            elif isinstance(from_id, types.PeerUser):
+                user_peers[peer_id] = msg
+            else:
+                channel_peers[peer_id] = msg
+
+        user_inputs, channel_inputs = await asyncio.gather(
+            self._input_peers(user_peers), self._input_peers(channel_peers)
+        )
+
+        if user_inputs:
+            input_users = [utils.get_input_user(p) for p in user_inputs]
+            try:
+                users = await self.client(
+                    functions.users.GetUsersRequest(id=input_users)
+                )
+            except Exception:
+                users = []
+            for user in users:
+                if isinstance(user, types.User):
+                    senders[user.id] = user
+                    self._entities.put(user.id, user)
+
+        if channel_inputs:
+            input_channels = [utils.get_input_channel(p) for p in channel_inputs]
+            try:
+                res = await self.client(
+                    functions.channels.GetChannelsRequest(id=input_channels)
+                )
+                chats = res.chats
+            except Exception:
+                chats = []
+            for chat in chats:
+                peer_id = utils.get_peer_id(chat)
+                senders[peer_id] = chat
+                self._entities.put(peer_id, chat)
+
+        return senders
+
+    async def _input_peers(self, peers: Dict[int, Any]) -> List[Any]:
+        """Input peers for {peer_id: message}, without a request where possible.
+
+        Telethon builds message.input_sender from the users/chats delivered
+        with the page (or the session cache), so the access hash is usually
+        at hand. The rest are looked up concurrently; unknown peers are
+        skipped.
+        """
+        result = []
+        missing = []
+        for msg in peers.values():
+            input_peer = getattr(msg, "input_sender", None)
+            if input_peer is not None:
+                result.append(input_peer)
+            else:
+                missing.append(msg.from_id)
+        looked_up = await asyncio.gather(
+            *(self.client.get_input_entity(p) for p in missing),
+            return_exceptions=True,
+        )
+        result.extend(p for p in looked_up if not isinstance(p, BaseException))
+        return result
+
     async def _parse_message(
         self,
         msg: Any,
         replies_map: Dict[int, Any] | None = None,
         chat_id: Optional[int] = None,
+        senders_map: Dict[int, Any] | None = None,
+        text: Optional[str] = None,
     ) -> Message:
         if chat_id:
             self._cache_message_chat(msg.id, chat_id)
 
         replies_map = replies_map or {}
 
-        is_service = False
-        text = ""
-
-        if isinstance(msg, types.MessageService):
-            is_service = True
-            text = sanitize_html(get_message_action_text(msg) or "Service message")
-        else:
-            text = self._extract_text(msg)
+        is_service = isinstance(msg, types.MessageService)
+        if text is None:
+            text = self.render_text(msg)
 
         media = getattr(msg, "media", None)
         has_media = bool(media)
@@ -210,6 +308,8 @@ class MessageParser:
                 sender_id = msg.from_id.channel_id
 
         sender = getattr(msg, "sender", None)
+        if sender_id and not sender and senders_map:
+            sender = senders_map.get(utils.get_peer_id(msg.from_id))
         if sender_id and not sender:
             try:
                 sender = await self.client.get_entity(sender_id)
@@ -2,23 +2,32 @@ import asyncio
 import traceback
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
-from telethon import errors, functions, utils
+from telethon import errors, functions
 
+from src.adapters.telegram.entity_cache import EntityCache
+from src.adapters.telegram.write_intents import ReadIntent, WriteIntentStore
 from src.domain.models import SystemEvent
 from src.infrastructure.logging import get_logger
+from src.infrastructure.telegram_queue import WriteJob, current_write_priority
 
 logger = get_logger(__name__)
 
 ReadKey = tuple[int, Optional[int]]
 DispatchFn = Callable[[SystemEvent], Awaitable[None]]
 
+# Failures that may succeed on a later attempt (connection loss, Telegram
+# server errors); a read failing with one of these keeps its stored intent
+_RETRYABLE_ERRORS = (OSError, asyncio.TimeoutError, errors.ServerError)
+
 
 @dataclass(frozen=True)
 class PendingRead:
     max_id: Optional[int]
     version: int
+    # Most urgent write priority among the merged requests
+    priority: int
 
 
 class ReadOps:
@@ -29,8 +38,14 @@ class ReadOps:
         dispatch_fn: Optional[DispatchFn],
         get_topic_name_fn: Callable[[int, int], Awaitable[Optional[str]]],
         coalesce_delay: float = 0,
+        entity_cache: Optional[EntityCache] = None,
+        intent_store: Optional[WriteIntentStore] = None,
     ) -> None:
         self.client = client
+        self._intents = intent_store
+        self._entities = (
+            entity_cache if entity_cache is not None else EntityCache(client)
+        )
         self._write_queue = write_queue
         self._dispatch_fn = dispatch_fn
         self._get_topic_name_fn = get_topic_name_fn
@@ -49,7 +64,9 @@ class ReadOps:
         max_id: Optional[int] = None,
     ) -> None:
         key = (chat_id, topic_id)
-        self._pending[key] = self._merge_pending(self._pending.get(key), max_id)
+        pending = self._merge_pending(self._pending.get(key), max_id)
+        self._pending[key] = pending
+        await self._persist([key])
 
         if key in self._active_keys:
             return
@@ -60,14 +77,36 @@ class ReadOps:
         else:
             await self._enqueue_key(key)
 
+    async def mark_many_as_read(self, keys: Sequence[ReadKey]) -> None:
+        """Batch form of mark_as_read for whole chats/topics (no max_id).
+
+        Intents are persisted in one transaction and the reads are handed to
+        the write queue as one batch; per-key coalescing is unchanged.
+        """
+        fresh: list[ReadKey] = []
+        for key in keys:
+            self._pending[key] = self._merge_pending(self._pending.get(key), None)
+            if key not in self._active_keys:
+                self._active_keys.add(key)
+                fresh.append(key)
+        await self._persist(keys)
+
+        if self._coalesce_delay > 0:
+            for key in fresh:
+                self._schedule_enqueue(key)
+        else:
+            await self._write_queue.enqueue_many(self._write_job(k) for k in fresh)
+
     def _merge_pending(
         self, existing: Optional[PendingRead], max_id: Optional[int]
     ) -> PendingRead:
+        priority = current_write_priority()
         if existing is None:
-            return PendingRead(max_id=max_id, version=1)
+            return PendingRead(max_id=max_id, version=1, priority=priority)
         return PendingRead(
             max_id=self._merge_max_id(existing.max_id, max_id),
             version=existing.version + 1,
+            priority=min(existing.priority, priority),
         )
 
     def _merge_max_id(
@@ -97,10 +136,22 @@ class ReadOps:
             )
 
     async def _enqueue_key(self, key: ReadKey) -> None:
+        job = self._write_job(key)
+        await self._write_queue.enqueue(
+            job.coro_fn, method=job.method, peer=job.peer, priority=job.priority
+        )
+
+    def _write_job(self, key: ReadKey) -> WriteJob:
         async def _do() -> None:
             await self._drain(key)
 
-        await self._write_queue.enqueue(_do)
+        pending = self._pending.get(key)
+        return WriteJob(
+            _do,
+            method="read_history",
+            peer=key[0],
+            priority=pending.priority if pending is not None else None,
+        )
 
     async def _drain(self, key: ReadKey) -> None:
         pending = self._pending.get(key)
@@ -108,21 +159,49 @@ class ReadOps:
             self._active_keys.discard(key)
             return
 
-        await self._send_mark_as_read(key[0], key[1], pending.max_id)
+        done = await self._send_mark_as_read(key[0], key[1], pending.max_id)
 
         if self._pending.get(key) == pending:
             self._pending.pop(key, None)
             self._active_keys.discard(key)
+            # An undelivered read stays stored and is replayed on the next start
+            if done:
+                await self._forget(key)
             return
 
         self._schedule_enqueue(key)
 
+    async def _persist(self, keys: Sequence[ReadKey]) -> None:
+        if self._intents is None:
+            return
+        intents = [
+            ReadIntent(k[0], k[1], self._pending[k].max_id, self._pending[k].priority)
+            for k in keys
+        ]
+        try:
+            await self._intents.save_reads(intents)
+        except Exception as e:
+            logger.warning("read_intent_save_failed", count=len(keys), error=repr(e))
+
+    async def _forget(self, key: ReadKey) -> None:
+        if self._intents is None:
+            return
+        try:
+            await self._intents.delete_read(key[0], key[1])
+        except Exception as e:
+            logger.warning("read_intent_delete_failed", chat_id=key[0], error=repr(e))
+
     async def _send_mark_as_read(
         self,
         chat_id: int,
         topic_id: Optional[int],
         max_id: Optional[int],
-    ) -> None:
+    ) -> bool:
+        """Send the read; False when it failed with a retryable error.
+
+        A read Telegram rejects outright (e.g. the chat is gone) counts as
+        done: retrying it could never succeed.
+        """
         try:
             input_peer = await self.client.get_input_entity(chat_id)
             if topic_id is None:
@@ -132,10 +211,16 @@ class ReadOps:
                 topic_name = await self._read_topic(
                     input_peer, chat_id, topic_id, max_id
                 )
-
-            await self._dispatch_read_event(chat_id, topic_id, topic_name, input_peer)
         except errors.FloodWaitError:
             raise
+        except _RETRYABLE_ERRORS as e:
+            logger.warning(
+                "mark_as_read_deferred",
+                chat_id=chat_id,
+                topic_id=topic_id,
+                error=repr(e),
+            )
+            return False
         except Exception as e:
             logger.error(
                 "mark_as_read_failed",
@@ -144,6 +229,13 @@ class ReadOps:
                 error=repr(e),
                 traceback=traceback.format_exc(),
             )
+            return True
+
+        try:
+            await self._dispatch_read_event(chat_id, topic_id, topic_name, input_peer)
+        except Exception as e:
+            logger.error("mark_as_read_dispatch_failed", chat_id=chat_id, error=repr(e))
+        return True
 
     async def _read_chat(self, input_peer: Any, max_id: Optional[int]) -> None:
         if max_id is None:
@@ -195,12 +287,7 @@ class ReadOps:
         if not self._dispatch_fn:
             return
 
-        chat_name = f"Chat {chat_id}"
-        try:
-            entity = await self.client.get_entity(input_peer)
-            chat_name = utils.get_display_name(entity)
-        except Exception:
-            pass
+        chat_name = await self._entities.get_display_name(chat_id, f"Chat {chat_id}")
 
         await self._dispatch_fn(
             SystemEvent(
@@ -0,0 +1,207 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from src.infrastructure.db import BaseSqliteRepository
+
+# topic_key for a whole-chat read (forum topic ids are positive)
+_CHAT_TOPIC_KEY = 0
+
+
+@dataclass(frozen=True)
+class ReadIntent:
+    chat_id: int
+    topic_id: Optional[int]
+    max_id: Optional[int]
+    priority: int
+
+
+@dataclass(frozen=True)
+class ReactionIntent:
+    chat_id: int
+    msg_id: int
+    emoji: str
+    priority: int
+    # Desired end state of the emoji; None while the toggle is unresolved
+    present: Optional[bool] = None
+    # Row id, set once the intent is stored
+    intent_id: Optional[int] = None
+
+
+class WriteIntentStore(ABC):
+    """Durable record of Telegram writes that were queued but not yet sent.
+
+    Writes are stored as data (not closures) so the adapter can replay them
+    after a restart. Read intents merge per (chat_id, topic_id) exactly like
+    ReadOps.PendingRead: a None max_id (read everything) wins, otherwise the
+    highest max_id, and the most urgent priority.
+
+    Reaction intents are stored one per queued write, so finishing one never
+    deletes another queued for the same message. A toggle is stored
+    unresolved and resolved to the emoji's desired end state right before
+    it is sent; replaying a resolved intent is therefore idempotent.
+    """
+
+    @abstractmethod
+    async def save_reads(self, intents: List[ReadIntent]) -> None:
+        """Store or merge several read intents in one transaction."""
+        pass
+
+    @abstractmethod
+    async def delete_read(self, chat_id: int, topic_id: Optional[int]) -> None:
+        pass
+
+    @abstractmethod
+    async def save_reaction(self, intent: ReactionIntent) -> int:
+        """Store a new reaction intent; returns its intent_id."""
+        pass
+
+    @abstractmethod
+    async def resolve_reaction(self, intent_id: int, present: bool) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_reaction(self, intent_id: int) -> None:
+        pass
+
+    @abstractmethod
+    async def load(self) -> tuple[List[ReadIntent], List[ReactionIntent]]:
+        """All stored intents, oldest first."""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop every stored intent (e.g. when the account is reset)."""
+        pass
+
+
+class SqliteWriteIntentStore(BaseSqliteRepository, WriteIntentStore):
+    def __init__(self, db_path: str = "data.db"):
+        super().__init__(db_path)
+
+    async def save_reads(self, intents: List[ReadIntent]) -> None:
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                i.chat_id,
+                i.topic_id or _CHAT_TOPIC_KEY,
+                i.max_id,
+                i.priority,
+                now,
+            )
+            for i in intents
+        ]
+
+        def _save():
+            with self._connect() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO pending_reads
+                        (chat_id, topic_key, max_id, priority, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (chat_id, topic_key) DO UPDATE SET
+                        max_id = CASE
+                            WHEN pending_reads.max_id IS NULL
+                                OR excluded.max_id IS NULL THEN NULL
+                            ELSE MAX(pending_reads.max_id, excluded.max_id)
+                        END,
+                        priority = MIN(pending_reads.priority, excluded.priority)
+                    """,
+                    rows,
+                )
+
+        if rows:
+            await self._execute_write(_save)
+
+    async def delete_read(self, chat_id: int, topic_id: Optional[int]) -> None:
+        def _delete():
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM pending_reads WHERE chat_id = ? AND topic_key = ?",
+                    (chat_id, topic_id or _CHAT_TOPIC_KEY),
+                )
+
+        await self._execute_write(_delete)
+
+    async def save_reaction(self, intent: ReactionIntent) -> int:
+        def _save():
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO pending_reaction_ops
+                        (chat_id, msg_id, emoji, present, priority, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        intent.chat_id,
+                        intent.msg_id,
+                        intent.emoji,
+                        intent.present,
+                        intent.priority,
+                        datetime.now().isoformat(),
+                    ),
+                )
+                return cursor.lastrowid
+
+        return await self._execute_write(_save)
+
+    async def resolve_reaction(self, intent_id: int, present: bool) -> None:
+        def _resolve():
+            with self._connect() as conn:
+                conn.execute(
+                    "UPDATE pending_reaction_ops SET present = ? WHERE id = ?",
+                    (present, intent_id),
+                )
+
+        await self._execute_write(_resolve)
+
+    async def delete_reaction(self, intent_id: int) -> None:
+        def _delete():
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM pending_reaction_ops WHERE id = ?", (intent_id,)
+                )
+
+        await self._execute_write(_delete)
+
+    async def load(self) -> tuple[List[ReadIntent], List[ReactionIntent]]:
+        def _load():
+            with self._connect() as conn:
+                reads = [
+                    ReadIntent(
+                        chat_id=row["chat_id"],
+                        topic_id=row["topic_key"] or None,
+                        max_id=row["max_id"],
+                        priority=row["priority"],
+                    )
+                    for row in conn.execute(
+                        "SELECT * FROM pending_reads ORDER BY created_at"
+                    )
+                ]
+                reactions = [
+                    ReactionIntent(
+                        chat_id=row["chat_id"],
+                        msg_id=row["msg_id"],
+                        emoji=row["emoji"],
+                        priority=row["priority"],
+                        present=(
+                            None if row["present"] is None else bool(row["present"])
+                        ),
+                        intent_id=row["id"],
+                    )
+                    for row in conn.execute(
+                        "SELECT * FROM pending_reaction_ops ORDER BY id"
+                    )
+                ]
+                return reads, reactions
+
+        return await self._execute(_load)
+
+    async def clear(self) -> None:
+        def _clear():
+            with self._connect() as conn:
+                conn.execute("DELETE FROM pending_reads")
+                conn.execute("DELETE FROM pending_reaction_ops")
+
+        await self._execute_write(_clear)
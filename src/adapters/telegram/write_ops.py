@@ -1,12 +1,16 @@
 import traceback
 from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING, Any, Optional
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from telethon import errors, functions, types
 
+from src.adapters.telegram.entity_cache import EntityCache
 from src.adapters.telegram.read_ops import ReadOps
+from src.adapters.telegram.write_intents import ReactionIntent, WriteIntentStore
 from src.domain.models import SystemEvent
 from src.infrastructure.logging import get_logger
+from src.infrastructure.telegram_queue import current_write_priority, write_priority
 
 if TYPE_CHECKING:
     from src.adapters.telegram.message_parser import MessageParser
@@ -22,16 +26,24 @@ class WriteOps:
         write_queue: Any,
         dispatch_fn: Optional[Callable[[SystemEvent], Awaitable[None]]],
         get_topic_name_fn: Callable[[int, int], Awaitable[Optional[str]]],
+        entity_cache: Optional[EntityCache] = None,
+        intent_store: Optional[WriteIntentStore] = None,
     ) -> None:
         self.client = client
         self._parser = parser
+        self._intents = intent_store
         self._write_queue = write_queue
         self._dispatch_fn = dispatch_fn  # patched after EventHandlers is built
+        self._entities = (
+            entity_cache if entity_cache is not None else EntityCache(client)
+        )
         self._read_ops = ReadOps(
             client=client,
             write_queue=write_queue,
             dispatch_fn=dispatch_fn,
             get_topic_name_fn=get_topic_name_fn,
+            entity_cache=self._entities,
+            intent_store=intent_store,
         )
 
     def set_dispatch_fn(
@@ -48,120 +60,215 @@ class WriteOps:
     ) -> None:
         await self._read_ops.mark_as_read(chat_id, topic_id, max_id)
 
+    async def mark_many_as_read(self, targets: List[Tuple[int, Optional[int]]]) -> None:
+        await self._read_ops.mark_many_as_read(targets)
+
+    async def restore_pending(self) -> None:
+        """Re-enqueue writes persisted by a previous run that never completed."""
+        if self._intents is None:
+            return
+        try:
+            reads, reactions = await self._intents.load()
+        except Exception as e:
+            logger.error("write_intents_load_failed", error=repr(e))
+            return
+        if not reads and not reactions:
+            return
+
+        logger.info(
+            "write_intents_restored", reads=len(reads), reactions=len(reactions)
+        )
+        for read in reads:
+            with write_priority(read.priority):
+                await self._read_ops.mark_as_read(
+                    read.chat_id, read.topic_id, read.max_id
+                )
+        for reaction in reactions:
+            with write_priority(reaction.priority):
+                await self._enqueue_reaction(reaction)
+
+    async def discard_pending(self) -> None:
+        """Forget persisted writes so they are not replayed for another account."""
+        if self._intents is None:
+            return
+        try:
+            await self._intents.clear()
+        except Exception as e:
+            logger.error("write_intents_clear_failed", error=repr(e))
+
     async def send_reaction(self, chat_id: int, msg_id: int, emoji: str) -> bool:
-        async def _do() -> None:
-            try:
-                entity = await self.client.get_entity(chat_id)
+        """Toggle emoji on the message (remove it if already chosen)."""
+        intent = ReactionIntent(chat_id, msg_id, emoji, current_write_priority())
+        await self._enqueue_reaction(await self._persist_reaction(intent))
+        return True
+
+    async def _enqueue_reaction(self, intent: ReactionIntent) -> None:
+        async def _run() -> None:
+            # FloodWait propagates past this point, keeping the intent stored
+            await self._apply_reaction(intent)
+            await self._forget_reaction(intent)
+
+        await self._write_queue.enqueue(
+            _run, method="send_reaction", peer=intent.chat_id
+        )
 
-                target_reaction = None
-                if emoji.isdigit():
-                    target_reaction = types.ReactionCustomEmoji(document_id=int(emoji))
+    async def _apply_reaction(self, intent: ReactionIntent) -> None:
+        chat_id, msg_id, emoji = intent.chat_id, intent.msg_id, intent.emoji
+        try:
+            entity = await self._entities.get_entity(chat_id)
+
+            target_reaction = None
+            if emoji.isdigit():
+                target_reaction = types.ReactionCustomEmoji(document_id=int(emoji))
+            else:
+                target_reaction = types.ReactionEmoji(emoticon=emoji)
+
+            msgs = await self.client.get_messages(entity, ids=[msg_id])
+            if not msgs:
+                return
+            msg = msgs[0]
+
+            current_my_reactions = []
+            if hasattr(msg, "reactions") and msg.reactions:
+                for rc in msg.reactions.results:
+                    if getattr(rc, "chosen", False):
+                        current_my_reactions.append(rc.reaction)
+
+            new_reactions_list = []
+            found = False
+
+            for r in current_my_reactions:
+                is_same = False
+                if isinstance(r, types.ReactionEmoji) and isinstance(
+                    target_reaction, types.ReactionEmoji
+                ):
+                    if r.emoticon == target_reaction.emoticon:
+                        is_same = True
+                elif isinstance(r, types.ReactionCustomEmoji) and isinstance(
+                    target_reaction, types.ReactionCustomEmoji
+                ):
+                    if r.document_id == target_reaction.document_id:
+                        is_same = True
+
+                if is_same:
+                    found = True
                 else:
-                    target_reaction = types.ReactionEmoji(emoticon=emoji)
-
-                msgs = await self.client.get_messages(entity, ids=[msg_id])
-                if not msgs:
-                    return
-                msg = msgs[0]
-
-                current_my_reactions = []
-                if hasattr(msg, "reactions") and msg.reactions:
-                    for rc in msg.reactions.results:
-                        if getattr(rc, "chosen", False):
-                            current_my_reactions.append(rc.reaction)
-
-                new_reactions_list = []
-                found = False
-
-                for r in current_my_reactions:
-                    is_same = False
-                    if isinstance(r, types.ReactionEmoji) and isinstance(
-                        target_reaction, types.ReactionEmoji
-                    ):
-                        if r.emoticon == target_reaction.emoticon:
-                            is_same = True
-                    elif isinstance(r, types.ReactionCustomEmoji) and isinstance(
-                        target_reaction, types.ReactionCustomEmoji
-                    ):
-                        if r.document_id == target_reaction.document_id:
-                            is_same = True
-
-                    if is_same:
-                        found = True
-                    else:
-                        new_reactions_list.append(r)
-
-                if not found:
-                    new_reactions_list.append(target_reaction)
-
-                success = False
-                try:
-                    await self.client(
-                        functions.messages.SendReactionRequest(
-                            peer=entity,
-                            msg_id=msg_id,
-                            reaction=new_reactions_list,  # type: ignore
-                            add_to_recent=True,
-                        )
-                    )
-                    success = True
-                except errors.ReactionInvalidError:
-                    logger.info(
-                        "reaction_stack_failed_fallback_replace",
-                        chat_id=chat_id,
+                    new_reactions_list.append(r)
+
+            present = intent.present
+            if present is None:
+                # Resolve the toggle before sending, so a replay after a crash
+                # re-applies the same end state instead of toggling back
+                present = not found
+                await self._resolve_reaction(intent, present)
+            if present == found:
+                logger.info(
+                    "reaction_already_applied",
+                    chat_id=chat_id,
+                    msg_id=msg_id,
+                    present=present,
+                )
+                return
+
+            if present:
+                new_reactions_list.append(target_reaction)
+
+            success = False
+            try:
+                await self.client(
+                    functions.messages.SendReactionRequest(
+                        peer=entity,
                         msg_id=msg_id,
+                        reaction=new_reactions_list,  # type: ignore
+                        add_to_recent=True,
                     )
-                    fallback_list = []
-                    if not found:
-                        fallback_list = [target_reaction]
-
-                    await self.client(
-                        functions.messages.SendReactionRequest(
-                            peer=entity,
-                            msg_id=msg_id,
-                            reaction=fallback_list,  # type: ignore
-                            add_to_recent=True,
-                        )
+                )
+                success = True
+            except errors.ReactionInvalidError:
+                logger.info(
+                    "reaction_stack_failed_fallback_replace",
+                    chat_id=chat_id,
+                    msg_id=msg_id,
+                )
+                fallback_list = []
+                if present:
+                    fallback_list = [target_reaction]
+
+                await self.client(
+                    functions.messages.SendReactionRequest(
+                        peer=entity,
+                        msg_id=msg_id,
+                        reaction=fallback_list,  # type: ignore
+                        add_to_recent=True,
                     )
-                    success = True
-                except Exception as e:
-                    logger.error("send_reaction_exception", error=str(e))
-
-                if success:
-                    try:
-                        updated_msgs = await self.client.get_messages(
-                            entity, ids=[msg_id]
+                )
+                success = True
+            except Exception as e:
+                logger.error("send_reaction_exception", error=str(e))
+
+            if success:
+                try:
+                    updated_msgs = await self.client.get_messages(entity, ids=[msg_id])
+                    if updated_msgs:
+                        updated_msg = updated_msgs[0]
+                        parsed_msg = await self._parser._parse_message(
+                            updated_msg, chat_id=chat_id
                         )
-                        if updated_msgs:
-                            updated_msg = updated_msgs[0]
-                            parsed_msg = await self._parser._parse_message(
-                                updated_msg, chat_id=chat_id
-                            )
-                            event = SystemEvent(
-                                type="reaction_update",
-                                text="",
-                                chat_name="",
-                                chat_id=chat_id,
-                                message_model=parsed_msg,
-                            )
-                            if self._dispatch_fn:
-                                await self._dispatch_fn(event)
-                    except Exception as ex:
-                        logger.error(
-                            "post_reaction_fetch_failed",
-                            error=repr(ex),
-                            traceback=traceback.format_exc(),
+                        event = SystemEvent(
+                            type="reaction_update",
+                            text="",
+                            chat_name="",
+                            chat_id=chat_id,
+                            message_model=parsed_msg,
                         )
+                        if self._dispatch_fn:
+                            await self._dispatch_fn(event)
+                except Exception as ex:
+                    logger.error(
+                        "post_reaction_fetch_failed",
+                        error=repr(ex),
+                        traceback=traceback.format_exc(),
+                    )
 
-            except errors.FloodWaitError:
-                raise
-            except Exception as e:
-                logger.error(
-                    "send_reaction_failed",
-                    error=str(e),
-                    chat_id=chat_id,
-                    msg_id=msg_id,
-                )
+        except errors.FloodWaitError:
+            raise
+        except Exception as e:
+            logger.error(
+                "send_reaction_failed",
+                error=str(e),
+                chat_id=chat_id,
+                msg_id=msg_id,
+            )
 
-        await self._write_queue.enqueue(_do)
-        return True
+    async def _persist_reaction(self, intent: ReactionIntent) -> ReactionIntent:
+        """Store intent; the returned copy carries its intent_id."""
+        if self._intents is None:
+            return intent
+        try:
+            intent_id = await self._intents.save_reaction(intent)
+        except Exception as e:
+            logger.warning(
+                "reaction_intent_save_failed", chat_id=intent.chat_id, error=repr(e)
+            )
+            return intent
+        return replace(intent, intent_id=intent_id)
+
+    async def _resolve_reaction(self, intent: ReactionIntent, present: bool) -> None:
+        if self._intents is None or intent.intent_id is None:
+            return
+        try:
+            await self._intents.resolve_reaction(intent.intent_id, present)
+        except Exception as e:
+            logger.warning(
+                "reaction_intent_save_failed", chat_id=intent.chat_id, error=repr(e)
+            )
+
+    async def _forget_reaction(self, intent: ReactionIntent) -> None:
+        if self._intents is None or intent.intent_id is None:
+            return
+        try:
+            await self._intents.delete_reaction(intent.intent_id)
+        except Exception as e:
+            logger.warning(
+                "reaction_intent_delete_failed", chat_id=intent.chat_id, error=repr(e)
+            )
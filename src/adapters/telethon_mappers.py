@@ -18,7 +18,7 @@ from telethon.tl.types import (
     MessageActionGameScore,
     MessageMediaPoll,
 )
-from telethon import utils
+from telethon import types, utils
 from html import unescape as html_unescape
 from src.domain.models import ChatType
 from src.infrastructure.html import sanitize_html
@@ -35,6 +35,17 @@ def map_telethon_dialog_to_chat_type(d: Any) -> ChatType:
     return ChatType.GROUP
 
 
+def map_telethon_entity_to_chat_type(entity: Any) -> ChatType:
+    if isinstance(entity, types.User):
+        return ChatType.USER
+    elif isinstance(entity, types.Channel):
+        if getattr(entity, "forum", False):
+            return ChatType.FORUM
+        elif getattr(entity, "broadcast", False):
+            return ChatType.CHANNEL
+    return ChatType.GROUP
+
+
 def get_message_action_text(message: Any) -> Optional[str]:
     """Extracts a human-readable description from a Service Message action."""
     if not isinstance(message, MessageService):
@@ -1,9 +1,10 @@
 import json
 import time
 from datetime import datetime
-from typing import List, TypeVar, Generic, Dict, Any
+from typing import List, Optional, Tuple, TypeVar, Generic, Dict, Any
 from dataclasses import asdict, is_dataclass
 from redis.asyncio import Redis
+from src.ai.ports import VerdictCache
 from src.domain.ports import ActionRepository, EventRepository
 from src.domain.models import ActionLog, SystemEvent
 from src.infrastructure.logging import get_logger
@@ -50,6 +51,18 @@ class BaseValkeyLogRepository(Generic[T]):
         except Exception as e:
             logger.error(f"{self.key_prefix}_add_failed", error=str(e))
 
+    async def _add_items(self, items: List[Tuple[Dict[str, Any], float]]) -> None:
+        """Add several items with a single ZADD."""
+        try:
+            mapping = {
+                json.dumps(self._serialize(item_dict)): score
+                for item_dict, score in items
+            }
+            if mapping:
+                await self.redis.zadd(self.key_prefix, mapping)
+        except Exception as e:
+            logger.error(f"{self.key_prefix}_add_failed", error=str(e))
+
     async def cleanup_expired(self) -> None:
         """Removes items older than ttl_seconds."""
         try:
@@ -90,6 +103,18 @@ class ValkeyActionRepository(BaseValkeyLogRepository[ActionLog], ActionRepositor
         except Exception as e:
             logger.error("action_log_add_wrapper_failed", error=str(e))
 
+    async def add_logs(self, logs: List[ActionLog]) -> None:
+        if not logs:
+            return
+        try:
+            # Reserve a contiguous block of IDs, then one ZADD for all logs
+            last_id = await self.redis.incrby(self.sequence_key, len(logs))
+            for offset, log in enumerate(logs):
+                log.id = last_id - len(logs) + 1 + offset
+            await self._add_items([(asdict(log), log.date.timestamp()) for log in logs])
+        except Exception as e:
+            logger.error("action_log_add_wrapper_failed", error=str(e))
+
     async def get_logs(self, limit: int = 50) -> List[ActionLog]:
         dicts = await self._fetch_items(limit)
         results = []
@@ -124,3 +149,35 @@ class ValkeyEventRepository(BaseValkeyLogRepository[SystemEvent], EventRepositor
 
             results.append(SystemEvent(**d))
         return results
+
+
+class ValkeyVerdictCache(VerdictCache):
+    """AI verdicts as plain string keys ("1"/"0") expiring after ttl_seconds."""
+
+    def __init__(
+        self, redis_url: str, ttl_seconds: int, key_prefix: str = "ai_verdict"
+    ):
+        self.redis = Redis.from_url(redis_url, decode_responses=True)
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bool]]:
+        if not keys:
+            return []
+        values = await self.redis.mget([f"{self.key_prefix}:{k}" for k in keys])
+        return [None if v is None else v == "1" for v in values]
+
+    async def set_many(self, verdicts: Dict[str, bool]) -> None:
+        if not verdicts:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, verdict in verdicts.items():
+                pipe.set(
+                    f"{self.key_prefix}:{key}",
+                    "1" if verdict else "0",
+                    ex=self.ttl_seconds,
+                )
+            await pipe.execute()
+
+    async def close(self) -> None:
+        await self.redis.aclose()
@@ -0,0 +1,77 @@
+import asyncio
+from typing import List, Optional, Tuple
+
+from src.ai.ports import AIClassifier
+
+_DEFAULT_WINDOW = 0.2
+_DEFAULT_MAX_BATCH = 10
+
+
+class BatchingClassifier(AIClassifier):
+    """Micro-batches classify_is_ad calls into classify_many requests.
+
+    The first call opens a window of `window` seconds; calls arriving while
+    it is open join the same batch, which is sent early once it reaches
+    `max_batch` texts. Each caller gets its own verdict back. A batch of one
+    goes through the inner classify_is_ad, so a quiet chat pays only the
+    window as extra latency.
+    """
+
+    def __init__(
+        self,
+        inner: AIClassifier,
+        window: float = _DEFAULT_WINDOW,
+        max_batch: int = _DEFAULT_MAX_BATCH,
+    ) -> None:
+        self._inner = inner
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: List[Tuple[str, asyncio.Future[bool]]] = []
+        self._timer: Optional[asyncio.Task[None]] = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def classify_is_ad(self, text: str) -> bool:
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        return await future
+
+    async def classify_many(self, texts: List[str]) -> List[bool]:
+        return await self._inner.classify_many(texts)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._window)
+        self._timer = None
+        self._flush()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._send(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _send(self, batch: List[Tuple[str, asyncio.Future[bool]]]) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            if len(texts) == 1:
+                verdicts = [await self._inner.classify_is_ad(texts[0])]
+            else:
+                verdicts = await self._inner.classify_many(texts)
+            if len(verdicts) != len(texts):
+                raise ValueError(f"expected {len(texts)} verdicts, got {len(verdicts)}")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), verdict in zip(batch, verdicts):
+            if not future.done():
+                future.set_result(verdict)
@@ -1,13 +1,43 @@
+import json
+from typing import List, Optional
+
 import google.genai
 from google.genai import errors as genai_errors  # noqa: F401 – re-exported for callers
 
 from src.ai.ports import AIClassifier
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
 
 _DEFAULT_PROMPT_SUFFIX = (
     "\n\nIs this message an advertisement or spam? "
     "Reply with exactly one word: true or false."
 )
 
+_BATCH_PROMPT_SUFFIX = (
+    "\n\nBelow is a JSON array of {count} messages. For each message decide "
+    "whether it is an advertisement or spam. Reply with only a JSON array of "
+    "{count} booleans in the same order (true = advertisement or spam).\n\n"
+)
+
+
+def _parse_verdicts(text: str, count: int) -> Optional[List[bool]]:
+    """Verdict list from a batch response, or None if it is malformed."""
+    body = text.strip()
+    if body.startswith("```"):
+        body = body.strip("`").removeprefix("json").strip()
+    try:
+        verdicts = json.loads(body)
+    except ValueError:
+        return None
+    if (
+        not isinstance(verdicts, list)
+        or len(verdicts) != count
+        or not all(isinstance(v, bool) for v in verdicts)
+    ):
+        return None
+    return verdicts
+
 
 class GeminiClassifier(AIClassifier):
     """AIClassifier implementation backed by Google Gemini via google-genai SDK."""
@@ -25,3 +55,21 @@ class GeminiClassifier(AIClassifier):
             contents=prompt,
         )
         return response.text.strip().lower() == "true"
+
+    async def classify_many(self, texts: List[str]) -> List[bool]:
+        """One generate_content call for all texts; per-text calls if the
+        response is not a JSON array with one boolean per message."""
+        prompt = self._prompt or ""
+        prompt += _BATCH_PROMPT_SUFFIX.format(count=len(texts))
+        prompt += json.dumps(texts, ensure_ascii=False)
+        response = await self._client.aio.models.generate_content(
+            model=self._model,
+            contents=prompt,
+            config={"response_mime_type": "application/json"},
+        )
+        verdicts = _parse_verdicts(response.text or "", len(texts))
+        if verdicts is not None:
+            return verdicts
+
+        logger.warning("ai_batch_response_unparseable", batch_size=len(texts))
+        return [await self.classify_is_ad(text) for text in texts]
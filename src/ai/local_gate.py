@@ -0,0 +1,162 @@
+from typing import Dict, List, Optional, Tuple
+
+from src.ai.local_model import LocalAdModel
+from src.ai.ports import AIClassifier
+from src.ai.simhash import feature_count
+from src.ai.verdict_cache import normalize_text
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_AD_THRESHOLD = 0.99
+_HAM_THRESHOLD = 0.01
+# The model decides nothing until it has seen this many texts of each class
+_MIN_EXAMPLES = 50
+# Too few words for the bag-of-words model to be trusted
+_MIN_WORDS = 4
+# Every Nth local decision is still escalated to measure disagreement
+_VERIFY_EVERY = 20
+# Naive Bayes is over-confident: confident decisions are only applied locally
+# once this many of them were checked remotely with at most this error rate
+_MIN_VERIFIED = 100
+_MAX_DISAGREEMENT = 0.02
+_SAMPLE_CHARS = 120
+
+
+class LocalGateClassifier(AIClassifier):
+    """Local first stage in front of the remote classifier.
+
+    Texts the LocalAdModel scores at or above ad_threshold (or at or below
+    ham_threshold) are decided locally; uncertain ones go to the inner
+    classifier, whose verdicts train the model. Local decisions are never
+    learned from, so the model cannot reinforce its own mistakes; callers
+    that feed the model other labels use classify_with_source() to tell
+    local decisions apart.
+
+    Scores alone are not trusted: confident decisions are escalated (and
+    compared with the remote verdict) until min_verified of them agreed at
+    a rate within max_disagreement. After that every verify_every-th one is
+    still checked, and the gate falls back to escalating everything while
+    the measured disagreement is above the limit. The gate belongs outside
+    any verdict cache or near-duplicate stage, so that local verdicts are
+    never stored or reused.
+    """
+
+    def __init__(
+        self,
+        inner: AIClassifier,
+        model: LocalAdModel,
+        ad_threshold: float = _AD_THRESHOLD,
+        ham_threshold: float = _HAM_THRESHOLD,
+        min_examples: int = _MIN_EXAMPLES,
+        verify_every: int = _VERIFY_EVERY,
+        min_verified: int = _MIN_VERIFIED,
+        max_disagreement: float = _MAX_DISAGREEMENT,
+    ) -> None:
+        self._inner = inner
+        self._model = model
+        self._ad_threshold = ad_threshold
+        self._ham_threshold = ham_threshold
+        self._min_examples = min_examples
+        self._verify_every = verify_every
+        self._min_verified = min_verified
+        self._max_disagreement = max_disagreement
+        self._decisions = 0
+        self.seen = 0
+        self.local = 0
+        self.escalated = 0
+        self.verified = 0
+        self.disagreements = 0
+
+    def stats(self) -> Dict[str, float]:
+        ad_docs, ham_docs = self._model.documents
+        return {
+            "seen": self.seen,
+            "local": self.local,
+            "local_share": round(self.local / self.seen, 3) if self.seen else 0.0,
+            "escalated": self.escalated,
+            "verified": self.verified,
+            "disagreements": self.disagreements,
+            "trusted": self._trusted(),
+            "trained_ads": ad_docs,
+            "trained_non_ads": ham_docs,
+        }
+
+    def _ready(self) -> bool:
+        return min(self._model.documents) >= self._min_examples
+
+    def _trusted(self) -> bool:
+        """Whether measured agreement allows deciding confident cases locally."""
+        if self.verified < self._min_verified:
+            return False
+        if not self.verified:
+            return True
+        return self.disagreements / self.verified <= self._max_disagreement
+
+    async def classify_is_ad(self, text: str) -> bool:
+        return (await self.classify_many([text]))[0]
+
+    async def classify_many(self, texts: List[str]) -> List[bool]:
+        return [is_ad for is_ad, _ in await self._classify_with_sources(texts)]
+
+    async def classify_with_source(self, text: str) -> Tuple[bool, bool]:
+        """(is_ad, decided_locally) for text."""
+        return (await self._classify_with_sources([text]))[0]
+
+    async def _classify_with_sources(self, texts: List[str]) -> List[Tuple[bool, bool]]:
+        await self._model.ensure_loaded()
+        self.seen += len(texts)
+        verdicts: List[Optional[bool]] = [None] * len(texts)
+        to_verify: Dict[int, bool] = {}
+
+        ready = self._ready()
+        trusted = self._trusted()
+        for i, text in enumerate(texts):
+            if not ready or feature_count(normalize_text(text)) < _MIN_WORDS:
+                continue
+            score = self._model.predict(text)
+            if self._ham_threshold < score < self._ad_threshold:
+                continue
+            is_ad = score >= self._ad_threshold
+            self._decisions += 1
+            if not trusted or self._decisions % self._verify_every == 0:
+                to_verify[i] = is_ad
+                continue
+            verdicts[i] = is_ad
+            self.local += 1
+            logger.info(
+                "ai_local_gate_resolved",
+                is_ad=is_ad,
+                score=round(score, 4),
+                local_share=self.stats()["local_share"],
+            )
+
+        pending = [i for i, v in enumerate(verdicts) if v is None]
+        if pending:
+            results = await self._classify([texts[i] for i in pending])
+            self.escalated += len(pending)
+            for i, verdict in zip(pending, results):
+                verdicts[i] = verdict
+                if i in to_verify:
+                    self._record_verification(texts[i], to_verify[i], verdict)
+            await self._model.learn_many([texts[i] for i in pending], results)
+        pending_set = set(pending)
+        return [(bool(v), i not in pending_set) for i, v in enumerate(verdicts)]
+
+    async def _classify(self, texts: List[str]) -> List[bool]:
+        if len(texts) == 1:
+            return [await self._inner.classify_is_ad(texts[0])]
+        return await self._inner.classify_many(texts)
+
+    def _record_verification(self, text: str, local: bool, verdict: bool) -> None:
+        self.verified += 1
+        if local == verdict:
+            return
+        self.disagreements += 1
+        logger.warning(
+            "ai_local_gate_disagreement",
+            text=text[:_SAMPLE_CHARS],
+            local_verdict=local,
+            remote_verdict=verdict,
+            **self.stats(),
+        )
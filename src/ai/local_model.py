@@ -0,0 +1,138 @@
+import asyncio
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from src.ai.ports import LocalModelStore
+from src.ai.simhash import text_features
+from src.ai.verdict_cache import normalize_text
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Features hash into this many buckets, bounding memory and the stored table
+_FEATURE_BITS = 20
+# Reserved key holding per-class document counts (features are >= 0)
+_DOCS_KEY = -1
+_ALPHA = 1.0
+# Log-odds are clamped before exp() so extreme texts cannot overflow
+_MAX_LOGIT = 30.0
+# Recently learned texts, so a text is counted once per process
+_MAX_LEARNED = 20000
+
+
+def hashed_features(text: str) -> Set[int]:
+    """Bucket ids of the words and bigrams of the normalized text."""
+    mask = (1 << _FEATURE_BITS) - 1
+    return {
+        int.from_bytes(
+            hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        & mask
+        for f in text_features(normalize_text(text))
+    }
+
+
+class LocalAdModel:
+    """Naive Bayes over hashed word/bigram features, trained incrementally.
+
+    Each labelled text adds 1 to the (ad, not-ad) count of every feature it
+    contains; predict() returns the posterior probability of "ad". Counts
+    live in memory and, with a store, are loaded once and persisted as
+    deltas per learn_many() call. Store errors are logged; the model keeps
+    working in memory. A text (by normalized content) that was learned
+    recently is skipped, so a cached verdict seen again or a manual read of
+    an already classified message does not count it twice.
+    """
+
+    def __init__(self, store: Optional[LocalModelStore] = None) -> None:
+        self._store = store
+        self._counts: Dict[int, List[float]] = {}
+        self._ad_docs = 0.0
+        self._ham_docs = 0.0
+        self._ad_total = 0.0
+        self._ham_total = 0.0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._learned: OrderedDict[bytes, None] = OrderedDict()
+
+    @property
+    def documents(self) -> Tuple[float, float]:
+        """Number of (ad, not-ad) texts learned so far."""
+        return self._ad_docs, self._ham_docs
+
+    async def ensure_loaded(self) -> None:
+        store = self._store
+        if self._loaded or store is None:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                self._apply(await store.load())
+                logger.info(
+                    "ai_local_model_loaded",
+                    features=len(self._counts),
+                    ad_docs=self._ad_docs,
+                    ham_docs=self._ham_docs,
+                )
+            except Exception as e:
+                logger.warning("ai_local_model_load_failed", error=repr(e))
+            self._loaded = True
+
+    def predict(self, text: str) -> float:
+        """Posterior probability that text is an ad."""
+        vocabulary = max(len(self._counts), 1)
+        ad_norm = math.log(self._ad_total + _ALPHA * vocabulary)
+        ham_norm = math.log(self._ham_total + _ALPHA * vocabulary)
+        logit = math.log(self._ad_docs + 1) - math.log(self._ham_docs + 1)
+        for feature in hashed_features(text):
+            ad, ham = self._counts.get(feature, (0.0, 0.0))
+            logit += math.log(ad + _ALPHA) - ad_norm
+            logit -= math.log(ham + _ALPHA) - ham_norm
+        logit = max(-_MAX_LOGIT, min(_MAX_LOGIT, logit))
+        return 1 / (1 + math.exp(-logit))
+
+    async def learn_many(self, texts: Sequence[str], labels: Sequence[bool]) -> None:
+        """Add labelled texts (True = ad) to the model."""
+        deltas: Dict[int, Tuple[float, float]] = {}
+        for text, is_ad in zip(texts, labels):
+            if not self._first_seen(text):
+                continue
+            delta = (1.0, 0.0) if is_ad else (0.0, 1.0)
+            for key in (_DOCS_KEY, *hashed_features(text)):
+                ad, ham = deltas.get(key, (0.0, 0.0))
+                deltas[key] = (ad + delta[0], ham + delta[1])
+        if not deltas:
+            return
+        await self.ensure_loaded()
+        self._apply(deltas)
+        if self._store is None:
+            return
+        try:
+            await self._store.add_counts(deltas)
+        except Exception as e:
+            logger.warning("ai_local_model_save_failed", error=repr(e))
+
+    def _first_seen(self, text: str) -> bool:
+        digest = hashlib.blake2b(normalize_text(text).encode("utf-8")).digest()
+        if digest in self._learned:
+            self._learned.move_to_end(digest)
+            return False
+        self._learned[digest] = None
+        while len(self._learned) > _MAX_LEARNED:
+            self._learned.popitem(last=False)
+        return True
+
+    def _apply(self, deltas: Dict[int, Tuple[float, float]]) -> None:
+        for key, (ad, ham) in deltas.items():
+            if key == _DOCS_KEY:
+                self._ad_docs += ad
+                self._ham_docs += ham
+                continue
+            counts = self._counts.setdefault(key, [0.0, 0.0])
+            counts[0] += ad
+            counts[1] += ham
+            self._ad_total += ad
+            self._ham_total += ham
@@ -0,0 +1,108 @@
+from typing import Dict, List, Optional
+
+from src.ai.ports import AIClassifier
+from src.ai.simhash import SimHashIndex, feature_count, simhash
+from src.ai.verdict_cache import normalize_text
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Shorter texts collide too easily to trust a fuzzy match
+_MIN_WORDS = 6
+# Every Nth fuzzy hit is still classified to measure false reuse
+_VERIFY_EVERY = 20
+_SAMPLE_CHARS = 120
+
+
+class NearDuplicateClassifier(AIClassifier):
+    """Reuses ad verdicts for near-duplicates of recently detected ads.
+
+    Messages classified as ads are fingerprinted (SimHash over the
+    normalized text); a new message within the index's Hamming threshold
+    of a known ad gets the ad verdict without calling the inner
+    classifier. Only positive verdicts are indexed: reusing "not an ad"
+    for a text that is close to a harmless one would let spam variants
+    through. Every _VERIFY_EVERY-th hit is classified anyway and
+    disagreements are logged as false-reuse samples.
+    """
+
+    def __init__(
+        self,
+        inner: AIClassifier,
+        index: Optional[SimHashIndex] = None,
+        verify_every: int = _VERIFY_EVERY,
+    ) -> None:
+        self._inner = inner
+        self._index = index if index is not None else SimHashIndex()
+        self._verify_every = verify_every
+        self.lookups = 0
+        self.hits = 0
+        self.verified = 0
+        self.false_reuse = 0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+            "verified": self.verified,
+            "false_reuse": self.false_reuse,
+        }
+
+    async def classify_is_ad(self, text: str) -> bool:
+        return (await self.classify_many([text]))[0]
+
+    async def classify_many(self, texts: List[str]) -> List[bool]:
+        verdicts: List[Optional[bool]] = [None] * len(texts)
+        fingerprints: List[Optional[int]] = [None] * len(texts)
+        to_verify: Dict[int, str] = {}
+
+        for i, text in enumerate(texts):
+            normalized = normalize_text(text)
+            if feature_count(normalized) < _MIN_WORDS:
+                continue
+            fingerprints[i] = simhash(normalized)
+            self.lookups += 1
+            match = self._index.lookup(fingerprints[i])
+            if match is None:
+                continue
+            self.hits += 1
+            if self.hits % self._verify_every == 0:
+                to_verify[i] = match.sample
+                continue
+            verdicts[i] = match.verdict
+            logger.info(
+                "ai_near_duplicate_hit",
+                distance=match.distance,
+                hit_rate=self.stats()["hit_rate"],
+            )
+
+        pending = [i for i, v in enumerate(verdicts) if v is None]
+        if pending:
+            results = await self._classify([texts[i] for i in pending])
+            for i, verdict in zip(pending, results):
+                verdicts[i] = verdict
+                if i in to_verify:
+                    self._record_verification(texts[i], to_verify[i], verdict)
+                fingerprint = fingerprints[i]
+                if verdict and fingerprint is not None:
+                    self._index.add(fingerprint, True, texts[i][:_SAMPLE_CHARS])
+
+        return [bool(v) for v in verdicts]
+
+    async def _classify(self, texts: List[str]) -> List[bool]:
+        if len(texts) == 1:
+            return [await self._inner.classify_is_ad(texts[0])]
+        return await self._inner.classify_many(texts)
+
+    def _record_verification(self, text: str, sample: str, verdict: bool) -> None:
+        self.verified += 1
+        if verdict:
+            return
+        self.false_reuse += 1
+        logger.warning(
+            "ai_near_duplicate_false_reuse",
+            text=text[:_SAMPLE_CHARS],
+            matched_ad=sample,
+            **self.stats(),
+        )
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
 
 
 class AIClassifier(ABC):
@@ -6,3 +7,35 @@ class AIClassifier(ABC):
     async def classify_is_ad(self, text: str) -> bool:
         """Return True if the given text is an advertisement, False otherwise."""
         ...
+
+    async def classify_many(self, texts: List[str]) -> List[bool]:
+        """Classify several texts; verdicts come back in input order.
+
+        The default makes one classify_is_ad call per text; implementations
+        with a cheaper batch request override it.
+        """
+        return [await self.classify_is_ad(text) for text in texts]
+
+
+class VerdictCache(ABC):
+    """Key-value store of classifier verdicts (keys are opaque strings)."""
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> List[Optional[bool]]:
+        """Cached verdict per key, None where nothing is cached."""
+        ...
+
+    @abstractmethod
+    async def set_many(self, verdicts: Dict[str, bool]) -> None: ...
+
+
+class LocalModelStore(ABC):
+    """Persistent per-feature (ad, not-ad) counts of the local pre-classifier."""
+
+    @abstractmethod
+    async def load(self) -> Dict[int, Tuple[float, float]]: ...
+
+    @abstractmethod
+    async def add_counts(self, deltas: Dict[int, Tuple[float, float]]) -> None:
+        """Add deltas to the stored counts in one transaction."""
+        ...
@@ -0,0 +1,112 @@
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+_BITS = 64
+_WORD = re.compile(r"\w+", re.UNICODE)
+_DIGITS = re.compile(r"\d")
+
+_DEFAULT_BANDS = 8
+_DEFAULT_MAX_DISTANCE = 6
+_DEFAULT_MAX_ENTRIES = 5000
+
+
+def text_features(text: str) -> List[str]:
+    """Words and word bigrams; digits are masked so phone numbers,
+    prices and promo codes that differ per copy hash the same."""
+    words = [_DIGITS.sub("0", w) for w in _WORD.findall(text.casefold())]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def feature_count(text: str) -> int:
+    return len(_WORD.findall(text))
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of text; similar texts differ in few bits."""
+    weights = [0] * _BITS
+    for feature in text_features(text):
+        h = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, w in enumerate(weights) if w > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+@dataclass(frozen=True)
+class SimHashMatch:
+    verdict: bool
+    distance: int
+    sample: str
+
+
+class SimHashIndex:
+    """Bounded LRU of recent fingerprints with banded lookup.
+
+    The 64-bit hash is split into `bands` bands; two hashes within
+    max_distance < bands bits share at least one band exactly (pigeonhole),
+    so a lookup only compares against entries in the query's band buckets.
+    """
+
+    def __init__(
+        self,
+        bands: int = _DEFAULT_BANDS,
+        max_distance: int = _DEFAULT_MAX_DISTANCE,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if max_distance >= bands:
+            raise ValueError("max_distance must be smaller than bands")
+        self._bands = bands
+        self._band_bits = _BITS // bands
+        self._max_distance = max_distance
+        self._max_entries = max_entries
+        self._entries: OrderedDict[int, Tuple[bool, str]] = OrderedDict()
+        self._buckets: Dict[Tuple[int, int], Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        mask = (1 << self._band_bits) - 1
+        return [
+            (band, fingerprint >> (band * self._band_bits) & mask)
+            for band in range(self._bands)
+        ]
+
+    def lookup(self, fingerprint: int) -> Optional[SimHashMatch]:
+        """Closest known fingerprint within max_distance, if any."""
+        best: Optional[Tuple[int, int]] = None
+        for key in self._band_keys(fingerprint):
+            for candidate in self._buckets.get(key, ()):
+                distance = hamming(fingerprint, candidate)
+                if distance <= self._max_distance and (
+                    best is None or distance < best[1]
+                ):
+                    best = (candidate, distance)
+        if best is None:
+            return None
+        self._entries.move_to_end(best[0])
+        verdict, sample = self._entries[best[0]]
+        return SimHashMatch(verdict=verdict, distance=best[1], sample=sample)
+
+    def add(self, fingerprint: int, verdict: bool, sample: str) -> None:
+        if fingerprint not in self._entries:
+            for key in self._band_keys(fingerprint):
+                self._buckets.setdefault(key, set()).add(fingerprint)
+        self._entries[fingerprint] = (verdict, sample)
+        self._entries.move_to_end(fingerprint)
+        while len(self._entries) > self._max_entries:
+            old, _ = self._entries.popitem(last=False)
+            for key in self._band_keys(old):
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(old)
+                    if not bucket:
+                        del self._buckets[key]
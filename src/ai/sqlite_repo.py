@@ -0,0 +1,38 @@
+from typing import Dict, Tuple
+
+from src.ai.ports import LocalModelStore
+from src.infrastructure.db import BaseSqliteRepository
+
+
+class SqliteLocalModelStore(BaseSqliteRepository, LocalModelStore):
+    def __init__(self, db_path: str = "data.db"):
+        super().__init__(db_path)
+
+    async def load(self) -> Dict[int, Tuple[float, float]]:
+        def _load():
+            with self._connect() as conn:
+                return {
+                    row["feature"]: (row["ad"], row["ham"])
+                    for row in conn.execute("SELECT * FROM ai_local_model")
+                }
+
+        return await self._execute(_load)
+
+    async def add_counts(self, deltas: Dict[int, Tuple[float, float]]) -> None:
+        rows = [(feature, ad, ham) for feature, (ad, ham) in deltas.items()]
+
+        def _save():
+            with self._connect() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO ai_local_model (feature, ad, ham)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT (feature) DO UPDATE SET
+                        ad = ai_local_model.ad + excluded.ad,
+                        ham = ai_local_model.ham + excluded.ham
+                    """,
+                    rows,
+                )
+
+        if rows:
+            await self._execute_write(_save)
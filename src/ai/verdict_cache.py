@@ -0,0 +1,112 @@
+import asyncio
+import hashlib
+import re
+from typing import Dict, List, Optional
+
+from src.ai.ports import AIClassifier, VerdictCache
+from src.infrastructure.html import html_to_text
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_URL = re.compile(r"https?://[^\s?#]+[^\s]*", re.IGNORECASE)
+_URL_TAIL = re.compile(r"[?#].*$")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of a message for verdict lookups.
+
+    Strips the HTML produced by sanitize_html, drops URL query strings and
+    fragments (tracking parameters differ between cross-posts), collapses
+    whitespace and case.
+    """
+    plain = html_to_text(text)
+    plain = _URL.sub(lambda m: _URL_TAIL.sub("", m.group(0)), plain)
+    return _WHITESPACE.sub(" ", plain).strip().casefold()
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class CachingClassifier(AIClassifier):
+    """Verdict cache in front of another classifier.
+
+    Keys combine a hash of (model, prompt) with a hash of the normalized
+    text, so changing either setting starts from an empty cache while
+    identical cross-posted spam is classified once. Concurrent lookups of
+    the same text share one in-flight classification. Cache errors are
+    logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        inner: AIClassifier,
+        cache: VerdictCache,
+        model: str,
+        prompt: Optional[str],
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._namespace = _digest(f"{model}\0{prompt or ''}")[:16]
+        self._inflight: Dict[str, asyncio.Future[bool]] = {}
+
+    def cache_key(self, text: str) -> str:
+        return f"{self._namespace}:{_digest(normalize_text(text))}"
+
+    async def classify_is_ad(self, text: str) -> bool:
+        return (await self.classify_many([text]))[0]
+
+    async def classify_many(self, texts: List[str]) -> List[bool]:
+        keys = [self.cache_key(t) for t in texts]
+        try:
+            cached = await self._cache.get_many(keys)
+        except Exception as e:
+            logger.warning("ai_verdict_cache_read_failed", error=repr(e))
+            cached = [None] * len(keys)
+
+        verdicts: Dict[str, bool] = {
+            k: v for k, v in zip(keys, cached) if v is not None
+        }
+        waiting = {k: self._inflight[k] for k in keys if k in self._inflight}
+        # First text per uncached key that nobody else is classifying yet
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in verdicts and key not in waiting:
+                missing.setdefault(key, text)
+
+        if missing:
+            await self._classify(missing, verdicts)
+        for key, future in waiting.items():
+            if key not in verdicts:
+                verdicts[key] = await future
+        return [verdicts[k] for k in keys]
+
+    async def _classify(self, missing: Dict[str, str], verdicts: Dict[str, bool]):
+        loop = asyncio.get_running_loop()
+        futures = {k: loop.create_future() for k in missing}
+        self._inflight.update(futures)
+        try:
+            if len(missing) == 1:
+                results = [await self._inner.classify_is_ad(*missing.values())]
+            else:
+                results = await self._inner.classify_many(list(missing.values()))
+        except Exception as e:
+            for future in futures.values():
+                future.set_exception(e)
+                # Retrieved by waiters, if any; avoid "never retrieved" noise
+                future.exception()
+            raise
+        finally:
+            for key in futures:
+                self._inflight.pop(key, None)
+
+        fresh = dict(zip(missing, results))
+        for key, verdict in fresh.items():
+            futures[key].set_result(verdict)
+        verdicts.update(fresh)
+        try:
+            await self._cache.set_many(fresh)
+        except Exception as e:
+            logger.warning("ai_verdict_cache_write_failed", error=repr(e))
@@ -4,6 +4,15 @@ from typing import Any, Dict, List, Optional
 from src.application.message_views import group_messages_into_albums
 from src.domain.models import ActionLog, Chat, ChatType, Message, SystemEvent
 from src.domain.ports import ActionRepository, ChatRepository, EventRepository
+from src.infrastructure.logging import get_logger
+from src.infrastructure.telegram_queue import PRIORITY_USER, write_priority
+from src.messages.models import SearchHit
+from src.messages.ports import MessageSearchIndex, MessageStore
+
+logger = get_logger(__name__)
+
+# Page size of the chat view (ChatRepository.get_messages default)
+_PAGE_SIZE = 20
 
 
 class ChatInteractor:
@@ -12,10 +21,14 @@ class ChatInteractor:
         repository: ChatRepository,
         action_repo: ActionRepository,
         event_repo: EventRepository,
+        message_store: Optional[MessageStore] = None,
+        search_index: Optional[MessageSearchIndex] = None,
     ):
         self.repository = repository
         self.action_repo = action_repo
         self.event_repo = event_repo
+        self.message_store = message_store
+        self.search_index = search_index
 
     async def initialize(self):
         await self.repository.connect()
@@ -48,18 +61,57 @@ class ChatInteractor:
     async def get_chat_messages(
         self, chat_id: int, topic_id: Optional[int] = None, offset_id: int = 0
     ) -> List[Message]:
+        # Chat-level pages come from the local store when it has them gap-free
+        if self.message_store is not None and topic_id is None:
+            try:
+                local = await self.message_store.get_page(
+                    chat_id, _PAGE_SIZE, offset_id=offset_id
+                )
+            except Exception as e:
+                logger.warning(
+                    "message_store_read_failed", chat_id=chat_id, error=str(e)
+                )
+                local = None
+            if local is not None:
+                return group_messages_into_albums(local)
+
         raw_messages = await self.repository.get_messages(
             chat_id, topic_id=topic_id, offset_id=offset_id
         )
+
+        if self.message_store is not None and raw_messages:
+            try:
+                await self.message_store.save_page(
+                    chat_id, topic_id, raw_messages, offset_id, _PAGE_SIZE
+                )
+            except Exception as e:
+                logger.warning(
+                    "message_store_save_failed", chat_id=chat_id, error=str(e)
+                )
+        if self.search_index is not None and raw_messages:
+            try:
+                await self.search_index.index_messages(chat_id, raw_messages)
+            except Exception as e:
+                logger.warning(
+                    "search_index_save_failed", chat_id=chat_id, error=str(e)
+                )
         return group_messages_into_albums(raw_messages)
 
+    async def search_messages(
+        self, query: str, chat_id: Optional[int] = None, limit: int = 20
+    ) -> List[SearchHit]:
+        if self.search_index is None:
+            return []
+        return await self.search_index.search(query, chat_id=chat_id, limit=limit)
+
     async def mark_chat_as_read(
         self,
         chat_id: int,
         topic_id: Optional[int] = None,
         max_id: Optional[int] = None,
     ) -> None:
-        await self.repository.mark_as_read(chat_id, topic_id, max_id=max_id)
+        with write_priority(PRIORITY_USER):
+            await self.repository.mark_as_read(chat_id, topic_id, max_id=max_id)
 
         chat = await self.repository.get_chat(chat_id)
         chat_name = chat.name if chat else f"Chat {chat_id}"
@@ -90,7 +142,8 @@ class ChatInteractor:
         await self.action_repo.add_log(log)
 
     async def toggle_reaction(self, chat_id: int, msg_id: int, emoji: str) -> bool:
-        return await self.repository.send_reaction(chat_id, msg_id, emoji)
+        with write_priority(PRIORITY_USER):
+            return await self.repository.send_reaction(chat_id, msg_id, emoji)
 
     async def get_action_logs(self, limit: int = 50) -> List[ActionLog]:
         return await self.action_repo.get_logs(limit)
@@ -13,6 +13,25 @@ class Settings(BaseSettings):
 
     # When set, sync rules from production export URL on startup
     RULES_SYNC_URL: Optional[str] = None
+    # Re-poll RULES_SYNC_URL every N seconds (0 disables); jitter is a fraction
+    RULES_SYNC_INTERVAL: float = 300.0
+    RULES_SYNC_JITTER: float = 0.1
+
+    # Keep a local SQLite copy of chat history and serve chat pages from it
+    MESSAGE_STORE_ENABLED: bool = False
+
+    # Full-text index of received messages behind /api/search
+    SEARCH_INDEX_ENABLED: bool = False
+    # On startup, index this many history pages of the most recent chats (0 disables)
+    SEARCH_BACKFILL_PAGES: int = 0
+    SEARCH_BACKFILL_CHATS: int = 50
+
+    # Seconds an AI ad verdict for a normalized message text stays cached
+    AI_VERDICT_TTL: int = 7 * 24 * 3600
+    # Decide confident AI_AUTOREAD cases with a local model trained on past verdicts
+    AI_LOCAL_GATE_ENABLED: bool = False
+    # Dispatch messages immediately and mark ads read once the AI verdict arrives
+    AI_ASYNC_VERDICTS: bool = False
 
 
 @lru_cache(maxsize=1)
@@ -5,6 +5,7 @@ from typing import Optional, cast
 from quart import current_app
 
 from src.adapters.telegram import TelethonAdapter
+from src.adapters.telegram.write_intents import SqliteWriteIntentStore
 from src.application.interactors import ChatInteractor
 from src.config import get_settings
 from src.domain.ports import ActionRepository, EventRepository
@@ -55,10 +56,14 @@ def reload_tg_adapter(session_string: Optional[str] = None) -> None:
         session_string=session_string,
         api_id=settings.TG_API_ID,
         api_hash=settings.TG_API_HASH,
+        intent_store=SqliteWriteIntentStore(db_path=settings.DB_PATH),
     )
 
     app = _app()
     new_adapter.add_event_listener(app.event_bus.dispatch)
+    message_store = app.chat_interactor.message_store
+    if message_store is not None:
+        new_adapter.add_reconnect_listener(message_store.reset_live_chats)
 
     app.tg_adapter = new_adapter
     app.chat_interactor.repository = new_adapter
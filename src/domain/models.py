@@ -23,6 +23,8 @@ class Chat:
     image_url: Optional[str] = None
     icon_emoji: Optional[str] = None
     is_pinned: bool = False
+    # Parsed top message, when the listing already carried it
+    last_message: Optional["Message"] = None
 
 
 @dataclass
@@ -108,6 +110,8 @@ class SystemEvent:
     message_model: Optional[Message] = None
     rendered_html: Optional[str] = None
     is_read: bool = False
+    # "deleted" events: every id removed by the update (message_model has the first)
+    deleted_ids: List[int] = field(default_factory=list)
 
 
 @dataclass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from src.domain.models import ActionLog, Chat, Message, SystemEvent
 
@@ -95,6 +95,11 @@ class TelegramWritePort(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    async def mark_many_as_read(self, targets: List[Tuple[int, Optional[int]]]) -> None:
+        """Mark whole chats/topics, given as (chat_id, topic_id), read in one batch."""
+        pass
+
     @abstractmethod
     async def send_reaction(self, chat_id: int, msg_id: int, emoji: str) -> bool:
         pass
@@ -124,6 +129,11 @@ class ActionRepository(ABC):
     async def add_log(self, log: ActionLog) -> None:
         pass
 
+    @abstractmethod
+    async def add_logs(self, logs: List[ActionLog]) -> None:
+        """Store several logs in one round trip."""
+        pass
+
     @abstractmethod
     async def get_logs(self, limit: int = 50) -> List[ActionLog]:
         pass
@@ -0,0 +1,97 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+_DEFAULT_WINDOW = 0.5
+_DEFAULT_FLUSH_TIMEOUT = 1.0
+
+
+class EventCoalescer:
+    """Debounces bursts of state updates so only the latest one is processed.
+
+    The first job for a key opens a window; jobs submitted for the same key
+    while it is open replace the pending one (counted as superseded). When
+    the window closes the latest job runs once. Suited to updates that carry
+    the full current state (message edits, reaction counts), where earlier
+    versions are worthless once a newer one has arrived.
+    stop() closes open windows early and runs their latest jobs, so an edit
+    or reaction received just before shutdown still reaches the ingest
+    queue instead of vanishing with its timer.
+    """
+
+    def __init__(self, window: float = _DEFAULT_WINDOW) -> None:
+        self._window = window
+        self._pending: dict[Hashable, Job] = {}
+        self._timers: dict[Hashable, asyncio.Task[None]] = {}
+        self.superseded = 0
+        self.cancelled = 0
+        self.dispatched = 0
+
+    async def submit(self, key: Hashable, job: Job) -> None:
+        """Schedule job for key, replacing a job still waiting in its window."""
+        if key in self._pending:
+            self.superseded += 1
+        self._pending[key] = job
+        if key not in self._timers:
+            self._timers[key] = asyncio.create_task(self._flush_later(key))
+
+    def cancel(self, predicate: Callable[[Any], bool]) -> int:
+        """Drop pending jobs whose key matches predicate; returns how many.
+
+        Their windows still close on schedule and find nothing to run.
+        """
+        keys = [key for key in self._pending if predicate(key)]
+        for key in keys:
+            del self._pending[key]
+        self.cancelled += len(keys)
+        return len(keys)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": len(self._pending),
+            "superseded": self.superseded,
+            "cancelled": self.cancelled,
+            "dispatched": self.dispatched,
+        }
+
+    async def stop(self, timeout: float = _DEFAULT_FLUSH_TIMEOUT) -> None:
+        """Cancel open windows and run their pending jobs (for up to timeout)."""
+        timers = list(self._timers.values())
+        for task in timers:
+            task.cancel()
+        await asyncio.gather(*timers, return_exceptions=True)
+        self._timers.clear()
+        jobs = list(self._pending.values())
+        self._pending.clear()
+        try:
+            await asyncio.wait_for(self._run_all(jobs), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("event_coalescer_flush_timeout")
+        logger.info("event_coalescer_stopped", flushed=len(jobs))
+
+    async def _run_all(self, jobs: list[Job]) -> None:
+        for job in jobs:
+            await self._run(job)
+
+    async def _flush_later(self, key: Hashable) -> None:
+        try:
+            await asyncio.sleep(self._window)
+        finally:
+            self._timers.pop(key, None)
+        job = self._pending.pop(key, None)
+        if job is None:
+            return
+        await self._run(job)
+
+    async def _run(self, job: Job) -> None:
+        self.dispatched += 1
+        try:
+            await job()
+        except Exception as e:
+            logger.error("coalesced_job_failed", error=repr(e))
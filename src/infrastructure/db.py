@@ -1,30 +1,139 @@
-import sqlite3
 import asyncio
-from typing import Callable, TypeVar
+import contextvars
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, TypeVar
 
 T = TypeVar("T")
 
+_DEFAULT_READERS = 4
+_STATEMENT_CACHE_SIZE = 256
 
-class BaseSqliteRepository:
+
+class SqliteConnectionPool:
     """
-    Base repository handling SQLite connection creation and
-    async execution offloading.
+    Long-lived SQLite connections bound to dedicated threads.
+
+    Writes run on a single writer thread (SQLite allows one writer anyway),
+    reads fan out over a small reader pool. Every pool thread opens its
+    connection once, applies the pragmas, and keeps it - together with its
+    prepared statement cache - for the lifetime of the pool.
     """
 
-    def __init__(self, db_path: str = "data.db"):
+    def __init__(self, db_path: str, readers: int = _DEFAULT_READERS):
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="sqlite-writer",
+            initializer=self._init_thread,
+            initargs=(False,),
+        )
+        self._readers = ThreadPoolExecutor(
+            max_workers=readers,
+            thread_name_prefix="sqlite-reader",
+            initializer=self._init_thread,
+            initargs=(True,),
+        )
 
-    def _connect(self) -> sqlite3.Connection:
-        """Create a new synchronous connection to the database with WAL enabled."""
-        conn = sqlite3.connect(self.db_path)
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        # check_same_thread is off only so close() can run from the caller;
+        # each pooled connection is still used by exactly one thread.
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
         conn.row_factory = sqlite3.Row
         # Enable Write-Ahead Logging for better concurrency
         conn.execute("PRAGMA journal_mode=WAL;")
         conn.execute("PRAGMA synchronous=NORMAL;")
         # Enable Foreign Keys for ON DELETE CASCADE
         conn.execute("PRAGMA foreign_keys = ON;")
+        if read_only:
+            # Fail loudly if a write is ever routed to a reader thread
+            conn.execute("PRAGMA query_only = ON;")
         return conn
 
+    def _init_thread(self, read_only: bool) -> None:
+        conn = self._open(read_only)
+        self._local.conn = conn
+        with self._lock:
+            self._connections.append(conn)
+
+    def connection(self) -> sqlite3.Connection:
+        """Connection owned by the current pool thread.
+
+        Outside pool threads a standalone connection is opened, matching the
+        old one-connection-per-call behaviour.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return self._open(read_only=False)
+        return conn
+
+    async def run(self, func: Callable[[], T], write: bool = False) -> T:
+        loop = asyncio.get_running_loop()
+        executor = self._writer if write else self._readers
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(executor, ctx.run, func)
+
+    def close(self) -> None:
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+_pools: Dict[str, SqliteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> SqliteConnectionPool:
+    """Shared pool per database file, so every repository reuses it."""
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = SqliteConnectionPool(db_path)
+            _pools[db_path] = pool
+        return pool
+
+
+def close_all_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+class BaseSqliteRepository:
+    """
+    Base repository handling pooled SQLite connections and
+    async execution offloading.
+    """
+
+    def __init__(self, db_path: str = "data.db"):
+        self.db_path = db_path
+        self._pool = get_pool(db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the pooled connection for the current thread (WAL enabled).
+
+        Use it as `with self._connect() as conn:` - the block is a transaction
+        scope; the connection itself stays open.
+        """
+        return self._pool.connection()
+
     async def _execute(self, func: Callable[[], T]) -> T:
-        """Run a synchronous database operation in a separate thread."""
-        return await asyncio.to_thread(func)
+        """Run a synchronous read-only database operation on a reader thread."""
+        return await self._pool.run(func)
+
+    async def _execute_write(self, func: Callable[[], T]) -> T:
+        """Run a synchronous database write on the single writer thread."""
+        return await self._pool.run(func, write=True)
@@ -1,35 +1,71 @@
+import asyncio
 import traceback
 from collections.abc import Awaitable, Callable
+from typing import Optional
 
 from src.domain.models import SystemEvent
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+Subscriber = Callable[[SystemEvent], Awaitable[None]]
+
+# Well-known stages used by the app wiring; any int works, lower runs first.
+STAGE_PROCESS = 0  # persistence + rule engine (sets event.is_read)
+STAGE_PUBLISH = 10  # SSE rendering, sees the final event state
+
 
 class EventBus:
     """Lightweight in-process pub/sub for SystemEvent.
 
-    Subscribers are called in registration order. Rule engine must be
-    registered before SSE so it can set event.is_read before rendering.
+    Subscribers are grouped into stages. Stages run in ascending order;
+    subscribers within one stage run concurrently, so per-event latency is
+    the slowest subscriber of each stage rather than the sum of all of them.
+    Rule engine must be in an earlier stage than SSE so it can set
+    event.is_read before rendering.
     Errors in one subscriber are logged but do not stop dispatch to the rest.
     """
 
     def __init__(self) -> None:
-        self._subscribers: list[Callable[[SystemEvent], Awaitable[None]]] = []
+        self._stages: dict[int, list[Subscriber]] = {}
+        # Sorted snapshot of _stages, rebuilt on subscribe (dispatch is hot)
+        self._plan: list[list[Subscriber]] = []
+
+    def __len__(self) -> int:
+        return sum(len(subscribers) for subscribers in self._plan)
 
-    def subscribe(self, callback: Callable[[SystemEvent], Awaitable[None]]) -> None:
-        """Register a subscriber. Callbacks are invoked in registration order."""
-        self._subscribers.append(callback)
+    def subscribe(self, callback: Subscriber, stage: Optional[int] = None) -> None:
+        """Register a subscriber in a stage.
+
+        Without an explicit stage the callback gets a new stage after every
+        existing one, i.e. it runs strictly after earlier registrations.
+        """
+        if stage is None:
+            stage = max(self._stages, default=-1) + 1
+        self._stages.setdefault(stage, []).append(callback)
+        self._plan = [list(self._stages[s]) for s in sorted(self._stages)]
 
     async def dispatch(self, event: SystemEvent) -> None:
-        """Dispatch event to all subscribers in order."""
-        for cb in self._subscribers:
-            try:
-                await cb(event)
-            except Exception as e:
-                logger.error(
-                    "event_bus_subscriber_error",
-                    error=repr(e),
-                    traceback=traceback.format_exc(),
-                )
+        """Dispatch event stage by stage; a stage's subscribers run concurrently."""
+        for subscribers in self._plan:
+            if len(subscribers) == 1:
+                try:
+                    await subscribers[0](event)
+                except Exception as e:
+                    self._log_error(e)
+                continue
+
+            results = await asyncio.gather(
+                *(cb(event) for cb in subscribers), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self._log_error(result)
+
+    @staticmethod
+    def _log_error(e: Exception) -> None:
+        logger.error(
+            "event_bus_subscriber_error",
+            error=repr(e),
+            traceback="".join(traceback.format_exception(e)),
+        )
@@ -67,3 +67,24 @@ def sanitize_html(value: str) -> str:
     sanitizer.feed(value)
     sanitizer.close()
     return "".join(sanitizer.parts)
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag.lower() == "br":
+            self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        self.parts.append(data)
+
+
+def html_to_text(value: str) -> str:
+    """Plain text of an HTML fragment (tags dropped, entities decoded)."""
+    extractor = _TextExtractor()
+    extractor.feed(value)
+    extractor.close()
+    return "".join(extractor.parts)
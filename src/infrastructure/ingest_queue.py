@@ -0,0 +1,78 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+_DEFAULT_WORKERS = 4
+_DEFAULT_MAXSIZE = 1000
+_DEFAULT_DRAIN_TIMEOUT = 2.0
+
+
+class IngestQueue:
+    """Bounded hand-off between Telegram update handlers and event processing.
+
+    Jobs are sharded over N workers by key (chat_id), so updates of one chat
+    are processed in arrival order while different chats proceed in parallel.
+    Each shard is bounded; when it is full submit() waits, which pushes
+    backpressure into Telethon instead of growing memory without limit.
+    On stop() queued jobs get a bounded drain; whatever is left after it
+    (received but unprocessed updates) is lost, since Telethon does not
+    redeliver them after a restart.
+    """
+
+    def __init__(
+        self, workers: int = _DEFAULT_WORKERS, maxsize: int = _DEFAULT_MAXSIZE
+    ) -> None:
+        shard_size = max(1, maxsize // workers)
+        self._shards: list[asyncio.Queue[Job]] = [
+            asyncio.Queue(maxsize=shard_size) for _ in range(workers)
+        ]
+        self._worker_tasks: list[asyncio.Task[None]] = []
+
+    async def submit(self, key: int, job: Job) -> None:
+        """Queue job on the worker owning key; waits while that shard is full."""
+        await self._shards[hash(key) % len(self._shards)].put(job)
+
+    def queue_size(self) -> int:
+        """Current number of pending jobs across all workers."""
+        return sum(shard.qsize() for shard in self._shards)
+
+    async def start(self) -> None:
+        """Start the workers. Idempotent, so re-authorization can call it again."""
+        if self._worker_tasks:
+            return
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(shard), name=f"ingest-{i}")
+            for i, shard in enumerate(self._shards)
+        ]
+        logger.info("ingest_queue_started", workers=len(self._shards))
+
+    async def stop(self, drain_timeout: float = _DEFAULT_DRAIN_TIMEOUT) -> None:
+        """Stop the workers after draining queued jobs for up to drain_timeout."""
+        if self._worker_tasks:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(shard.join() for shard in self._shards)),
+                    timeout=drain_timeout,
+                )
+            except asyncio.TimeoutError:
+                pass
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        logger.info("ingest_queue_stopped", dropped=self.queue_size())
+
+    async def _worker(self, shard: asyncio.Queue[Job]) -> None:
+        while True:
+            job = await shard.get()
+            try:
+                await job()
+            except Exception as e:
+                logger.error("ingest_job_failed", error=repr(e))
+            finally:
+                shard.task_done()
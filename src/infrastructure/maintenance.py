@@ -1,4 +1,5 @@
 import asyncio
+from dataclasses import replace
 
 from src.infrastructure.logging import get_logger
 
@@ -25,8 +26,7 @@ async def job_background_maintenance(
 
                 is_premium = await interactor.get_self_premium_status()
                 if user.is_premium != is_premium:
-                    user.is_premium = is_premium
-                    await user_repo.save_user(user)
+                    await user_repo.save_user(replace(user, is_premium=is_premium))
                     logger.info("premium_status_updated", status=is_premium)
             else:
                 logger.info("maintenance_skipped_no_authenticated_user")
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 
@@ -35,3 +35,58 @@ class BackgroundTasks:
         for task in list(self._tasks):
             task.cancel()
         await asyncio.wait(self._tasks, timeout=timeout)
+
+
+class BoundedTaskPool:
+    """Runs submitted jobs in the background, at most `concurrency` at a time.
+
+    At most `max_pending` jobs may be running or waiting; beyond that
+    submit() refuses the job instead of queueing without limit. Job errors
+    are logged. shutdown() waits for submitted jobs up to a timeout and
+    cancels the rest.
+    """
+
+    def __init__(
+        self, logger: Any, name: str, concurrency: int, max_pending: int
+    ) -> None:
+        self._logger = logger
+        self._name = name
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._max_pending = max_pending
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self.completed = 0
+        self.rejected = 0
+
+    def submit(self, job: Callable[[], Awaitable[Any]]) -> bool:
+        """Schedule job; False if the pool is full and the job was not taken."""
+        if len(self._tasks) >= self._max_pending:
+            self.rejected += 1
+            return False
+        task = asyncio.create_task(self._run(job), name=self._name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _run(self, job: Callable[[], Awaitable[Any]]) -> None:
+        async with self._semaphore:
+            try:
+                await job()
+            except Exception as e:
+                self._logger.error(
+                    "task_pool_job_failed", pool=self._name, error=repr(e)
+                )
+            self.completed += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": len(self._tasks),
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    async def shutdown(self, timeout: float = 0.0) -> None:
+        if self._tasks and timeout > 0:
+            await asyncio.wait(list(self._tasks), timeout=timeout)
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
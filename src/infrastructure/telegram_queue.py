@@ -1,5 +1,12 @@
 import asyncio
-from collections.abc import Awaitable, Callable
+import bisect
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
 
 from telethon.errors import FloodWaitError
 
@@ -7,65 +14,300 @@ from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+Job = Callable[[], Awaitable[None]]
 
-class TelegramWriteQueue:
-    """Serial write queue for Telegram API operations.
+# Lower runs first
+PRIORITY_USER = 0
+PRIORITY_NORMAL = 10
+PRIORITY_BACKGROUND = 20
 
-    Enqueued coroutines are executed one at a time by a single worker.
-    On FloodWait (429) errors the same operation is re-queued after waiting
-    the required number of seconds.
-    Dropping pending operations on shutdown is acceptable (in-memory only).
+DEFAULT_METHOD = "default"
+
+# (tokens per second, burst) per Telegram method
+_METHOD_RATES: dict[str, tuple[float, float]] = {
+    "read_history": (8.0, 20.0),
+    "send_reaction": (2.0, 5.0),
+}
+_DEFAULT_RATE = (10.0, 20.0)
+_PEER_RATE = (1.0, 3.0)
+_DEFAULT_CONCURRENCY = 4
+_IDLE_POLL = 1.0
+# Seconds between sweeps that drop refilled peer buckets
+_BUCKET_SWEEP_INTERVAL = 60.0
+
+_write_priority: ContextVar[int] = ContextVar("write_priority", default=PRIORITY_NORMAL)
+
+
+@contextmanager
+def write_priority(priority: int) -> Iterator[None]:
+    """Writes enqueued inside the block (without explicit priority) use priority."""
+    token = _write_priority.set(priority)
+    try:
+        yield
+    finally:
+        _write_priority.reset(token)
+
+
+def current_write_priority() -> int:
+    return _write_priority.get()
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        # now may predate the bucket's creation (read once per dispatch pass)
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._updated = max(self._updated, now)
+
+    def delay(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self._tokens -= 1
+
+    def is_full(self, now: float) -> bool:
+        """Whether the bucket refilled to its burst (same as a fresh one)."""
+        self._refill(now)
+        return self._tokens >= self._burst
+
+
+@dataclass(frozen=True)
+class WriteJob:
+    """One operation for enqueue_many(); fields mirror enqueue() arguments."""
+
+    coro_fn: Job
+    method: str = DEFAULT_METHOD
+    peer: Optional[Hashable] = None
+    priority: Optional[int] = None
+
+
+@dataclass(order=True)
+class _WriteOp:
+    priority: int
+    seq: int
+    job: Job = field(compare=False)
+    method: str = field(compare=False)
+    peer: Optional[Hashable] = field(compare=False)
+
+
+class TelegramWriteScheduler:
+    """Rate-aware scheduler for Telegram API write operations.
+
+    Operations are tagged with the Telegram method they call and the peer
+    they target. One operation per peer is in flight at a time (untagged
+    ones share a single lane) and operations of one method for one peer keep
+    priority/FIFO order; different peers run concurrently up to
+    `concurrency`. Each method and each peer has a token bucket, so bursts
+    (mass autoread) are paced instead of tripping FloodWait. A FloodWait
+    parks only the method that raised it for the requested time; the
+    operation keeps its place and is retried once the method is released,
+    while other methods keep flowing.
+    Queued closures are dropped on shutdown; mark-read and reaction writes
+    survive anyway because ReadOps/WriteOps persist them as intents
+    (see write_intents) and replay them on the next start.
     """
 
-    def __init__(self) -> None:
-        self._queue: asyncio.Queue[Callable[[], Awaitable[None]]] = asyncio.Queue()
-        self._worker_task: asyncio.Task[None] | None = None
-        self._running = False
+    def __init__(
+        self,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        method_rates: Optional[dict[str, tuple[float, float]]] = None,
+        default_rate: tuple[float, float] = _DEFAULT_RATE,
+        peer_rate: tuple[float, float] = _PEER_RATE,
+        bucket_sweep_interval: float = _BUCKET_SWEEP_INTERVAL,
+    ) -> None:
+        self._concurrency = concurrency
+        self._method_rates = dict(
+            _METHOD_RATES if method_rates is None else method_rates
+        )
+        self._default_rate = default_rate
+        self._peer_rate = peer_rate
+        self._pending: list[_WriteOp] = []
+        self._seq = itertools.count()
+        self._method_buckets: dict[str, TokenBucket] = {}
+        self._peer_buckets: dict[Hashable, TokenBucket] = {}
+        self._bucket_sweep_interval = bucket_sweep_interval
+        self._last_bucket_sweep = time.monotonic()
+        self._parked: dict[str, float] = {}
+        self._busy_peers: set[Optional[Hashable]] = set()
+        self._active = 0
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._wakeup = asyncio.Event()
+        self._dispatcher_task: asyncio.Task[None] | None = None
+        self.flood_waits = 0
+
+    async def enqueue(
+        self,
+        coro_fn: Job,
+        method: str = DEFAULT_METHOD,
+        peer: Optional[Hashable] = None,
+        priority: Optional[int] = None,
+    ) -> None:
+        """Add a coroutine factory to the queue. Returns immediately.
+
+        Without an explicit priority the one set via write_priority() applies.
+        """
+        bisect.insort(self._pending, self._make_op(coro_fn, method, peer, priority))
+        self._wakeup.set()
+
+    async def enqueue_many(self, jobs: Iterable[WriteJob]) -> None:
+        """Add a batch of operations with a single re-sort and dispatcher wakeup."""
+        ops = [self._make_op(j.coro_fn, j.method, j.peer, j.priority) for j in jobs]
+        if not ops:
+            return
+        self._pending.extend(ops)
+        self._pending.sort()
+        self._wakeup.set()
 
-    async def enqueue(self, coro_fn: Callable[[], Awaitable[None]]) -> None:
-        """Add a coroutine factory to the queue. Returns immediately."""
-        await self._queue.put(coro_fn)
+    def _make_op(
+        self,
+        coro_fn: Job,
+        method: str,
+        peer: Optional[Hashable],
+        priority: Optional[int],
+    ) -> _WriteOp:
+        return _WriteOp(
+            priority=current_write_priority() if priority is None else priority,
+            seq=next(self._seq),
+            job=coro_fn,
+            method=method,
+            peer=peer,
+        )
 
     def queue_size(self) -> int:
-        """Current number of pending operations."""
-        return self._queue.qsize()
+        """Current number of pending (not yet started) operations."""
+        return len(self._pending)
+
+    def stats(self) -> dict[str, object]:
+        now = time.monotonic()
+        return {
+            "pending": len(self._pending),
+            "running": self._active,
+            "flood_waits": self.flood_waits,
+            "parked_methods": sorted(m for m, t in self._parked.items() if t > now),
+        }
 
     async def start(self) -> None:
-        """Start the background worker. Call after the Telegram client connects."""
-        self._running = True
-        self._worker_task = asyncio.create_task(self._worker())
-        logger.info("write_queue_started")
+        """Start the dispatcher. Call after the Telegram client connects."""
+        if self._dispatcher_task is not None:
+            return
+        self._dispatcher_task = asyncio.create_task(self._dispatcher())
+        logger.info("write_queue_started", concurrency=self._concurrency)
 
     async def stop(self) -> None:
-        """Stop the background worker. Pending operations are dropped."""
-        self._running = False
-        if self._worker_task is not None:
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                pass
-            self._worker_task = None
-        logger.info("write_queue_stopped", pending=self._queue.qsize())
+        """Stop the dispatcher and running operations. Pending ones are dropped."""
+        tasks = list(self._tasks)
+        if self._dispatcher_task is not None:
+            tasks.append(self._dispatcher_task)
+            self._dispatcher_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("write_queue_stopped", pending=len(self._pending))
 
-    async def _worker(self) -> None:
-        while self._running:
+    async def _dispatcher(self) -> None:
+        while True:
+            self._wakeup.clear()
+            timeout = self._dispatch_ready()
             try:
-                coro_fn = await asyncio.wait_for(self._queue.get(), timeout=1.0)
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
             except asyncio.TimeoutError:
+                pass
+
+    def _dispatch_ready(self) -> float:
+        """Start every operation allowed to run now; return seconds to next check."""
+        now = time.monotonic()
+        if now - self._last_bucket_sweep >= self._bucket_sweep_interval:
+            self._sweep_peer_buckets(now)
+        next_check = _IDLE_POLL
+        held: set[tuple[str, Optional[Hashable]]] = set()
+        i = 0
+        while i < len(self._pending) and self._active < self._concurrency:
+            op = self._pending[i]
+            lane = (op.method, op.peer)
+            # Nothing overtakes an op of the same lane that has to wait
+            if op.peer in self._busy_peers or lane in held:
+                i += 1
+                continue
+            wait = self._wait_time(op, now)
+            if wait > 0:
+                held.add(lane)
+                next_check = min(next_check, wait)
+                i += 1
                 continue
+            del self._pending[i]
+            self._launch(op, now)
+        return next_check
 
-            requeue = False
-            try:
-                await coro_fn()
-            except FloodWaitError as e:
-                logger.warning("flood_wait_backoff", seconds=e.seconds)
-                await asyncio.sleep(e.seconds)
-                requeue = True
-            except Exception as e:
-                logger.error("write_queue_operation_failed", error=repr(e))
-            finally:
-                self._queue.task_done()
-
-            if requeue:
-                await self._queue.put(coro_fn)
+    def _wait_time(self, op: _WriteOp, now: float) -> float:
+        wait = max(self._parked.get(op.method, 0.0) - now, 0.0)
+        wait = max(wait, self._method_bucket(op.method).delay(now))
+        if op.peer is not None:
+            wait = max(wait, self._peer_bucket(op.peer).delay(now))
+        return wait
+
+    def _method_bucket(self, method: str) -> TokenBucket:
+        bucket = self._method_buckets.get(method)
+        if bucket is None:
+            rate, burst = self._method_rates.get(method, self._default_rate)
+            bucket = self._method_buckets[method] = TokenBucket(rate, burst)
+        return bucket
+
+    def _peer_bucket(self, peer: Hashable) -> TokenBucket:
+        bucket = self._peer_buckets.get(peer)
+        if bucket is None:
+            bucket = self._peer_buckets[peer] = TokenBucket(*self._peer_rate)
+        return bucket
+
+    def _sweep_peer_buckets(self, now: float) -> None:
+        # A full bucket behaves like the fresh one _peer_bucket() would
+        # create, so dropping it keeps pacing intact and bounds the dict by
+        # the peers written to recently
+        self._peer_buckets = {
+            peer: bucket
+            for peer, bucket in self._peer_buckets.items()
+            if not bucket.is_full(now)
+        }
+        self._last_bucket_sweep = now
+
+    def _launch(self, op: _WriteOp, now: float) -> None:
+        self._method_bucket(op.method).take(now)
+        if op.peer is not None:
+            self._peer_bucket(op.peer).take(now)
+        self._busy_peers.add(op.peer)
+        self._active += 1
+        task = asyncio.create_task(self._run(op))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, op: _WriteOp) -> None:
+        try:
+            await op.job()
+        except FloodWaitError as e:
+            self.flood_waits += 1
+            logger.warning(
+                "flood_wait_backoff", seconds=e.seconds, method=op.method, peer=op.peer
+            )
+            self._parked[op.method] = max(
+                self._parked.get(op.method, 0.0), time.monotonic() + e.seconds
+            )
+            # Same priority and sequence number: retried ahead of newer ops
+            bisect.insort(self._pending, op)
+        except Exception as e:
+            logger.error(
+                "write_queue_operation_failed", error=repr(e), method=op.method
+            )
+        finally:
+            self._busy_peers.discard(op.peer)
+            self._active -= 1
+            self._wakeup.set()
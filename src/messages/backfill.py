@@ -0,0 +1,57 @@
+import asyncio
+
+from src.domain.ports import ChatRepository
+from src.infrastructure.logging import get_logger
+from src.messages.ports import MessageSearchIndex
+
+logger = get_logger(__name__)
+
+_PAGE_SIZE = 100
+
+
+async def job_search_backfill(
+    repository: ChatRepository,
+    search_index: MessageSearchIndex,
+    shutdown_event: asyncio.Event,
+    chats: int = 50,
+    pages: int = 1,
+    page_size: int = _PAGE_SIZE,
+) -> None:
+    """One-off task: index recent history of the most recent chats.
+
+    Live events only cover messages received while the app runs; this walks
+    `pages` history pages back from the newest message of each of the
+    `chats` most recent dialogs so search has something to find right away.
+    """
+    logger.info("search_backfill_started", chats=chats, pages=pages)
+    indexed = 0
+    try:
+        recent = await repository.get_chats(chats)
+    except Exception as e:
+        logger.error("search_backfill_failed", error=str(e))
+        return
+
+    for chat in recent:
+        offset_id = 0
+        for _ in range(pages):
+            if shutdown_event.is_set():
+                logger.info("search_backfill_interrupted", indexed=indexed)
+                return
+            try:
+                messages = await repository.get_messages(
+                    chat.id, limit=page_size, offset_id=offset_id
+                )
+                if not messages:
+                    break
+                await search_index.index_messages(
+                    chat.id, messages, chat_name=chat.name
+                )
+            except Exception as e:
+                logger.warning(
+                    "search_backfill_chat_failed", chat_id=chat.id, error=str(e)
+                )
+                break
+            indexed += len(messages)
+            offset_id = min(m.id for m in messages)
+
+    logger.info("search_backfill_finished", indexed=indexed)
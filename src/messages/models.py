@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Union
+
+from src.domain.models import Message, Reaction
+
+
+@dataclass(frozen=True)
+class MessageUpsert:
+    """A live message (new, or edited when edit is True)."""
+
+    chat_id: int
+    topic_id: Optional[int]
+    message: Message
+    edit: bool = False
+    chat_name: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class MessageDeletion:
+    chat_id: int
+    ids: List[int]
+
+
+@dataclass(frozen=True)
+class ReactionsUpdate:
+    chat_id: int
+    msg_id: int
+    reactions: List[Reaction]
+
+
+StoreOp = Union[MessageUpsert, MessageDeletion, ReactionsUpdate]
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    chat_id: int
+    msg_id: int
+    chat_name: Optional[str]
+    date: datetime
+    # HTML-escaped excerpt with matches wrapped in <mark>
+    snippet: str
+    rank: float
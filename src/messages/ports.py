@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.domain.models import Message
+from src.messages.models import SearchHit, StoreOp
+
+
+class MessageSink(ABC):
+    @abstractmethod
+    async def apply(self, ops: List[StoreOp]) -> None:
+        """Apply a batch of live changes in one transaction."""
+        pass
+
+
+class MessageStore(MessageSink):
+    @abstractmethod
+    async def get_page(
+        self, chat_id: int, limit: int, offset_id: int = 0
+    ) -> Optional[List[Message]]:
+        """Newest-first chat page below offset_id, or None if the local copy
+        may have gaps (the caller then falls back to the network)."""
+        pass
+
+    @abstractmethod
+    async def save_page(
+        self,
+        chat_id: int,
+        topic_id: Optional[int],
+        messages: List[Message],
+        offset_id: int,
+        limit: int,
+    ) -> None:
+        """Store a page fetched from Telegram, recording it as contiguous."""
+        pass
+
+    @abstractmethod
+    def reset_live_chats(self) -> None:
+        """Stop linking live messages to stored history until a fresh first
+        page is saved (call when live updates may have been missed)."""
+        pass
+
+
+class MessageSearchIndex(MessageSink):
+    @abstractmethod
+    async def index_messages(
+        self, chat_id: int, messages: List[Message], chat_name: Optional[str] = None
+    ) -> None:
+        """Add or refresh messages fetched from history (backfill)."""
+        pass
+
+    @abstractmethod
+    async def search(
+        self, query: str, chat_id: Optional[int] = None, limit: int = 20
+    ) -> List[SearchHit]:
+        """Best matches first (bm25)."""
+        pass
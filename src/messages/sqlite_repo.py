@@ -0,0 +1,417 @@
+import json
+import re
+from dataclasses import asdict
+from datetime import datetime
+from html import escape as html_escape
+from typing import Any, Dict, FrozenSet, List, Optional, Set
+
+from src.domain.models import Message, Reaction
+from src.infrastructure.db import BaseSqliteRepository
+from src.infrastructure.html import html_to_text
+from src.messages.models import (
+    MessageDeletion,
+    MessageUpsert,
+    ReactionsUpdate,
+    SearchHit,
+    StoreOp,
+)
+from src.messages.ports import MessageSearchIndex, MessageStore
+
+# prev_id value marking the first message of a chat
+_CHAT_START = 0
+
+_UPSERT_SQL = """
+    INSERT INTO messages (chat_id, id, topic_id, prev_id, date, data, reactions)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (chat_id, id) DO UPDATE SET
+        topic_id = COALESCE(excluded.topic_id, messages.topic_id),
+        prev_id = COALESCE(excluded.prev_id, messages.prev_id),
+        date = excluded.date,
+        data = excluded.data,
+        reactions = excluded.reactions
+"""
+
+
+def _message_data(message: Message) -> str:
+    data = asdict(message)
+    data.pop("reactions")
+    data.pop("album_parts")
+    data["date"] = message.date.isoformat()
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _reactions_data(reactions: List[Reaction]) -> str:
+    return json.dumps([asdict(r) for r in reactions], ensure_ascii=False)
+
+
+class SqliteMessageStore(BaseSqliteRepository, MessageStore):
+    """Local copy of chat history, filled from fetched pages and live events.
+
+    Every row remembers the id of the message before it (prev_id) when that
+    is known for certain: from a network page, or from a live message in a
+    chat whose newest message is already stored. A page is served locally
+    only if the prev_id links are unbroken, so gaps always go to Telegram.
+    """
+
+    def __init__(self, db_path: str = "data.db"):
+        super().__init__(db_path)
+        # Chats whose newest message is known to be stored, so live messages
+        # can be linked to it. In-memory and reset on every reconnect: after
+        # a restart or a connection gap, the first page of every chat comes
+        # from the network again.
+        self._live_chats: Set[int] = set()
+
+    def _row_to_message(self, row) -> Message:
+        data = json.loads(row["data"])
+        data["date"] = datetime.fromisoformat(data["date"])
+        reactions = [Reaction(**r) for r in json.loads(row["reactions"] or "[]")]
+        return Message(**data, reactions=reactions)
+
+    def reset_live_chats(self) -> None:
+        self._live_chats.clear()
+
+    async def get_page(
+        self, chat_id: int, limit: int, offset_id: int = 0
+    ) -> Optional[List[Message]]:
+        if not offset_id and chat_id not in self._live_chats:
+            return None
+
+        def _fetch():
+            with self._connect() as conn:
+                expected_top: Optional[int] = None
+                if offset_id:
+                    anchor = conn.execute(
+                        "SELECT prev_id FROM messages WHERE chat_id = ? AND id = ?",
+                        (chat_id, offset_id),
+                    ).fetchone()
+                    if anchor is None or anchor["prev_id"] is None:
+                        return None
+                    if anchor["prev_id"] == _CHAT_START:
+                        return []
+                    expected_top = anchor["prev_id"]
+
+                rows = conn.execute(
+                    """
+                    SELECT id, prev_id, data, reactions FROM messages
+                    WHERE chat_id = ? AND (? = 0 OR id < ?)
+                    ORDER BY id DESC LIMIT ?
+                    """,
+                    (chat_id, offset_id, offset_id, limit),
+                ).fetchall()
+
+                if not rows:
+                    return None
+                if expected_top is not None and rows[0]["id"] != expected_top:
+                    return None
+                for newer, older in zip(rows, rows[1:]):
+                    if newer["prev_id"] != older["id"]:
+                        return None
+                if len(rows) < limit and rows[-1]["prev_id"] != _CHAT_START:
+                    return None
+
+                messages = [self._row_to_message(r) for r in rows]
+                self._fill_replies(conn, chat_id, messages)
+                return messages
+
+        return await self._execute(_fetch)
+
+    def _fill_replies(self, conn, chat_id: int, messages: List[Message]) -> None:
+        # Live messages are parsed without their replied-to message; fill the
+        # quote from the store the same way MessageParser does for pages.
+        missing = {
+            m.reply_to_msg_id
+            for m in messages
+            if m.reply_to_msg_id and m.reply_to_text is None
+        }
+        if not missing:
+            return
+        placeholders = ",".join("?" * len(missing))
+        replied: Dict[int, Dict[str, Any]] = {
+            row["id"]: json.loads(row["data"])
+            for row in conn.execute(
+                f"SELECT id, data FROM messages WHERE chat_id = ? AND id IN ({placeholders})",
+                (chat_id, *missing),
+            )
+        }
+        for m in messages:
+            data = replied.get(m.reply_to_msg_id) if m.reply_to_msg_id else None
+            if data is not None and m.reply_to_text is None:
+                m.reply_to_text = data["text"] or "📷 Media"
+                m.reply_to_sender_name = data["sender_name"] or "User"
+
+    async def save_page(
+        self,
+        chat_id: int,
+        topic_id: Optional[int],
+        messages: List[Message],
+        offset_id: int,
+        limit: int,
+    ) -> None:
+        page = sorted(messages, key=lambda m: m.id, reverse=True)
+        if not page:
+            return
+
+        # Only chat-level pages are contiguous in the chat's prev_id chain
+        links: List[Optional[int]] = [None] * len(page)
+        if topic_id is None:
+            links = [older.id for older in page[1:]]
+            links.append(_CHAT_START if len(page) < limit else None)
+
+        params = [
+            (
+                chat_id,
+                m.id,
+                topic_id,
+                prev_id,
+                m.date.isoformat(),
+                _message_data(m),
+                _reactions_data(m.reactions),
+            )
+            for m, prev_id in zip(page, links)
+        ]
+
+        def _save():
+            with self._connect() as conn:
+                conn.executemany(_UPSERT_SQL, params)
+                if topic_id is None and offset_id:
+                    conn.execute(
+                        "UPDATE messages SET prev_id = ? WHERE chat_id = ? AND id = ?",
+                        (page[0].id, chat_id, offset_id),
+                    )
+
+        await self._execute_write(_save)
+        if topic_id is None and not offset_id:
+            self._live_chats.add(chat_id)
+
+    async def apply(self, ops: List[StoreOp]) -> None:
+        if not ops:
+            return
+        live_chats: FrozenSet[int] = frozenset(self._live_chats)
+
+        def _apply():
+            with self._connect() as conn:
+                for op in ops:
+                    if isinstance(op, MessageUpsert):
+                        self._apply_upsert(conn, op, live_chats)
+                    elif isinstance(op, MessageDeletion):
+                        self._apply_deletion(conn, op)
+                    elif isinstance(op, ReactionsUpdate):
+                        conn.execute(
+                            "UPDATE messages SET reactions = ? WHERE chat_id = ? AND id = ?",
+                            (_reactions_data(op.reactions), op.chat_id, op.msg_id),
+                        )
+
+        try:
+            await self._execute_write(_apply)
+        except Exception:
+            # Lost changes would otherwise be hidden behind a linked head
+            self._live_chats.difference_update(op.chat_id for op in ops)
+            raise
+
+    def _apply_upsert(
+        self, conn, op: MessageUpsert, live_chats: FrozenSet[int]
+    ) -> None:
+        m = op.message
+        if op.edit:
+            # Edits only refresh messages we already have
+            conn.execute(
+                "UPDATE messages SET date = ?, data = ?, reactions = ? WHERE chat_id = ? AND id = ?",
+                (
+                    m.date.isoformat(),
+                    _message_data(m),
+                    _reactions_data(m.reactions),
+                    op.chat_id,
+                    m.id,
+                ),
+            )
+            return
+
+        prev_id = None
+        if op.chat_id in live_chats:
+            row = conn.execute(
+                "SELECT MAX(id) AS id FROM messages WHERE chat_id = ? AND id < ?",
+                (op.chat_id, m.id),
+            ).fetchone()
+            prev_id = row["id"]
+        conn.execute(
+            _UPSERT_SQL,
+            (
+                op.chat_id,
+                m.id,
+                op.topic_id,
+                prev_id,
+                m.date.isoformat(),
+                _message_data(m),
+                _reactions_data(m.reactions),
+            ),
+        )
+
+    def _apply_deletion(self, conn, op: MessageDeletion) -> None:
+        for msg_id in op.ids:
+            # Re-link the successor to the deleted message's predecessor
+            conn.execute(
+                """
+                UPDATE messages SET prev_id = (
+                    SELECT prev_id FROM messages WHERE chat_id = ? AND id = ?
+                )
+                WHERE chat_id = ? AND prev_id = ?
+                """,
+                (op.chat_id, msg_id, op.chat_id, msg_id),
+            )
+            conn.execute(
+                "DELETE FROM messages WHERE chat_id = ? AND id = ?",
+                (op.chat_id, msg_id),
+            )
+
+
+# Private-use markers around matches; swapped for <mark> after escaping
+_MARK_OPEN = "\ue000"
+_MARK_CLOSE = "\ue001"
+_SNIPPET_TOKENS = 12
+
+_QUERY_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def _fts_query(query: str) -> Optional[str]:
+    """Safe FTS5 query: every word must match, the last one as a prefix."""
+    tokens = _QUERY_TOKEN.findall(query)
+    if not tokens:
+        return None
+    quoted = [f'"{t}"' for t in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _searchable_text(message: Message) -> str:
+    parts = [html_to_text(message.text)]
+    if message.poll_question:
+        parts.append(message.poll_question)
+    if message.audio_title:
+        parts.append(message.audio_title)
+    return "\n".join(p for p in parts if p)
+
+
+class SqliteMessageSearchIndex(BaseSqliteRepository, MessageSearchIndex):
+    """FTS5 full-text index over received messages.
+
+    search_docs holds the message identity and metadata; message_fts holds
+    the plain text under the same rowid, so upserts and deletes are primary
+    key lookups instead of scans of UNINDEXED FTS columns.
+    """
+
+    def __init__(self, db_path: str = "data.db"):
+        super().__init__(db_path)
+
+    def _upsert(
+        self, conn, chat_id: int, message: Message, chat_name: Optional[str]
+    ) -> None:
+        text = _searchable_text(message)
+        row = conn.execute(
+            "SELECT rowid FROM search_docs WHERE chat_id = ? AND msg_id = ?",
+            (chat_id, message.id),
+        ).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM message_fts WHERE rowid = ?", (row["rowid"],))
+            if not text:
+                conn.execute("DELETE FROM search_docs WHERE rowid = ?", (row["rowid"],))
+                return
+            conn.execute(
+                """
+                UPDATE search_docs SET chat_name = COALESCE(?, chat_name), date = ?
+                WHERE rowid = ?
+                """,
+                (chat_name, message.date.isoformat(), row["rowid"]),
+            )
+            rowid = row["rowid"]
+        else:
+            if not text:
+                return
+            rowid = conn.execute(
+                """
+                INSERT INTO search_docs (chat_id, msg_id, chat_name, date)
+                VALUES (?, ?, ?, ?)
+                """,
+                (chat_id, message.id, chat_name, message.date.isoformat()),
+            ).lastrowid
+        conn.execute(
+            "INSERT INTO message_fts (rowid, text) VALUES (?, ?)", (rowid, text)
+        )
+
+    def _delete(self, conn, chat_id: int, msg_id: int) -> None:
+        row = conn.execute(
+            "SELECT rowid FROM search_docs WHERE chat_id = ? AND msg_id = ?",
+            (chat_id, msg_id),
+        ).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM message_fts WHERE rowid = ?", (row["rowid"],))
+            conn.execute("DELETE FROM search_docs WHERE rowid = ?", (row["rowid"],))
+
+    async def apply(self, ops: List[StoreOp]) -> None:
+        def _apply():
+            with self._connect() as conn:
+                for op in ops:
+                    if isinstance(op, MessageUpsert):
+                        self._upsert(conn, op.chat_id, op.message, op.chat_name)
+                    elif isinstance(op, MessageDeletion):
+                        for msg_id in op.ids:
+                            self._delete(conn, op.chat_id, msg_id)
+
+        if ops:
+            await self._execute_write(_apply)
+
+    async def index_messages(
+        self, chat_id: int, messages: List[Message], chat_name: Optional[str] = None
+    ) -> None:
+        def _index():
+            with self._connect() as conn:
+                for message in messages:
+                    self._upsert(conn, chat_id, message, chat_name)
+
+        if messages:
+            await self._execute_write(_index)
+
+    async def search(
+        self, query: str, chat_id: Optional[int] = None, limit: int = 20
+    ) -> List[SearchHit]:
+        match = _fts_query(query)
+        if match is None:
+            return []
+
+        def _search():
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    """
+                    SELECT d.chat_id, d.msg_id, d.chat_name, d.date,
+                           snippet(message_fts, 0, ?, ?, '…', ?) AS snippet,
+                           bm25(message_fts) AS rank
+                    FROM message_fts
+                    JOIN search_docs d ON d.rowid = message_fts.rowid
+                    WHERE message_fts MATCH ? AND (? IS NULL OR d.chat_id = ?)
+                    ORDER BY rank
+                    LIMIT ?
+                    """,
+                    (
+                        _MARK_OPEN,
+                        _MARK_CLOSE,
+                        _SNIPPET_TOKENS,
+                        match,
+                        chat_id,
+                        chat_id,
+                        limit,
+                    ),
+                )
+                return [
+                    SearchHit(
+                        chat_id=row["chat_id"],
+                        msg_id=row["msg_id"],
+                        chat_name=row["chat_name"],
+                        date=datetime.fromisoformat(row["date"]),
+                        snippet=html_escape(row["snippet"])
+                        .replace(_MARK_OPEN, "<mark>")
+                        .replace(_MARK_CLOSE, "</mark>"),
+                        rank=row["rank"],
+                    )
+                    for row in cursor
+                ]
+
+        return await self._execute(_search)
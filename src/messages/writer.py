@@ -0,0 +1,98 @@
+import asyncio
+from typing import List, Optional, Sequence
+
+from src.domain.models import SystemEvent
+from src.infrastructure.logging import get_logger
+from src.messages.models import (
+    MessageDeletion,
+    MessageUpsert,
+    ReactionsUpdate,
+    StoreOp,
+)
+from src.messages.ports import MessageSink
+
+logger = get_logger(__name__)
+
+_FLUSH_INTERVAL = 0.5
+_MAX_BATCH = 200
+
+
+class MessageStoreWriter:
+    """Write-behind from the event stream into local message sinks.
+
+    handle_event is an EventBus subscriber that only buffers; run() flushes
+    the buffer into every sink (message store, search index) in one
+    transaction each, every flush_interval seconds or as soon as max_batch
+    changes have piled up.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence[MessageSink],
+        flush_interval: float = _FLUSH_INTERVAL,
+        max_batch: int = _MAX_BATCH,
+    ) -> None:
+        self._sinks = list(sinks)
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._buffer: List[StoreOp] = []
+        self._wakeup = asyncio.Event()
+
+    async def handle_event(self, event: SystemEvent) -> None:
+        op = self._to_op(event)
+        if op is None:
+            return
+        self._buffer.append(op)
+        if len(self._buffer) >= self._max_batch:
+            self._wakeup.set()
+
+    @staticmethod
+    def _to_op(event: SystemEvent) -> Optional[StoreOp]:
+        msg = event.message_model
+        if not event.chat_id or msg is None:
+            return None
+        if event.type in ("message", "action"):
+            return MessageUpsert(
+                event.chat_id, event.topic_id, msg, chat_name=event.chat_name
+            )
+        if event.type == "edited":
+            return MessageUpsert(
+                event.chat_id,
+                event.topic_id,
+                msg,
+                edit=True,
+                chat_name=event.chat_name,
+            )
+        if event.type == "deleted":
+            return MessageDeletion(event.chat_id, event.deleted_ids or [msg.id])
+        if event.type == "reaction_update":
+            return ReactionsUpdate(event.chat_id, msg.id, msg.reactions)
+        return None
+
+    async def flush(self) -> None:
+        ops, self._buffer = self._buffer, []
+        if not ops:
+            return
+        for sink in self._sinks:
+            try:
+                await sink.apply(ops)
+            except Exception as e:
+                logger.error(
+                    "message_store_flush_failed",
+                    sink=type(sink).__name__,
+                    ops=len(ops),
+                    error=str(e),
+                )
+
+    async def run(self, shutdown_event: asyncio.Event) -> None:
+        """Background task: flush periodically until shutdown, then once more."""
+        while not shutdown_event.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self._flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+        await self.flush()
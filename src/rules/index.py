@@ -0,0 +1,58 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.rules.models import Rule, RuleType
+
+RuleKey = Tuple[int, Optional[int], RuleType]
+
+
+class RuleIndex:
+    """In-memory view of all rules keyed by (chat_id, topic_id, rule_type).
+
+    Lookups are plain dict probes so the message hot path never touches SQLite.
+    The index is filled with replace_all() and kept current by the RuleService
+    write paths (write-through), so it is never stale relative to the DB.
+    """
+
+    def __init__(self) -> None:
+        self._rules: Dict[RuleKey, Rule] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    @staticmethod
+    def _key(rule: Rule) -> RuleKey:
+        return (rule.chat_id, rule.topic_id, rule.rule_type)
+
+    def replace_all(self, rules: Iterable[Rule]) -> None:
+        """Swap in a complete rule set in one assignment."""
+        self._rules = {self._key(r): r for r in rules}
+        self.loaded = True
+
+    def put(self, rule: Rule) -> None:
+        self._rules[self._key(rule)] = rule
+
+    def remove(self, rule: Rule) -> None:
+        self._rules.pop(self._key(rule), None)
+
+    def remove_by_id(self, rule_id: int) -> Optional[Rule]:
+        key = next((k for k, r in self._rules.items() if r.id == rule_id), None)
+        if key is None:
+            return None
+        return self._rules.pop(key)
+
+    def get(
+        self, chat_id: int, topic_id: Optional[int], rule_type: RuleType
+    ) -> Optional[Rule]:
+        """Exact-scope lookup (no topic -> chat fallback)."""
+        return self._rules.get((chat_id, topic_id, rule_type))
+
+    def resolve(
+        self, chat_id: int, topic_id: Optional[int], rule_type: RuleType
+    ) -> Optional[Rule]:
+        """Effective rule for a scope. Priority: Specific Topic > Global."""
+        if topic_id is not None:
+            specific = self._rules.get((chat_id, topic_id, rule_type))
+            if specific:
+                return specific
+        return self._rules.get((chat_id, None, rule_type))
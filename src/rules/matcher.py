@@ -0,0 +1,69 @@
+import re
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Pattern
+
+from src.domain.models import Message
+from src.infrastructure.logging import get_logger
+from src.users.models import User
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class GlobalAutoreadMatcher:
+    """Global autoread settings compiled once per User snapshot.
+
+    Matching a message only reads precomputed fields: no string splitting,
+    no regex cache lookups and no re.error per message.
+    """
+
+    service_messages: bool = False
+    polls: bool = False
+    self_messages: bool = False
+    bot_usernames: FrozenSet[str] = frozenset()
+    regex: Optional[Pattern[str]] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "GlobalAutoreadMatcher":
+        bots = frozenset(
+            b.strip().lstrip("@").lower()
+            for b in (user.autoread_bots or "").split(",")
+            if b.strip()
+        )
+
+        regex = None
+        if user.autoread_regex:
+            try:
+                regex = re.compile(user.autoread_regex, re.IGNORECASE)
+            except re.error as e:
+                logger.warning("autoread_regex_invalid", error=str(e))
+
+        return cls(
+            service_messages=user.autoread_service_messages,
+            polls=user.autoread_polls,
+            self_messages=user.autoread_self,
+            bot_usernames=bots,
+            regex=regex,
+        )
+
+    def match(self, message: Message) -> str:
+        """Return the global rule reason that matches message, or ""."""
+        if self.service_messages and message.is_service:
+            return "global_service_msg"
+
+        if self.polls and message.is_poll:
+            return "global_poll"
+
+        if self.self_messages and message.is_outgoing:
+            return "global_self"
+
+        if self.bot_usernames and message.sender_username:
+            sender_username = message.sender_username.lower()
+            if sender_username in self.bot_usernames:
+                return f"global_bot_{sender_username}"
+
+        if self.regex is not None and message.text:
+            if self.regex.search(message.text):
+                return "global_regex"
+
+        return ""
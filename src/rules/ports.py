@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from src.rules.models import Rule
 
@@ -36,3 +36,30 @@ class RuleRepository(ABC):
     async def delete_all(self) -> None:
         """Delete all rules from the database."""
         pass
+
+    @abstractmethod
+    async def replace_all(self, rules: List[Rule]) -> None:
+        """Atomically replace every stored rule with the given set."""
+        pass
+
+    @abstractmethod
+    async def apply_diff(
+        self,
+        inserts: Sequence[Rule],
+        updates: Sequence[Rule],
+        delete_ids: Sequence[int],
+    ) -> None:
+        """Apply inserts, config updates and deletes in a single transaction."""
+        pass
+
+
+class SyncStateRepository(ABC):
+    """Small key/value store for remote sync bookkeeping (ETag, content hash)."""
+
+    @abstractmethod
+    async def get_value(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    async def set_values(self, values: Dict[str, Optional[str]]) -> None:
+        pass
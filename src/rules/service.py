@@ -1,15 +1,25 @@
-import re
+import asyncio
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.ai.batching import BatchingClassifier
 from src.ai.gemini import GeminiClassifier
-from src.ai.ports import AIClassifier
-from src.domain.models import ActionLog, ChatType, Message, SystemEvent
+from src.ai.local_gate import LocalGateClassifier
+from src.ai.local_model import LocalAdModel
+from src.ai.near_duplicate import NearDuplicateClassifier
+from src.ai.ports import AIClassifier, VerdictCache
+from src.ai.verdict_cache import CachingClassifier
+from src.domain.models import ActionLog, Chat, ChatType, Message, SystemEvent
 from src.domain.ports import ActionRepository, ChatRepository
 from src.infrastructure.logging import get_logger
+from src.infrastructure.tasks import BoundedTaskPool
+from src.infrastructure.telegram_queue import PRIORITY_BACKGROUND, write_priority
 from src.rules.decisions import ReactDecision, ReadDecision
+from src.rules.index import RuleIndex
+from src.rules.matcher import GlobalAutoreadMatcher
 from src.rules.models import Rule, RuleType
 from src.rules.ports import RuleRepository
 from src.users.models import User
@@ -19,6 +29,21 @@ logger = get_logger(__name__)
 
 AIClassifierFactory = Callable[[User], AIClassifier]
 
+# Concurrent Telegram lookups (unread topics, last messages) during startup scan
+_STARTUP_SCAN_CONCURRENCY = 8
+
+# Texts left unread by the AI check, kept per (chat, topic) until a manual read
+_UNREAD_AI_TEXTS_PER_CHAT = 20
+_UNREAD_AI_CHATS = 200
+
+# Background AI verdicts (async mode): concurrent classifications and backlog
+_AI_ASYNC_CONCURRENCY = 8
+_AI_ASYNC_MAX_PENDING = 500
+_AI_ASYNC_DRAIN_TIMEOUT = 3.0
+
+# Reloads retried when a write-through lands while the rules are being read
+_LOAD_RULES_ATTEMPTS = 3
+
 
 class RuleService:
     def __init__(
@@ -28,6 +53,9 @@ class RuleService:
         chat_repo: ChatRepository,
         user_repo: UserRepository,
         ai_classifier_factory: Optional[AIClassifierFactory] = None,
+        verdict_cache: Optional[VerdictCache] = None,
+        local_model: Optional[LocalAdModel] = None,
+        ai_async: bool = False,
     ):
         self.rule_repo = rule_repo
         self.action_repo = action_repo
@@ -36,44 +64,96 @@ class RuleService:
         self._ai_classifier_factory = (
             ai_classifier_factory or self._create_ai_classifier
         )
+        self._verdict_cache = verdict_cache
+        self._local_model = local_model
+        self._local_gate: Optional[LocalGateClassifier] = None
+        self._near_duplicate: Optional[NearDuplicateClassifier] = None
+        self._unread_ai_texts: OrderedDict[Tuple[int, Optional[int]], List[str]] = (
+            OrderedDict()
+        )
+        # Async mode: AI verdicts run after the event is dispatched
+        self._ai_pool: Optional[BoundedTaskPool] = (
+            BoundedTaskPool(
+                logger,
+                "ai_verdicts",
+                concurrency=_AI_ASYNC_CONCURRENCY,
+                max_pending=_AI_ASYNC_MAX_PENDING,
+            )
+            if ai_async
+            else None
+        )
         self._ai_classifier: Optional[AIClassifier] = None
         self._ai_classifier_key: Optional[Tuple[str, str, Optional[str]]] = None
 
+        # Compiled rule lookup; loaded once, then kept current by write paths
+        self._rule_index = RuleIndex()
+        # Bumped on every write-through, so a reload can detect a snapshot
+        # taken before a concurrent write
+        self._rule_generation = 0
+
+        # Global autoread matcher, rebuilt only when the User snapshot changes
+        self._global_matcher: Optional[GlobalAutoreadMatcher] = None
+        self._global_matcher_user: Optional[User] = None
+
         # Cache for deduplicating album reactions: (chat_id, grouped_id) -> timestamp
         self._album_reaction_cache: Dict[Tuple[int, int], float] = {}
 
     def _create_ai_classifier(self, user: User) -> AIClassifier:
         key = (user.ai_api_key or "", user.ai_model or "", user.ai_prompt)
         if self._ai_classifier_key != key or self._ai_classifier is None:
-            self._ai_classifier = GeminiClassifier(
-                api_key=key[0],
-                model=key[1],
-                prompt=key[2],
+            # Concurrent messages share one Gemini request
+            classifier: AIClassifier = BatchingClassifier(
+                GeminiClassifier(
+                    api_key=key[0],
+                    model=key[1],
+                    prompt=key[2],
+                )
             )
+            # Variants of a recently detected ad reuse its verdict
+            classifier = self._near_duplicate = NearDuplicateClassifier(classifier)
+            # Cross-posted copies of a message are classified once
+            if self._verdict_cache is not None:
+                classifier = CachingClassifier(
+                    classifier, self._verdict_cache, model=key[1], prompt=key[2]
+                )
+            # Confident cases are decided offline by the local model. It sits
+            # outermost so its verdicts are never cached or reused as known ads
+            self._local_gate = None
+            if self._local_model is not None:
+                classifier = self._local_gate = LocalGateClassifier(
+                    classifier, self._local_model
+                )
+            self._ai_classifier = classifier
             self._ai_classifier_key = key
         return self._ai_classifier
 
+    async def load_rules(self) -> None:
+        """(Re)build the in-memory rule index from the repository.
+
+        A snapshot read while a toggle was written through is discarded and
+        read again, so the reload cannot undo that write.
+        """
+        for _ in range(_LOAD_RULES_ATTEMPTS):
+            generation = self._rule_generation
+            rules = await self.rule_repo.get_all()
+            if generation == self._rule_generation:
+                self._rule_index.replace_all(rules)
+                logger.info("rule_index_loaded", rule_count=len(self._rule_index))
+                return
+        if not self._rule_index.loaded:
+            # Lookups need some index; the latest snapshot is the best there is
+            self._rule_index.replace_all(rules)
+        logger.warning("rule_index_reload_skipped", attempts=_LOAD_RULES_ATTEMPTS)
+
+    async def _ensure_rules_loaded(self) -> None:
+        if not self._rule_index.loaded:
+            await self.load_rules()
+
     async def get_rule(
         self, chat_id: int, topic_id: Optional[int], rule_type: RuleType
     ) -> Optional[Rule]:
-        rules = await self.rule_repo.get_by_chat_and_topic(chat_id, topic_id)
-        # Priority: Specific Topic > Global
-        if topic_id is not None:
-            specific = next(
-                (
-                    r
-                    for r in rules
-                    if r.topic_id == topic_id and r.rule_type == rule_type
-                ),
-                None,
-            )
-            if specific:
-                return specific
-
-        global_rule = next(
-            (r for r in rules if r.topic_id is None and r.rule_type == rule_type), None
-        )
-        return global_rule
+        await self._ensure_rules_loaded()
+        return self._rule_index.resolve(chat_id, topic_id, rule_type)
 
     async def is_autoread_enabled(
         self, chat_id: int, topic_id: Optional[int] = None
@@ -87,37 +167,27 @@ class RuleService:
         if unread_count > 1:
             return ""
 
-        user = await self.user_repo.get_user(1)
-        if not user:
+        matcher = await self.get_global_autoread_matcher()
+        if matcher is None:
             return ""
+        return matcher.match(message)
 
-        if user.autoread_service_messages and message.is_service:
-            return "global_service_msg"
-
-        if user.autoread_polls and message.is_poll:
-            return "global_poll"
-
-        if user.autoread_self and message.is_outgoing:
-            return "global_self"
-
-        if user.autoread_bots:
-            bots_input = [b.strip() for b in user.autoread_bots.split(",") if b.strip()]
-            target_usernames = {b.lstrip("@").lower() for b in bots_input}
-
-            sender_username = (message.sender_username or "").lower()
-            if sender_username and sender_username in target_usernames:
-                return f"global_bot_{sender_username}"
-
-        if user.autoread_regex and message.text:
-            try:
-                if re.search(user.autoread_regex, message.text, re.IGNORECASE):
-                    return "global_regex"
-            except re.error:
-                pass
-
-        return ""
+    async def get_global_autoread_matcher(self) -> Optional[GlobalAutoreadMatcher]:
+        """Matcher for the current User settings; None when there is no user."""
+        user = await self.user_repo.get_user(1)
+        if not user:
+            return None
+        if self._global_matcher is None or self._global_matcher_user is not user:
+            self._global_matcher = GlobalAutoreadMatcher.from_user(user)
+            self._global_matcher_user = user
+        return self._global_matcher
 
     async def handle_new_message_event(self, event: SystemEvent):
+        # Automatic reads/reactions yield to user-initiated Telegram writes
+        with write_priority(PRIORITY_BACKGROUND):
+            await self._handle_new_message_event(event)
+
+    async def _handle_new_message_event(self, event: SystemEvent):
         # Strict type guard: we can only process events with a valid chat_id
         if not event.chat_id:
             return
@@ -126,29 +196,55 @@ class RuleService:
             return
 
         msg = event.message_model
-        decision = await self.get_read_decision(event, msg)
+        if self._ai_pool is None:
+            decision = await self.get_read_decision(event, msg)
+        else:
+            decision = await self._get_rule_read_decision(event, msg)
+            if not decision.should_read:
+                await self._submit_ai_verdict(self._ai_pool, event, msg)
 
         if decision.should_read:
-            await self.chat_repo.mark_as_read(
-                event.chat_id, event.topic_id, max_id=decision.max_id
-            )
+            await self._autoread(event, decision.reason, decision.max_id)
             event.is_read = True
 
-            await self.action_repo.add_log(
-                ActionLog(
-                    action="autoread",
-                    chat_id=event.chat_id,
-                    chat_name=event.chat_name,
-                    reason=decision.reason,
-                    date=datetime.now(),
-                    link=event.link,
-                )
-            )
-
         # --- AutoReact Logic ---
         await self.apply_autoreact(event.chat_id, event.topic_id, msg)
 
+    async def _autoread(
+        self, event: SystemEvent, reason: str, max_id: Optional[int]
+    ) -> None:
+        # The read covers earlier messages too; nobody read those by hand
+        self._unread_ai_texts.pop((event.chat_id, event.topic_id), None)
+        await self.chat_repo.mark_as_read(event.chat_id, event.topic_id, max_id=max_id)
+
+        await self.action_repo.add_log(
+            ActionLog(
+                action="autoread",
+                chat_id=event.chat_id,
+                chat_name=event.chat_name,
+                reason=reason,
+                date=datetime.now(),
+                link=event.link,
+            )
+        )
+
     async def get_read_decision(self, event: SystemEvent, msg: Message) -> ReadDecision:
+        decision = await self._get_rule_read_decision(event, msg)
+        if decision.should_read:
+            return decision
+
+        classifier = await self._get_ai_classifier_for(event, msg)
+        if classifier is not None:
+            reason = await self._get_ai_read_reason(event, msg, classifier)
+            if reason:
+                return ReadDecision(True, reason, max_id=msg.id)
+
+        return ReadDecision(False)
+
+    async def _get_rule_read_decision(
+        self, event: SystemEvent, msg: Message
+    ) -> ReadDecision:
+        """Read decision from autoread rules and global matchers (no AI)."""
         if await self.is_autoread_enabled(event.chat_id, event.topic_id):
             return ReadDecision(True, "autoread_rule", max_id=msg.id)
 
@@ -156,24 +252,65 @@ class RuleService:
         if reason:
             return ReadDecision(True, reason, max_id=msg.id)
 
-        reason = await self._get_ai_read_reason(event, msg)
-        if reason:
-            return ReadDecision(True, reason, max_id=msg.id)
-
         return ReadDecision(False)
 
-    async def _get_ai_read_reason(self, event: SystemEvent, msg: Message) -> str:
+    async def _get_ai_classifier_for(
+        self, event: SystemEvent, msg: Message
+    ) -> Optional[AIClassifier]:
+        """Classifier to check msg with, or None when the AI check does not apply."""
         if not await self.is_ai_autoread_enabled(event.chat_id, event.topic_id):
-            return ""
+            return None
 
         user = await self.user_repo.get_user(1)
         if not user or not user.ai_api_key or not user.ai_model or not msg.text:
-            return ""
+            return None
+
+        return self._ai_classifier_factory(user)
+
+    async def _submit_ai_verdict(
+        self, pool: BoundedTaskPool, event: SystemEvent, msg: Message
+    ) -> None:
+        classifier = await self._get_ai_classifier_for(event, msg)
+        if classifier is None:
+            return
+
+        submitted = time.monotonic()
+
+        async def _verdict() -> None:
+            reason = await self._get_ai_read_reason(event, msg, classifier)
+            logger.info(
+                "ai_async_verdict",
+                chat_id=event.chat_id,
+                msg_id=msg.id,
+                is_ad=bool(reason),
+                seconds=round(time.monotonic() - submitted, 3),
+            )
+            if reason:
+                await self._autoread(event, reason, msg.id)
+
+        # The job inherits this context, so its writes stay background priority
+        if not pool.submit(_verdict):
+            logger.warning(
+                "ai_async_verdict_rejected",
+                chat_id=event.chat_id,
+                msg_id=msg.id,
+                **pool.stats(),
+            )
 
+    async def _get_ai_read_reason(
+        self, event: SystemEvent, msg: Message, classifier: AIClassifier
+    ) -> str:
         try:
-            classifier = self._ai_classifier_factory(user)
-            if await classifier.classify_is_ad(msg.text):
+            decided_locally = False
+            if isinstance(classifier, LocalGateClassifier):
+                is_ad, decided_locally = await classifier.classify_with_source(msg.text)
+            else:
+                is_ad = await classifier.classify_is_ad(msg.text)
+            if is_ad:
                 return "ai_ad_detected"
+            # The local model must not be trained on its own verdicts
+            if not decided_locally:
+                self._remember_unread_ai_text(event.chat_id, event.topic_id, msg.text)
         except Exception as e:
             logger.warning(
                 "ai_classification_failed",
@@ -182,6 +319,60 @@ class RuleService:
             )
         return ""
 
+    def _remember_unread_ai_text(
+        self, chat_id: int, topic_id: Optional[int], text: str
+    ) -> None:
+        if self._local_model is None:
+            return
+        key = (chat_id, topic_id)
+        texts = self._unread_ai_texts.setdefault(key, [])
+        texts.append(text)
+        del texts[:-_UNREAD_AI_TEXTS_PER_CHAT]
+        self._unread_ai_texts.move_to_end(key)
+        while len(self._unread_ai_texts) > _UNREAD_AI_CHATS:
+            self._unread_ai_texts.popitem(last=False)
+
+    async def record_manual_read(
+        self, chat_id: int, topic_id: Optional[int] = None
+    ) -> None:
+        """Train the local model on a chat the user read by hand.
+
+        Messages the AI check left unread and the user then read themselves
+        are learned as non-ads. A whole-chat read (topic_id None) covers
+        every topic of the chat.
+        """
+        if self._local_model is None:
+            return
+        keys = [
+            k
+            for k in self._unread_ai_texts
+            if k[0] == chat_id and (topic_id is None or k[1] == topic_id)
+        ]
+        texts = [t for k in keys for t in self._unread_ai_texts.pop(k)]
+        if not texts:
+            return
+        await self._local_model.learn_many(texts, [False] * len(texts))
+        logger.info("ai_local_model_manual_feedback", chat_id=chat_id, texts=len(texts))
+
+    def ai_stats(self) -> Dict[str, Dict[str, float]]:
+        """Counters of the AI stages (local gate, near-duplicates, async pool)."""
+        stats: Dict[str, Dict[str, float]] = {}
+        if self._local_gate is not None:
+            stats["local_gate"] = self._local_gate.stats()
+        if self._near_duplicate is not None:
+            stats["near_duplicate"] = self._near_duplicate.stats()
+        if self._ai_pool is not None:
+            stats["async_verdicts"] = self._ai_pool.stats()
+        return stats
+
+    async def shutdown(self, timeout: float = _AI_ASYNC_DRAIN_TIMEOUT) -> None:
+        """Let background AI verdicts finish for up to timeout, then cancel.
+
+        Messages whose verdict was cancelled simply stay unread.
+        """
+        if self._ai_pool is not None:
+            await self._ai_pool.shutdown(timeout)
+
     async def apply_autoreact(
         self, chat_id: int, topic_id: Optional[int], message: Message
     ):
@@ -238,97 +429,147 @@ class RuleService:
         return ReactDecision(True, emoji)
 
     async def run_startup_scan(self):
+        with write_priority(PRIORITY_BACKGROUND):
+            await self._run_startup_scan()
+
+    async def _run_startup_scan(self):
+        """Batched scan: rules and global matchers are evaluated in memory,
+        network lookups run concurrently (bounded), and the resulting reads and
+        action logs are submitted as one batch each.
+        """
         if not self.chat_repo.is_connected():
             return
 
         try:
             unread_chats = await self.chat_repo.get_all_unread_chats()
             total = len(unread_chats)
-            chats_read = 0
 
             logger.info(
                 "startup_scan_started",
                 total_unread_chats=total,
             )
 
-            for chat in unread_chats:
-                try:
-                    if chat.unread_count == 0:
-                        continue
-
-                    if chat.type == ChatType.FORUM:
-                        topics = await self.chat_repo.get_unread_topics(chat.id)
-                        for topic in topics:
-                            if await self.is_autoread_enabled(chat.id, topic.id):
-                                await self.chat_repo.mark_as_read(chat.id, topic.id)
-                                chats_read += 1
-                                await self.action_repo.add_log(
-                                    ActionLog(
-                                        action="startup_read",
-                                        chat_id=chat.id,
-                                        chat_name=f"{chat.name} (Topic {topic.name})",
-                                        reason="autoread_rule_startup",
-                                        date=datetime.now(),
-                                        link=f"/forum/{chat.id}",
-                                    )
-                                )
-                            else:
-                                logger.info(
-                                    "startup_scan_chat_skipped",
-                                    chat_id=chat.id,
-                                    chat_name=chat.name,
-                                    topic_id=topic.id,
-                                )
+            await self._ensure_rules_loaded()
+            pending = [c for c in unread_chats if c.unread_count != 0]
+            forums = [c for c in pending if c.type == ChatType.FORUM]
+            chats = [c for c in pending if c.type != ChatType.FORUM]
+
+            targets: List[Tuple[int, Optional[int]]] = []
+            logs: List[ActionLog] = []
+
+            def _read(chat_id, topic_id, chat_name, reason, link):
+                targets.append((chat_id, topic_id))
+                logs.append(
+                    ActionLog(
+                        action="startup_read",
+                        chat_id=chat_id,
+                        chat_name=chat_name,
+                        reason=reason,
+                        date=datetime.now(),
+                        link=link,
+                    )
+                )
+
+            topics_per_forum = await self._gather_bounded(
+                forums, lambda c: self.chat_repo.get_unread_topics(c.id)
+            )
+            for chat, topics in zip(forums, topics_per_forum):
+                for topic in topics or []:
+                    if self._rule_index.resolve(chat.id, topic.id, RuleType.AUTOREAD):
+                        _read(
+                            chat.id,
+                            topic.id,
+                            f"{chat.name} (Topic {topic.name})",
+                            "autoread_rule_startup",
+                            f"/forum/{chat.id}",
+                        )
                     else:
-                        should_read = False
-                        reason = ""
-                        if await self.is_autoread_enabled(chat.id):
-                            should_read = True
-                            reason = "autoread_rule_startup"
-                        elif chat.unread_count == 1:
-                            msgs = await self.chat_repo.get_messages(chat.id, limit=1)
-                            if msgs:
-                                msg = msgs[0]
-                                reason = await self.check_global_autoread_rules(
-                                    msg, chat.unread_count
-                                )
-                                if reason:
-                                    should_read = True
-                        if should_read:
-                            await self.chat_repo.mark_as_read(chat.id)
-                            chats_read += 1
-                            await self.action_repo.add_log(
-                                ActionLog(
-                                    action="startup_read",
-                                    chat_id=chat.id,
-                                    chat_name=chat.name,
-                                    reason=reason,
-                                    date=datetime.now(),
-                                    link=f"/chat/{chat.id}",
-                                )
-                            )
-                        else:
-                            logger.info(
-                                "startup_scan_chat_skipped",
-                                chat_id=chat.id,
-                                chat_name=chat.name,
-                            )
-                except Exception as e:
-                    logger.warning(
-                        "startup_scan_chat_failed",
+                        logger.info(
+                            "startup_scan_chat_skipped",
+                            chat_id=chat.id,
+                            chat_name=chat.name,
+                            topic_id=topic.id,
+                        )
+
+            # Global rules only apply to single unread messages
+            matcher = await self.get_global_autoread_matcher()
+            candidates = []
+            for chat in chats:
+                if self._rule_index.resolve(chat.id, None, RuleType.AUTOREAD):
+                    _read(
+                        chat.id,
+                        None,
+                        chat.name,
+                        "autoread_rule_startup",
+                        f"/chat/{chat.id}",
+                    )
+                elif matcher is not None and chat.unread_count == 1:
+                    candidates.append(chat)
+                else:
+                    logger.info(
+                        "startup_scan_chat_skipped",
                         chat_id=chat.id,
                         chat_name=chat.name,
-                        error=repr(e),
                     )
 
+            # The dialog listing usually carries the last message already
+            to_fetch = [c for c in candidates if c.last_message is None]
+            fetched = await self._gather_bounded(
+                to_fetch, lambda c: self.chat_repo.get_messages(c.id, limit=1)
+            )
+            last_messages = dict(zip((c.id for c in to_fetch), fetched))
+            for chat in candidates:
+                msgs = (
+                    [chat.last_message]
+                    if chat.last_message is not None
+                    else last_messages[chat.id]
+                )
+                reason = matcher.match(msgs[0]) if matcher and msgs else ""
+                if reason:
+                    _read(chat.id, None, chat.name, reason, f"/chat/{chat.id}")
+                else:
+                    logger.info(
+                        "startup_scan_chat_skipped",
+                        chat_id=chat.id,
+                        chat_name=chat.name,
+                    )
+
+            if targets:
+                await self.chat_repo.mark_many_as_read(targets)
+                await self.action_repo.add_logs(logs)
+
             logger.info(
                 "startup_scan_completed",
                 chats_processed=total,
-                chats_read=chats_read,
+                chats_read=len(targets),
             )
         except Exception as e:
             logger.warning("startup_scan_failed", error=repr(e))
 
+    async def _gather_bounded(
+        self, chats: List[Chat], fetch: Callable[[Chat], Awaitable[Any]]
+    ) -> List[Any]:
+        """fetch() for every chat, at most _STARTUP_SCAN_CONCURRENCY at a time.
+
+        Results keep the order of chats; a failed fetch is logged and yields None.
+        """
+        semaphore = asyncio.Semaphore(_STARTUP_SCAN_CONCURRENCY)
+
+        async def _one(chat: Chat) -> Any:
+            async with semaphore:
+                try:
+                    return await fetch(chat)
+                except Exception as e:
+                    logger.warning(
+                        "startup_scan_chat_failed",
+                        chat_id=chat.id,
+                        chat_name=chat.name,
+                        error=repr(e),
+                    )
+                    return None
+
+        return await asyncio.gather(*(_one(c) for c in chats))
+
     async def toggle_ai_autoread(
         self, chat_id: int, topic_id: Optional[int], enabled: bool
     ) -> Optional[Rule]:
@@ -364,11 +605,8 @@ class RuleService:
         enabled: bool,
         config: Optional[Dict[str, Any]] = None,
     ) -> Optional[Rule]:
-        rules = await self.rule_repo.get_by_chat_and_topic(chat_id, topic_id)
-        existing = next(
-            (r for r in rules if r.rule_type == rule_type and r.topic_id == topic_id),
-            None,
-        )
+        await self._ensure_rules_loaded()
+        existing = self._rule_index.get(chat_id, topic_id, rule_type)
 
         if enabled:
             if not existing:
@@ -381,17 +619,27 @@ class RuleService:
                 )
                 rule_id = await self.rule_repo.add(new_rule)
                 new_rule.id = rule_id
+                self._rule_index.put(new_rule)
+                self._rule_generation += 1
                 return new_rule
             else:
                 if config is not None:
                     existing.config = config
                     await self.rule_repo.update(existing)
+                    self._rule_generation += 1
                 return existing
         else:
             if existing and existing.id:
                 await self.rule_repo.delete(existing.id)
+                self._rule_index.remove(existing)
+                self._rule_generation += 1
             return None
 
+    async def delete_rule(self, rule_id: int) -> None:
+        await self.rule_repo.delete(rule_id)
+        self._rule_index.remove_by_id(rule_id)
+        self._rule_generation += 1
+
     async def apply_autoread_to_all_topics(self, forum_id: int, enabled: bool):
         await self.toggle_autoread(forum_id, None, enabled)
         topics = await self.chat_repo.get_forum_topics(forum_id)
@@ -1,10 +1,10 @@
 import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from src.infrastructure.db import BaseSqliteRepository
 from src.rules.models import Rule, RuleType
-from src.rules.ports import RuleRepository
+from src.rules.ports import RuleRepository, SyncStateRepository
 
 
 class SqliteRuleRepository(BaseSqliteRepository, RuleRepository):
@@ -86,6 +86,17 @@ class SqliteRuleRepository(BaseSqliteRepository, RuleRepository):
 
         return await self._execute(_fetch)
 
+    def _rule_params(self, rule: Rule) -> tuple:
+        return (
+            rule.user_id,
+            rule.rule_type.value,
+            rule.chat_id,
+            rule.topic_id,
+            json.dumps(rule.config),
+            rule.created_at.isoformat(),
+            rule.updated_at.isoformat(),
+        )
+
     async def add(self, rule: Rule) -> int:
         def _insert():
             with self._connect() as conn:
@@ -94,22 +105,14 @@ class SqliteRuleRepository(BaseSqliteRepository, RuleRepository):
                     INSERT INTO rules (user_id, rule_type, chat_id, topic_id, config, created_at, updated_at)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
-                    (
-                        rule.user_id,
-                        rule.rule_type.value,
-                        rule.chat_id,
-                        rule.topic_id,
-                        json.dumps(rule.config),
-                        rule.created_at.isoformat(),
-                        rule.updated_at.isoformat(),
-                    ),
+                    self._rule_params(rule),
                 )
                 conn.commit()
                 if cursor.lastrowid is None:
                     raise ValueError("Database insert failed: no ID returned")
                 return cursor.lastrowid
 
-        return await self._execute(_insert)
+        return await self._execute_write(_insert)
 
     async def update(self, rule: Rule) -> None:
         def _update():
@@ -123,7 +126,7 @@ class SqliteRuleRepository(BaseSqliteRepository, RuleRepository):
                 )
                 conn.commit()
 
-        await self._execute(_update)
+        await self._execute_write(_update)
 
     async def delete(self, rule_id: int) -> None:
         def _delete():
@@ -131,7 +134,7 @@ class SqliteRuleRepository(BaseSqliteRepository, RuleRepository):
                 conn.execute("DELETE FROM rules WHERE id = ?", (rule_id,))
                 conn.commit()
 
-        await self._execute(_delete)
+        await self._execute_write(_delete)
 
     async def delete_all(self) -> None:
         def _delete_all():
@@ -139,4 +142,83 @@ class SqliteRuleRepository(BaseSqliteRepository, RuleRepository):
                 conn.execute("DELETE FROM rules")
                 conn.commit()
 
-        await self._execute(_delete_all)
+        await self._execute_write(_delete_all)
+
+    async def replace_all(self, rules: List[Rule]) -> None:
+        params = [self._rule_params(rule) for rule in rules]
+
+        def _replace_all():
+            # One transaction: readers see either the old or the new set,
+            # and a failure part-way leaves the old set in place.
+            with self._connect() as conn:
+                conn.execute("DELETE FROM rules")
+                conn.executemany(
+                    """
+                    INSERT INTO rules (user_id, rule_type, chat_id, topic_id, config, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    params,
+                )
+
+        await self._execute_write(_replace_all)
+
+    async def apply_diff(
+        self,
+        inserts: Sequence[Rule],
+        updates: Sequence[Rule],
+        delete_ids: Sequence[int],
+    ) -> None:
+        insert_params = [self._rule_params(rule) for rule in inserts]
+        now = datetime.now().isoformat()
+        update_params = [(now, json.dumps(rule.config), rule.id) for rule in updates]
+        delete_params = [(rule_id,) for rule_id in delete_ids]
+
+        def _apply():
+            with self._connect() as conn:
+                # Deletes first so a re-scoped rule never trips the unique index
+                conn.executemany("DELETE FROM rules WHERE id = ?", delete_params)
+                conn.executemany(
+                    "UPDATE rules SET updated_at = ?, config = ? WHERE id = ?",
+                    update_params,
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO rules (user_id, rule_type, chat_id, topic_id, config, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    insert_params,
+                )
+
+        await self._execute_write(_apply)
+
+
+class SqliteSyncStateRepository(BaseSqliteRepository, SyncStateRepository):
+    def __init__(self, db_path: str = "data.db"):
+        super().__init__(db_path)
+
+    async def get_value(self, key: str) -> Optional[str]:
+        def _fetch():
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value FROM sync_state WHERE key = ?", (key,)
+                ).fetchone()
+                return row["value"] if row else None
+
+        return await self._execute(_fetch)
+
+    async def set_values(self, values: Dict[str, Optional[str]]) -> None:
+        now = datetime.now().isoformat()
+        params = [(key, value, now) for key, value in values.items()]
+
+        def _upsert():
+            with self._connect() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO sync_state (key, value, updated_at) VALUES (?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE
+                    SET value = excluded.value, updated_at = excluded.updated_at
+                """,
+                    params,
+                )
+
+        await self._execute_write(_upsert)
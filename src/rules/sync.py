@@ -1,16 +1,30 @@
-"""Startup rules sync: fetches production rules export and applies them locally."""
+"""Rules sync: fetches production rules export and applies them locally."""
+
+import asyncio
+import hashlib
+import json
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from typing import Optional, Tuple
 
 import httpx
 
 from src.infrastructure.logging import get_logger
 from src.rules.models import Rule, RuleType
-from src.rules.ports import RuleRepository
+from src.rules.ports import RuleRepository, SyncStateRepository
 from src.users.ports import UserRepository
 
 logger = get_logger(__name__)
 
 _TIMEOUT = 10.0
 
+# sync_state keys remembering what the last applied export looked like
+_STATE_ETAG = "rules_sync_etag"
+_STATE_HASH = "rules_sync_hash"
+
+RuleScope = Tuple[RuleType, int, Optional[int]]
+
 # Fields from the export's user_settings block that map 1-to-1 to User attributes.
 _USER_SETTINGS_FIELDS = frozenset(
     {
@@ -28,45 +42,77 @@ _USER_SETTINGS_FIELDS = frozenset(
 )
 
 
+def export_digest(payload: dict) -> str:
+    """Stable content hash of a rules export payload (also served as its ETag)."""
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
 async def sync_rules_from_remote(
     url: str,
     rule_repo: RuleRepository,
     user_repo: UserRepository,
-) -> None:
-    """Fetch the production rules export and full-replace local rules.
+    state_repo: Optional[SyncStateRepository] = None,
+) -> bool:
+    """Fetch the production rules export and bring local rules in line with it.
+
+    With a state_repo the request is conditional (If-None-Match) and an
+    export whose content hash matches the last applied one is skipped; only
+    the differences (inserts, config updates, deletes) are written.
 
     Parameters are explicit (no get_settings() call inside) to avoid
     lru_cache issues in tests and to keep this function easily testable.
 
+    Returns True when local rules or settings were rewritten.
+
     On any error the function logs a structured warning and returns —
     startup continues normally (R011).  The full URL is never logged
     because it may contain auth tokens.
     """
     try:
-        await _do_sync(url, rule_repo, user_repo)
+        return await _do_sync(url, rule_repo, user_repo, state_repo)
     except Exception as exc:
         logger.warning("rules_sync_failed", error=str(exc))
+        return False
 
 
 async def _do_sync(
     url: str,
     rule_repo: RuleRepository,
     user_repo: UserRepository,
-) -> None:
+    state_repo: Optional[SyncStateRepository] = None,
+) -> bool:
+    last_hash = None
+    headers = {}
+    if state_repo is not None:
+        last_hash = await state_repo.get_value(_STATE_HASH)
+        last_etag = await state_repo.get_value(_STATE_ETAG)
+        if last_etag:
+            headers["If-None-Match"] = last_etag
+
     # Phase: fetch
     async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-        response = await client.get(url)
+        response = await client.get(url, headers=headers)
+        if response.status_code == 304:
+            logger.info("rules_sync_not_modified")
+            return False
         response.raise_for_status()
 
     # Phase: parse
     data = response.json()
+    digest = export_digest(data)
+    if last_hash is not None and digest == last_hash:
+        logger.info("rules_sync_unchanged")
+        return False
+
     remote_rules: list = data.get("rules", [])
     remote_user_settings: dict | None = data.get("user_settings")
 
-    # Phase: apply rules — full replace (delete_all then re-insert)
-    await rule_repo.delete_all()
-    for raw in remote_rules:
-        rule = Rule(
+    # Phase: apply rules — only what differs, in a single transaction
+    rules = [
+        Rule(
             id=None,
             user_id=1,
             rule_type=RuleType(raw["rule_type"]),
@@ -75,26 +121,102 @@ async def _do_sync(
             # config is already a dict in the export JSON
             config=raw.get("config", {}),
         )
-        await rule_repo.add(rule)
+        for raw in remote_rules
+    ]
+    inserted, updated, deleted = await _apply_rules(rule_repo, rules)
 
     # Phase: apply user settings overlay — only if user row already exists
     settings_synced = False
     if remote_user_settings:
         user = await user_repo.get_user(1)
         if user is not None:
+            changes = {}
             for field_name, value in remote_user_settings.items():
                 if field_name in _USER_SETTINGS_FIELDS and hasattr(user, field_name):
                     current = getattr(user, field_name)
                     # Preserve attribute type: cast booleans explicitly
                     if isinstance(current, bool):
-                        setattr(user, field_name, bool(value))
+                        changes[field_name] = bool(value)
                     else:
-                        setattr(user, field_name, value)
-            await user_repo.save_user(user)
+                        changes[field_name] = value
+            await user_repo.save_user(replace(user, **changes))
             settings_synced = True
 
+    if state_repo is not None:
+        await state_repo.set_values(
+            {_STATE_ETAG: response.headers.get("ETag"), _STATE_HASH: digest}
+        )
+
     logger.info(
         "rules_sync_completed",
         rule_count=len(remote_rules),
+        inserted=inserted,
+        updated=updated,
+        deleted=deleted,
         settings_synced=settings_synced,
     )
+    return True
+
+
+async def job_periodic_rules_sync(
+    url: str,
+    rule_repo: RuleRepository,
+    user_repo: UserRepository,
+    state_repo: Optional[SyncStateRepository],
+    on_change: Callable[[], Awaitable[None]],
+    shutdown_event: asyncio.Event,
+    interval: float,
+    jitter: float = 0.1,
+):
+    """Background task re-polling the rules export so a mirror keeps following it.
+
+    Each pass goes through the conditional/incremental sync; on_change (e.g.
+    RuleService.load_rules) runs only when something was actually written.
+    The sleep is spread by +/- jitter * interval so several mirrors do not hit
+    production in lockstep.
+    """
+    logger.info("rules_sync_job_started", interval=interval)
+    while not shutdown_event.is_set():
+        delay = interval * (1 + random.uniform(-jitter, jitter))
+        try:
+            await asyncio.wait_for(shutdown_event.wait(), timeout=delay)
+            break
+        except asyncio.TimeoutError:
+            pass
+
+        try:
+            if await sync_rules_from_remote(url, rule_repo, user_repo, state_repo):
+                await on_change()
+        except Exception as e:
+            logger.error("rules_sync_job_error", error=str(e))
+
+
+def _scope(rule: Rule) -> RuleScope:
+    return (rule.rule_type, rule.chat_id, rule.topic_id)
+
+
+async def _apply_rules(
+    rule_repo: RuleRepository, remote: list[Rule]
+) -> Tuple[int, int, int]:
+    """Write the remote rule set; returns (inserted, updated, deleted)."""
+    wanted = {_scope(r): r for r in remote}
+    local = {_scope(r): r for r in await rule_repo.get_all()}
+
+    if not local:
+        # Fresh database: nothing to diff against, bulk load everything
+        await rule_repo.replace_all(list(wanted.values()))
+        return len(wanted), 0, 0
+
+    inserts = [r for key, r in wanted.items() if key not in local]
+    updates = [
+        replace(local[key], config=r.config)
+        for key, r in wanted.items()
+        if key in local and local[key].config != r.config
+    ]
+    delete_ids = [
+        r.id for key, r in local.items() if key not in wanted and r.id is not None
+    ]
+
+    if inserts or updates or delete_ids:
+        await rule_repo.apply_diff(inserts, updates, delete_ids)
+    return len(inserts), len(updates), len(delete_ids)
@@ -0,0 +1,49 @@
+from typing import Dict, Optional
+
+from src.users.models import User
+from src.users.ports import UserRepository
+
+
+class CachedUserRepository(UserRepository):
+    """Read-through cache in front of a UserRepository.
+
+    get_user is hit on every incoming event and every page render, and each
+    SQLite read costs a thread hop plus two Fernet decrypts. User is frozen, so
+    the decrypted snapshot can be shared safely; writes go through save_user
+    or delete_user, which drop the cached entry.
+    """
+
+    def __init__(self, inner: UserRepository) -> None:
+        self._inner = inner
+        self._cache: Dict[int, Optional[User]] = {}
+        # Bumped on every invalidation so a read racing a write is not cached
+        self._generation = 0
+
+    async def get_user(self, user_id: int = 1) -> Optional[User]:
+        if user_id in self._cache:
+            return self._cache[user_id]
+        generation = self._generation
+        user = await self._inner.get_user(user_id)
+        if generation == self._generation:
+            self._cache[user_id] = user
+        return user
+
+    async def save_user(self, user: User) -> None:
+        try:
+            await self._inner.save_user(user)
+        finally:
+            self.invalidate(user.id)
+
+    async def delete_user(self, user_id: int) -> None:
+        try:
+            await self._inner.delete_user(user_id)
+        finally:
+            self.invalidate(user_id)
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drop one cached user, or all of them when user_id is None."""
+        self._generation += 1
+        if user_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(user_id, None)
@@ -117,7 +117,7 @@ class SqliteUserRepository(BaseSqliteRepository, UserRepository):
                     )
                 conn.commit()
 
-        await self._execute(_save)
+        await self._execute_write(_save)
 
     async def delete_user(self, user_id: int) -> None:
         def _delete():
@@ -125,4 +125,4 @@ class SqliteUserRepository(BaseSqliteRepository, UserRepository):
                 conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
                 conn.commit()
 
-        await self._execute(_delete)
+        await self._execute_write(_delete)
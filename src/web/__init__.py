@@ -9,16 +9,28 @@ from alembic.config import Config as AlembicConfig
 from src.web.types import TypedQuart
 
 from src.adapters.telegram import TelethonAdapter
-from src.adapters.valkey_repo import ValkeyActionRepository, ValkeyEventRepository
+from src.adapters.telegram.write_intents import SqliteWriteIntentStore
+from src.adapters.valkey_repo import (
+    ValkeyActionRepository,
+    ValkeyEventRepository,
+    ValkeyVerdictCache,
+)
+from src.ai.local_model import LocalAdModel
+from src.ai.sqlite_repo import SqliteLocalModelStore
 from src.application.interactors import ChatInteractor
 from src.config import get_settings
-from src.infrastructure.event_bus import EventBus
+from src.infrastructure.db import close_all_pools
+from src.infrastructure.event_bus import STAGE_PROCESS, STAGE_PUBLISH, EventBus
 from src.infrastructure.logging import configure_logging, get_logger
 from src.infrastructure.tasks import BackgroundTasks
 from src.jinja_filters import file_mtime_filter
+from src.messages.backfill import job_search_backfill
+from src.messages.sqlite_repo import SqliteMessageSearchIndex, SqliteMessageStore
+from src.messages.writer import MessageStoreWriter
 from src.rules.service import RuleService
-from src.rules.sqlite_repo import SqliteRuleRepository
-from src.rules.sync import sync_rules_from_remote
+from src.rules.sqlite_repo import SqliteRuleRepository, SqliteSyncStateRepository
+from src.rules.sync import job_periodic_rules_sync, sync_rules_from_remote
+from src.users.cached_repo import CachedUserRepository
 from src.users.sqlite_repo import SqliteUserRepository
 from src.infrastructure.maintenance import job_background_maintenance
 from src.web.routes import register_routes
@@ -59,6 +71,7 @@ async def _build_tg_adapter(settings, user_repo) -> TelethonAdapter:
         session_string=session_string,
         api_id=settings.TG_API_ID,
         api_hash=settings.TG_API_HASH,
+        intent_store=SqliteWriteIntentStore(db_path=settings.DB_PATH),
     )
 
 
@@ -95,15 +108,19 @@ def create_app() -> TypedQuart:
         settings = get_settings()
         action_repo = ValkeyActionRepository(settings.VALKEY_URL)
         event_repo = ValkeyEventRepository(settings.VALKEY_URL)
-        user_repo = SqliteUserRepository(db_path=settings.DB_PATH)
+        user_repo = CachedUserRepository(SqliteUserRepository(db_path=settings.DB_PATH))
+
+        rule_repo = SqliteRuleRepository(db_path=settings.DB_PATH)
+
+        sync_state_repo = SqliteSyncStateRepository(db_path=settings.DB_PATH)
 
         # 3a. Sync rules from remote production instance (if configured)
-        rule_repo_for_sync = SqliteRuleRepository(db_path=settings.DB_PATH)
         if settings.RULES_SYNC_URL:
             await sync_rules_from_remote(
                 url=settings.RULES_SYNC_URL,
-                rule_repo=rule_repo_for_sync,
+                rule_repo=rule_repo,
                 user_repo=user_repo,
+                state_repo=sync_state_repo,
             )
         else:
             logger.info("rules_sync_skipped", reason="RULES_SYNC_URL not set")
@@ -111,33 +128,66 @@ def create_app() -> TypedQuart:
         # 4. Create Telegram adapter
         tg_adapter = await _build_tg_adapter(settings, user_repo)
 
-        # 5. Create services
-        rule_repo = SqliteRuleRepository(db_path=settings.DB_PATH)
-        rule_service = RuleService(rule_repo, action_repo, tg_adapter, user_repo)
-        interactor = ChatInteractor(tg_adapter, action_repo, event_repo)
+        # 5. Create services (rule index is loaded after sync so it sees synced rules)
+        verdict_cache = ValkeyVerdictCache(
+            settings.VALKEY_URL, ttl_seconds=settings.AI_VERDICT_TTL
+        )
+        local_model = None
+        if settings.AI_LOCAL_GATE_ENABLED:
+            local_model = LocalAdModel(SqliteLocalModelStore(db_path=settings.DB_PATH))
+        rule_service = RuleService(
+            rule_repo,
+            action_repo,
+            tg_adapter,
+            user_repo,
+            verdict_cache=verdict_cache,
+            local_model=local_model,
+            ai_async=settings.AI_ASYNC_VERDICTS,
+        )
+        await rule_service.load_rules()
+        message_store = None
+        if settings.MESSAGE_STORE_ENABLED:
+            message_store = SqliteMessageStore(db_path=settings.DB_PATH)
+            tg_adapter.add_reconnect_listener(message_store.reset_live_chats)
+        search_index = None
+        if settings.SEARCH_INDEX_ENABLED:
+            search_index = SqliteMessageSearchIndex(db_path=settings.DB_PATH)
+        interactor = ChatInteractor(
+            tg_adapter,
+            action_repo,
+            event_repo,
+            message_store=message_store,
+            search_index=search_index,
+        )
 
         # 6. Attach services to app for app-scoped access
         app.tg_adapter = tg_adapter
         app.action_repo = action_repo
         app.event_repo = event_repo
         app.user_repo = user_repo
+        app.verdict_cache = verdict_cache
         app.rule_service = rule_service
         app.chat_interactor = interactor
         app.background_tasks = BackgroundTasks(logger)
 
-        # 7. Create event bus and register subscribers in order:
-        #    - event_repo first (persistence)
-        #    - rule_service second (sets is_read before SSE renders)
-        #    - SSE broadcast last
+        # 7. Create event bus and register subscribers by stage:
+        #    - process: persistence and rule engine run concurrently
+        #      (rule_service sets is_read before SSE renders)
+        #    - publish: SSE broadcast once the process stage has finished
         bus = EventBus()
-        bus.subscribe(event_repo.add_event)
-        bus.subscribe(rule_service.handle_new_message_event)
+        bus.subscribe(event_repo.add_event, stage=STAGE_PROCESS)
+        bus.subscribe(rule_service.handle_new_message_event, stage=STAGE_PROCESS)
+        message_writer = None
+        message_sinks = [s for s in (message_store, search_index) if s is not None]
+        if message_sinks:
+            message_writer = MessageStoreWriter(message_sinks)
+            bus.subscribe(message_writer.handle_event, stage=STAGE_PROCESS)
 
         async def _sse_broadcast(event):
             async with app.app_context():
                 await broadcast_event(event)
 
-        bus.subscribe(_sse_broadcast)
+        bus.subscribe(_sse_broadcast, stage=STAGE_PUBLISH)
         app.event_bus = bus
 
         # 8. Connect adapter and wire event bus as its sole listener
@@ -156,12 +206,42 @@ def create_app() -> TypedQuart:
             ),
             "maintenance",
         )
+        if message_writer is not None:
+            app.background_tasks.create(
+                message_writer.run(shutdown_event), "message_store_writer"
+            )
+        if search_index is not None and settings.SEARCH_BACKFILL_PAGES > 0:
+            app.background_tasks.create(
+                job_search_backfill(
+                    repository=tg_adapter,
+                    search_index=search_index,
+                    shutdown_event=shutdown_event,
+                    chats=settings.SEARCH_BACKFILL_CHATS,
+                    pages=settings.SEARCH_BACKFILL_PAGES,
+                ),
+                "search_backfill",
+            )
+        if settings.RULES_SYNC_URL and settings.RULES_SYNC_INTERVAL > 0:
+            app.background_tasks.create(
+                job_periodic_rules_sync(
+                    url=settings.RULES_SYNC_URL,
+                    rule_repo=rule_repo,
+                    user_repo=user_repo,
+                    state_repo=sync_state_repo,
+                    on_change=rule_service.load_rules,
+                    shutdown_event=shutdown_event,
+                    interval=settings.RULES_SYNC_INTERVAL,
+                    jitter=settings.RULES_SYNC_JITTER,
+                ),
+                "rules_sync",
+            )
 
     @app.after_serving
     async def shutdown():
         logger.info("application_shutdown")
         shutdown_event.set()
         await app.background_tasks.shutdown(timeout=3.0)
+        await app.rule_service.shutdown()
 
         # Allow SSE generators to exit gracefully
         await asyncio.sleep(0.1)
@@ -175,10 +255,11 @@ def create_app() -> TypedQuart:
             logger.error("shutdown_error", error=str(e))
 
         connected_queues.clear()
-        for repo in (app.action_repo, app.event_repo):
+        for repo in (app.action_repo, app.event_repo, app.verdict_cache):
             close = getattr(repo, "close", None)
             if close:
                 await close()
+        await asyncio.to_thread(close_all_pools)
 
     @app.context_processor
     async def inject_globals():
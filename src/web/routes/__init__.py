@@ -6,6 +6,7 @@ from src.web.routes.chat import chat_bp
 from src.web.routes.forum import forum_bp
 from src.web.routes.health import health_bp
 from src.web.routes.media import media_bp
+from src.web.routes.search import search_bp
 from src.web.routes.settings import settings_bp
 from src.web.routes.sse import sse_bp
 
@@ -15,6 +16,7 @@ def register_routes(app: Quart):
     app.register_blueprint(chat_bp)
     app.register_blueprint(forum_bp)
     app.register_blueprint(media_bp)
+    app.register_blueprint(search_bp)
     app.register_blueprint(sse_bp)
     app.register_blueprint(settings_bp)
     app.register_blueprint(health_bp)
@@ -126,6 +126,7 @@ async def mark_read(chat_id: int):
         return bad_request(e)
 
     await interactor.mark_chat_as_read(chat_id, topic_id=body.topic_id)
+    await get_rule_service().record_manual_read(chat_id, topic_id=body.topic_id)
     return jsonify({"status": "ok"})
 
 
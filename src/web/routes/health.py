@@ -1,6 +1,6 @@
 from quart import Blueprint, jsonify
 
-from src.container import _get_tg_adapter, get_event_bus
+from src.container import _get_tg_adapter, get_event_bus, get_rule_service
 
 health_bp = Blueprint("health", __name__)
 
@@ -12,7 +12,8 @@ async def health():
 
     connected = adapter.is_connected()
     queue_size = adapter._write_queue.queue_size()
-    subscriber_count = len(bus._subscribers)
+    ingest_depth = adapter.ingest_queue_size()
+    subscriber_count = len(bus)
 
     from src.web.sse import connected_queues
 
@@ -25,6 +26,11 @@ async def health():
             "status": status,
             "telegram_connected": connected,
             "write_queue_depth": queue_size,
+            "write_queue": adapter._write_queue.stats(),
+            "ingest_queue_depth": ingest_depth,
+            "event_coalescing": adapter.coalescing_stats(),
+            "message_cache": adapter.message_cache_stats(),
+            "ai": get_rule_service().ai_stats(),
             "event_bus_subscribers": subscriber_count,
             "sse_clients": sse_clients,
         }
@@ -0,0 +1,37 @@
+from quart import Blueprint, jsonify, request
+
+from src.container import get_chat_interactor
+
+search_bp = Blueprint("search", __name__)
+
+_MAX_LIMIT = 100
+
+
+@search_bp.route("/api/search")
+async def api_search():
+    query = request.args.get("q", default="").strip()
+    chat_id = request.args.get("chat_id", type=int, default=None)
+    limit = request.args.get("limit", type=int, default=20)
+    limit = max(1, min(limit, _MAX_LIMIT))
+    if not query:
+        return jsonify({"error": "Missing query"}), 400
+
+    interactor = get_chat_interactor()
+    hits = await interactor.search_messages(query, chat_id=chat_id, limit=limit)
+    return jsonify(
+        {
+            "query": query,
+            "results": [
+                {
+                    "chat_id": hit.chat_id,
+                    "msg_id": hit.msg_id,
+                    "chat_name": hit.chat_name,
+                    "date": hit.date.isoformat(),
+                    "snippet": hit.snippet,
+                    "rank": hit.rank,
+                    "link": f"/chat/{hit.chat_id}",
+                }
+                for hit in hits
+            ],
+        }
+    )
@@ -4,6 +4,7 @@ from src.config import get_settings
 from src.container import _get_tg_adapter, get_rule_service, get_user_repo
 from src.rules.models import RuleType
 from src.rules.sqlite_repo import SqliteRuleRepository
+from src.rules.sync import export_digest
 from src.users.models import User
 from src.web.requests import (
     ApplyAllTopicsRequest,
@@ -73,6 +74,9 @@ async def reset_account():
     adapter = _get_tg_adapter()
     if adapter:
         await adapter.disconnect()
+        # Unsent reads/reactions belong to the old account; the next login
+        # must not replay them
+        await adapter.discard_pending_writes()
 
     repo = get_user_repo()
     await repo.delete_user(1)
@@ -163,9 +167,8 @@ async def api_debug_process():
 
 @settings_bp.route("/api/rules/<int:rule_id>", methods=["DELETE"])
 async def api_delete_rule(rule_id: int):
-    settings = get_settings()
-    rule_repo = SqliteRuleRepository(db_path=settings.DB_PATH)
-    await rule_repo.delete(rule_id)
+    rule_service = get_rule_service()
+    await rule_service.delete_rule(rule_id)
     return jsonify({"status": "ok"})
 
 
@@ -203,7 +206,16 @@ async def api_export_rules():
         "ai_prompt": user.ai_prompt,
     }
 
-    return jsonify({"rules": rules_list, "user_settings": user_settings})
+    payload = {"rules": rules_list, "user_settings": user_settings}
+
+    # Content-derived ETag lets syncing instances skip unchanged exports
+    etag = export_digest(payload)
+    if request.if_none_match.contains(etag):
+        return "", 304, {"ETag": f'"{etag}"'}
+
+    response = jsonify(payload)
+    response.set_etag(etag)
+    return response
 
 
 @settings_bp.route("/api/rules", methods=["GET"])
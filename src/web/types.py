@@ -1,5 +1,6 @@
 from quart import Quart
 
+from src.ai.ports import VerdictCache
 from src.adapters.telegram.client import TelethonAdapter
 from src.application.interactors import ChatInteractor
 from src.domain.ports import ActionRepository, EventRepository
@@ -14,6 +15,7 @@ class TypedQuart(Quart):
     action_repo: ActionRepository
     event_repo: EventRepository
     user_repo: UserRepository
+    verdict_cache: VerdictCache
     rule_service: RuleService
     chat_interactor: ChatInteractor
     event_bus: EventBus
@@ -3,10 +3,12 @@
 All tests mock google.genai.Client so no live API calls are made.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.ai.batching import BatchingClassifier
 from src.ai.ports import AIClassifier
 from src.ai.gemini import GeminiClassifier
 
@@ -110,3 +112,111 @@ async def test_api_error_propagates():
         classifier = GeminiClassifier(api_key="bad-key", model="gemini-2.0-flash")
         with pytest.raises(genai_errors.APIError):
             await classifier.classify_is_ad("some ad text")
+
+
+# ---------------------------------------------------------------------------
+# Batch classification
+# ---------------------------------------------------------------------------
+
+
+async def test_classify_many_sends_one_request():
+    client = _mock_client("[true, false, true]")
+    with patch("src.ai.gemini.google.genai.Client", return_value=client):
+        classifier = GeminiClassifier(api_key="k", model="gemini-2.0-flash")
+        result = await classifier.classify_many(["ad", "hi", "sale"])
+
+    assert result == [True, False, True]
+    generate = client.aio.models.generate_content
+    assert generate.await_count == 1
+    assert '["ad", "hi", "sale"]' in generate.await_args.kwargs["contents"]
+
+
+@pytest.mark.parametrize(
+    "batch_response", ["not json", "[true]", '["yes", "no"]', '{"a": true}']
+)
+async def test_classify_many_falls_back_on_malformed_response(batch_response):
+    responses = [batch_response, "true", "false"]
+    client = _mock_client("")
+    client.aio.models.generate_content = AsyncMock(
+        side_effect=[MagicMock(text=t) for t in responses]
+    )
+    with patch("src.ai.gemini.google.genai.Client", return_value=client):
+        classifier = GeminiClassifier(api_key="k", model="gemini-2.0-flash")
+        result = await classifier.classify_many(["ad", "hi"])
+
+    assert result == [True, False]
+    assert client.aio.models.generate_content.await_count == 3
+
+
+async def test_classify_many_accepts_fenced_json():
+    with patch(
+        "src.ai.gemini.google.genai.Client",
+        return_value=_mock_client("```json\n[false, true]\n```"),
+    ):
+        classifier = GeminiClassifier(api_key="k", model="gemini-2.0-flash")
+        assert await classifier.classify_many(["a", "b"]) == [False, True]
+
+
+class _RecordingClassifier(AIClassifier):
+    def __init__(self):
+        self.single_calls = []
+        self.batch_calls = []
+
+    async def classify_is_ad(self, text):
+        self.single_calls.append(text)
+        return text.startswith("ad")
+
+    async def classify_many(self, texts):
+        self.batch_calls.append(list(texts))
+        return [t.startswith("ad") for t in texts]
+
+
+async def test_batching_classifier_fans_out_verdicts():
+    inner = _RecordingClassifier()
+    batcher = BatchingClassifier(inner, window=0.01, max_batch=10)
+
+    results = await asyncio.gather(
+        batcher.classify_is_ad("ad 1"),
+        batcher.classify_is_ad("hello"),
+        batcher.classify_is_ad("ad 2"),
+    )
+
+    assert results == [True, False, True]
+    assert inner.batch_calls == [["ad 1", "hello", "ad 2"]]
+    assert inner.single_calls == []
+
+
+async def test_batching_classifier_flushes_full_batch_early():
+    inner = _RecordingClassifier()
+    batcher = BatchingClassifier(inner, window=10, max_batch=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.classify_is_ad("ad"), batcher.classify_is_ad("x")),
+        timeout=1,
+    )
+
+    assert results == [True, False]
+    assert inner.batch_calls == [["ad", "x"]]
+
+
+async def test_batching_classifier_single_text_uses_plain_call():
+    inner = _RecordingClassifier()
+    batcher = BatchingClassifier(inner, window=0.01)
+
+    assert await batcher.classify_is_ad("ad") is True
+    assert inner.single_calls == ["ad"]
+    assert inner.batch_calls == []
+
+
+async def test_batching_classifier_propagates_errors_to_every_caller():
+    inner = MagicMock(spec=AIClassifier)
+    inner.classify_many = AsyncMock(side_effect=RuntimeError("quota"))
+    batcher = BatchingClassifier(inner, window=0.01)
+
+    results = await asyncio.gather(
+        batcher.classify_is_ad("a"),
+        batcher.classify_is_ad("b"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,130 @@
+"""Tests for ChatQueryOps.get_messages history page parsing."""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.adapters.telegram.chat_query_ops import ChatQueryOps
+from src.domain.models import Message
+
+
+class FakeClient:
+    def __init__(self, messages):
+        self.messages = messages
+
+    async def get_entity(self, chat_id):
+        return SimpleNamespace(id=chat_id)
+
+    async def get_messages(self, entity, **kwargs):
+        return self.messages
+
+
+class SlowParser:
+    """Parser whose await stage takes longer for earlier messages."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.rendered = []
+
+    def _cache_message_chat(self, msg_id, chat_id):
+        pass
+
+    async def resolve_senders(self, messages):
+        return {}
+
+    def render_text(self, msg):
+        self.rendered.append(msg.id)
+        return f"text {msg.id}"
+
+    async def _parse_message(self, msg, replies_map, chat_id, senders_map, text):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001 * (10 - msg.id))
+        self.in_flight -= 1
+        return Message(
+            id=msg.id,
+            text=text,
+            date=datetime(2024, 1, 1),
+            sender_name="",
+            is_outgoing=False,
+        )
+
+
+async def test_history_page_parses_concurrently_in_original_order():
+    page = [SimpleNamespace(id=i, reply_to=None) for i in range(1, 10)]
+    parser = SlowParser()
+    ops = ChatQueryOps(FakeClient(page + [None]), parser, media=None)
+
+    result = await ops.get_messages(100)
+
+    assert [m.id for m in result] == list(range(1, 10))
+    assert [m.text for m in result] == [f"text {i}" for i in range(1, 10)]
+    assert parser.rendered == list(range(1, 10))
+    assert 1 < parser.max_in_flight <= 8
+
+
+class DialogClient:
+    def __init__(self, dialogs_by_folder):
+        self.dialogs_by_folder = dialogs_by_folder
+
+    async def iter_dialogs(self, limit=None, ignore_migrated=True, folder=0):
+        for d in self.dialogs_by_folder.get(folder, []):
+            yield d
+
+
+class TopMessageParser(SlowParser):
+    def __init__(self):
+        super().__init__()
+        self.resolve_calls = 0
+
+    async def resolve_senders(self, messages):
+        self.resolve_calls += 1
+        return {}
+
+    async def _parse_message(self, msg, chat_id=None, senders_map=None):
+        return Message(
+            id=msg.id,
+            text=f"top {chat_id}",
+            date=datetime(2024, 1, 1),
+            sender_name="",
+            is_outgoing=False,
+        )
+
+
+def _dialog(chat_id, unread, message):
+    return SimpleNamespace(
+        id=chat_id,
+        name=f"Chat {chat_id}",
+        unread_count=unread,
+        unread_mentions_count=0,
+        message=message,
+        entity=SimpleNamespace(),
+        is_user=False,
+        is_group=True,
+        is_channel=False,
+    )
+
+
+async def test_unread_chats_carry_parsed_top_message():
+    dialogs = {
+        0: [
+            _dialog(1, 1, SimpleNamespace(id=11, edit_date=None)),
+            _dialog(2, 0, SimpleNamespace(id=21, edit_date=None)),
+        ],
+        1: [_dialog(3, 2, None)],
+    }
+    parser = TopMessageParser()
+    ops = ChatQueryOps(DialogClient(dialogs), parser, media=None)
+
+    chats = await ops.get_all_unread_chats()
+
+    assert [c.id for c in chats] == [1, 3]
+    assert chats[0].last_message.id == 11
+    assert chats[0].last_message.text == "top 1"
+    assert chats[1].last_message is None
+    assert parser.resolve_calls == 1
+
+    # A second listing reuses the parsed message cache
+    await ops.get_all_unread_chats()
+    assert parser.resolve_calls == 1
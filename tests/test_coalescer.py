@@ -0,0 +1,139 @@
+"""Tests for EventCoalescer and edit/reaction coalescing in EventHandlers."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from telethon.tl.types import PeerChannel, UpdateMessageReactions
+
+from src.adapters.telegram.event_handlers import EventHandlers
+from src.infrastructure.coalescer import EventCoalescer
+
+
+async def test_burst_for_one_key_runs_only_latest_job():
+    coalescer = EventCoalescer(window=0.01)
+    ran = []
+
+    for i in range(5):
+
+        async def _job(v=i):
+            ran.append(v)
+
+        await coalescer.submit((1, 10, "edited"), _job)
+
+    await asyncio.sleep(0.05)
+    assert ran == [4]
+    assert coalescer.stats() == {
+        "pending": 0,
+        "superseded": 4,
+        "cancelled": 0,
+        "dispatched": 1,
+    }
+
+
+async def test_distinct_keys_are_not_merged():
+    coalescer = EventCoalescer(window=0.01)
+    ran = []
+
+    async def _edit():
+        ran.append("edit")
+
+    async def _reaction():
+        ran.append("reaction")
+
+    await coalescer.submit((1, 10, "edited"), _edit)
+    await coalescer.submit((1, 10, "reaction_update"), _reaction)
+    await asyncio.sleep(0.05)
+
+    assert sorted(ran) == ["edit", "reaction"]
+    assert coalescer.superseded == 0
+
+
+async def test_update_after_window_opens_a_new_one():
+    coalescer = EventCoalescer(window=0.01)
+    ran = []
+
+    async def _job():
+        ran.append("x")
+
+    await coalescer.submit("k", _job)
+    await asyncio.sleep(0.05)
+    await coalescer.submit("k", _job)
+    await asyncio.sleep(0.05)
+
+    assert ran == ["x", "x"]
+
+
+async def test_stop_flushes_pending_jobs_early():
+    coalescer = EventCoalescer(window=10)
+    ran = []
+
+    async def _job():
+        ran.append("x")
+
+    await coalescer.submit("k", _job)
+    await coalescer.stop()
+
+    assert ran == ["x"]
+    assert coalescer.stats()["pending"] == 0
+
+
+async def test_reaction_updates_coalesce_per_message():
+    coalescer = EventCoalescer(window=0.01)
+    handlers = EventHandlers(None, MagicMock(), None, None, coalescer=coalescer)
+    seen = []
+
+    async def handler(event):
+        seen.append(event)
+
+    wrapped = handlers._coalesced(handler, handlers._reaction_coalesce_key)
+    updates = [
+        UpdateMessageReactions(peer=PeerChannel(123), msg_id=7, reactions=None)
+        for _ in range(3)
+    ]
+    for update in updates:
+        await wrapped(update)
+    await asyncio.sleep(0.05)
+
+    assert seen == [updates[-1]]
+    assert coalescer.superseded == 2
+
+
+async def test_uncoalescable_updates_pass_straight_through():
+    coalescer = EventCoalescer(window=10)
+    handlers = EventHandlers(None, MagicMock(), None, None, coalescer=coalescer)
+    seen = []
+
+    async def handler(event):
+        seen.append(event)
+
+    wrapped = handlers._coalesced(handler, handlers._edit_coalesce_key)
+    event = MagicMock(chat_id=None)
+    await wrapped(event)
+
+    assert seen == [event]
+    assert coalescer.stats()["pending"] == 0
+
+
+async def test_deletion_cancels_pending_edit_of_that_message():
+    coalescer = EventCoalescer(window=0.01)
+    handlers = EventHandlers(None, MagicMock(), None, None, coalescer=coalescer)
+    seen = []
+
+    async def handler(event):
+        seen.append(event)
+
+    edited = handlers._coalesced(handler, handlers._edit_coalesce_key)
+    deleted = handlers._deletion_enqueued(handler)
+    edit_kept = MagicMock(chat_id=5)
+    edit_kept.message.id = 8
+    edit_dropped = MagicMock(chat_id=5)
+    edit_dropped.message.id = 7
+    deletion = MagicMock(chat_id=5, deleted_ids=[7])
+
+    await edited(edit_kept)
+    await edited(edit_dropped)
+    await deleted(deletion)
+    await asyncio.sleep(0.05)
+
+    assert seen == [deletion, edit_kept]
+    assert coalescer.cancelled == 1
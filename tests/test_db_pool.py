@@ -0,0 +1,71 @@
+"""Tests for the pooled SQLite connection layer behind BaseSqliteRepository."""
+
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from src.infrastructure.db import BaseSqliteRepository, SqliteConnectionPool
+
+
+@pytest.fixture()
+def pool():
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        path = f.name
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+
+    p = SqliteConnectionPool(path, readers=2)
+    yield p
+    p.close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
+
+
+async def test_writer_connection_is_reused(pool):
+    first = await pool.run(lambda: id(pool.connection()), write=True)
+    second = await pool.run(lambda: id(pool.connection()), write=True)
+    assert first == second
+
+
+async def test_pragmas_applied_once_at_open(pool):
+    def _pragmas():
+        conn = pool.connection()
+        return (
+            conn.execute("PRAGMA journal_mode").fetchone()[0],
+            conn.execute("PRAGMA foreign_keys").fetchone()[0],
+        )
+
+    assert await pool.run(_pragmas, write=True) == ("wal", 1)
+
+
+async def test_reader_sees_committed_writes(pool):
+    def _insert():
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+
+    def _count():
+        return pool.connection().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    assert await pool.run(_count) == 0
+    await pool.run(_insert, write=True)
+    assert await pool.run(_count) == 1
+
+
+async def test_reader_rejects_writes(pool):
+    def _insert():
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+
+    with pytest.raises(sqlite3.OperationalError):
+        await pool.run(_insert)
+
+
+async def test_repositories_share_pool_per_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "shared.db")
+        assert BaseSqliteRepository(path)._pool is BaseSqliteRepository(path)._pool
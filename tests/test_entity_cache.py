@@ -0,0 +1,99 @@
+"""Tests for the adapter-wide EntityCache."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from telethon import types
+
+from src.adapters.telegram.entity_cache import EntityCache
+from src.domain.models import ChatType
+
+
+def _user(user_id: int, first_name: str) -> types.User:
+    return types.User(id=user_id, first_name=first_name, access_hash=1)
+
+
+def _make_cache(**kwargs) -> tuple[EntityCache, AsyncMock]:
+    client = AsyncMock()
+    client.get_entity = AsyncMock(side_effect=lambda peer_id: _user(peer_id, "Ann"))
+    return EntityCache(client, **kwargs), client
+
+
+async def test_resolve_hits_network_once_per_peer():
+    cache, client = _make_cache()
+
+    first = await cache.resolve(1)
+    second = await cache.resolve(1)
+
+    assert first is second
+    assert first.display_name == "Ann"
+    assert first.chat_type == ChatType.USER
+    assert isinstance(first.input_peer, types.InputPeerUser)
+    client.get_entity.assert_awaited_once_with(1)
+
+
+async def test_expired_entries_are_resolved_again():
+    cache, client = _make_cache(ttl=0)
+
+    await cache.resolve(1)
+    await cache.resolve(1)
+
+    assert client.get_entity.await_count == 2
+
+
+async def test_least_recently_used_entry_is_evicted():
+    cache, _ = _make_cache(max_entries=2)
+    cache.put(1, _user(1, "a"))
+    cache.put(2, _user(2, "b"))
+    cache.get(1)  # 2 is now the least recently used
+    cache.put(3, _user(3, "c"))
+
+    assert cache.get(1) is not None
+    assert cache.get(2) is None
+    assert cache.get(3) is not None
+
+
+async def test_dialogs_fill_cache_without_network():
+    cache, client = _make_cache()
+    dialog = SimpleNamespace(
+        id=-100,
+        name="Dialog name",
+        entity=types.Channel(
+            id=100,
+            title="Channel",
+            photo=types.ChatPhotoEmpty(),
+            date=None,
+            broadcast=True,
+            access_hash=1,
+        ),
+        is_user=False,
+        is_channel=True,
+        is_group=False,
+    )
+
+    cache.put_dialogs([dialog])
+    cached = await cache.resolve(-100)
+
+    assert cached.display_name == "Dialog name"
+    assert cached.chat_type == ChatType.CHANNEL
+    client.get_entity.assert_not_awaited()
+
+
+async def test_invalidate_forces_fresh_resolution():
+    cache, client = _make_cache()
+    await cache.resolve(1)
+
+    cache.invalidate(1)
+    await cache.resolve(1)
+
+    assert client.get_entity.await_count == 2
+
+
+async def test_get_display_name_falls_back_on_error():
+    cache, client = _make_cache()
+    client.get_entity.side_effect = ValueError("unknown peer")
+
+    assert await cache.get_display_name(5, "Chat 5") == "Chat 5"
+    with pytest.raises(ValueError):
+        await cache.get_entity(5)
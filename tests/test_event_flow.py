@@ -173,3 +173,83 @@ async def test_sse_queue_receives_exactly_one_event_per_dispatch():
     assert sse_queue.qsize() == 3
     texts = [sse_queue.get_nowait().text for _ in range(3)]
     assert texts == ["evt-0", "evt-1", "evt-2"]
+
+
+async def test_subscribers_in_same_stage_run_concurrently():
+    """Dispatch latency is the slowest subscriber of the stage, not the sum."""
+    bus = EventBus()
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def slow(event: SystemEvent) -> None:
+        started.append("slow")
+        await release.wait()
+
+    async def fast(event: SystemEvent) -> None:
+        started.append("fast")
+        release.set()
+
+    bus.subscribe(slow, stage=0)
+    bus.subscribe(fast, stage=0)
+
+    # Would deadlock if the stage ran its subscribers one after another
+    await asyncio.wait_for(bus.dispatch(_make_event()), timeout=1.0)
+    assert started == ["slow", "fast"]
+
+
+async def test_stages_run_in_order_regardless_of_registration():
+    """A later stage only starts once every subscriber of earlier stages is done."""
+    bus = EventBus()
+    order: list[str] = []
+
+    async def publish(event: SystemEvent) -> None:
+        order.append(f"publish:{event.is_read}")
+
+    async def rules(event: SystemEvent) -> None:
+        await asyncio.sleep(0)
+        event.is_read = True
+        order.append("rules")
+
+    async def persist(event: SystemEvent) -> None:
+        order.append("persist")
+
+    bus.subscribe(publish, stage=10)
+    bus.subscribe(rules, stage=0)
+    bus.subscribe(persist, stage=0)
+    await bus.dispatch(_make_event())
+
+    assert order == ["persist", "rules", "publish:True"]
+
+
+async def test_error_in_stage_does_not_block_siblings_or_later_stages():
+    """A failing subscriber is isolated within its stage."""
+    bus = EventBus()
+    reached: list[str] = []
+
+    async def bad(event: SystemEvent) -> None:
+        raise RuntimeError("boom")
+
+    async def sibling(event: SystemEvent) -> None:
+        reached.append("sibling")
+
+    async def later(event: SystemEvent) -> None:
+        reached.append("later")
+
+    bus.subscribe(bad, stage=0)
+    bus.subscribe(sibling, stage=0)
+    bus.subscribe(later, stage=1)
+    await bus.dispatch(_make_event())
+
+    assert reached == ["sibling", "later"]
+
+
+def test_len_counts_subscribers_across_stages():
+    bus = EventBus()
+
+    async def noop(event: SystemEvent) -> None:
+        pass
+
+    bus.subscribe(noop, stage=0)
+    bus.subscribe(noop, stage=0)
+    bus.subscribe(noop, stage=5)
+    assert len(bus) == 3
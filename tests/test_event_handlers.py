@@ -74,3 +74,20 @@ async def test_new_message_uses_reply_top_id_in_forum_chat():
     assert received[0].topic_id == 7
     assert received[0].topic_name == "Topic"
     get_topic_name.assert_awaited_once_with(100, 7)
+
+
+async def test_new_message_chat_is_resolved_once_per_chat():
+    parser = FakeParser()
+    handler = EventHandlers(None, parser, None, AsyncMock(return_value="Topic"))
+    handler.add_event_listener(AsyncMock())
+
+    first = FakeNewMessageEvent(forum=False)
+    second = FakeNewMessageEvent(forum=False)
+    first.get_chat = AsyncMock(return_value=SimpleNamespace(title="Chat"))
+    second.get_chat = AsyncMock(return_value=SimpleNamespace(title="Chat"))
+
+    await handler._handle_new_message(first)
+    await handler._handle_new_message(second)
+
+    first.get_chat.assert_awaited_once()
+    second.get_chat.assert_not_awaited()
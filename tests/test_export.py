@@ -181,3 +181,29 @@ async def test_export_bypasses_login_required(app, client):
     # Must not redirect to /login; must return JSON 200
     assert response.status_code == 200
     assert response.content_type.startswith("application/json")
+
+
+async def test_export_sets_etag_and_honours_if_none_match(app, client):
+    """Export carries a content ETag; a matching If-None-Match yields 304."""
+    app.user_repo.get_user.return_value = User()
+
+    with (
+        patch("src.web.routes.settings.SqliteRuleRepository") as MockRepo,
+        patch("src.web.routes.settings.get_settings") as mock_settings,
+    ):
+        mock_settings.return_value = MagicMock(DB_PATH=":memory:")
+        MockRepo.return_value.get_all = AsyncMock(return_value=[_make_rule()])
+
+        first = await client.get("/api/rules/export")
+        etag = first.headers["ETag"]
+        second = await client.get("/api/rules/export", headers={"If-None-Match": etag})
+        MockRepo.return_value.get_all = AsyncMock(
+            return_value=[_make_rule(chat_id=200)]
+        )
+        third = await client.get("/api/rules/export", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert etag
+    assert second.status_code == 304
+    assert third.status_code == 200
+    assert third.headers["ETag"] != etag
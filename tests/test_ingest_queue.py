@@ -0,0 +1,156 @@
+"""Tests for IngestQueue and the EventHandlers hand-off onto it."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from telethon import events
+from telethon.tl.types import PeerChannel, UpdateMessageReactions, UpdateUserTyping
+
+from src.adapters.telegram.event_handlers import EventHandlers
+from src.infrastructure.ingest_queue import IngestQueue
+
+
+async def _drain(queue: IngestQueue) -> None:
+    for shard in queue._shards:
+        await shard.join()
+
+
+async def test_jobs_of_one_chat_run_in_order():
+    queue = IngestQueue(workers=4)
+    await queue.start()
+    results = []
+
+    for i in range(10):
+
+        async def _job(v=i):
+            await asyncio.sleep(0)
+            results.append(v)
+
+        await queue.submit(42, _job)
+
+    await _drain(queue)
+    await queue.stop()
+    assert results == list(range(10))
+
+
+async def test_slow_chat_does_not_block_other_chats():
+    queue = IngestQueue(workers=2)
+    await queue.start()
+    release = asyncio.Event()
+    done = []
+
+    async def _slow():
+        await release.wait()
+        done.append("slow")
+
+    async def _fast():
+        done.append("fast")
+        release.set()
+
+    # Keys 0 and 1 land on different workers
+    await queue.submit(0, _slow)
+    await queue.submit(1, _fast)
+
+    await asyncio.wait_for(_drain(queue), timeout=1.0)
+    await queue.stop()
+    assert done == ["fast", "slow"]
+
+
+async def test_full_shard_applies_backpressure():
+    queue = IngestQueue(workers=1, maxsize=1)
+
+    async def _noop():
+        pass
+
+    await queue.submit(1, _noop)
+    assert queue.queue_size() == 1
+
+    blocked = asyncio.create_task(queue.submit(1, _noop))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    await queue.start()
+    await asyncio.wait_for(blocked, timeout=1.0)
+    await _drain(queue)
+    await queue.stop()
+    assert queue.queue_size() == 0
+
+
+async def test_failing_job_does_not_stop_worker():
+    queue = IngestQueue(workers=1)
+    await queue.start()
+    results = []
+
+    async def _bad():
+        raise RuntimeError("boom")
+
+    async def _good():
+        results.append("ok")
+
+    await queue.submit(1, _bad)
+    await queue.submit(1, _good)
+    await _drain(queue)
+    await queue.stop()
+    assert results == ["ok"]
+
+
+async def test_registered_handlers_only_enqueue():
+    queue = IngestQueue(workers=1)
+    handlers = EventHandlers(None, MagicMock(), None, None, ingest_queue=queue)
+    seen = []
+
+    async def handler(event):
+        seen.append(event)
+
+    wrapped = handlers._enqueued(handler)
+    event = MagicMock(chat_id=-100123)
+    await wrapped(event)
+
+    # Nothing ran inline; the update waits for an ingest worker
+    assert seen == []
+    assert queue.queue_size() == 1
+
+    await queue.start()
+    await _drain(queue)
+    await queue.stop()
+    assert seen == [event]
+
+
+async def test_stop_drains_queued_jobs_within_timeout():
+    queue = IngestQueue(workers=2)
+    await queue.start()
+    results = []
+
+    async def _slow():
+        await asyncio.sleep(0.01)
+        results.append("slow")
+
+    async def _stuck():
+        await asyncio.sleep(10)
+
+    await queue.submit(1, _slow)
+    await queue.stop(drain_timeout=1)
+    assert results == ["slow"]
+
+    queue = IngestQueue(workers=1)
+    await queue.start()
+    await queue.submit(1, _stuck)
+    await queue.submit(1, _slow)
+    await queue.stop(drain_timeout=0.05)
+    assert results == ["slow"]
+
+
+def test_raw_handler_only_receives_reaction_updates():
+    client = MagicMock()
+    handlers = EventHandlers(client, MagicMock(), None, None)
+    handlers.register_handlers(client)
+
+    raw = [
+        call.args[1]
+        for call in client.add_event_handler.call_args_list
+        if isinstance(call.args[1], events.Raw)
+    ]
+    assert len(raw) == 1
+    reaction = UpdateMessageReactions(peer=PeerChannel(1), msg_id=2, reactions=None)
+    assert raw[0].filter(reaction) is reaction
+    assert not raw[0].filter(UpdateUserTyping(user_id=1, action=None))
@@ -0,0 +1,251 @@
+"""Tests for the local pre-classifier that gates remote AI calls."""
+
+import os
+import sqlite3
+import tempfile
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.ai.local_gate import LocalGateClassifier
+from src.ai.local_model import LocalAdModel
+from src.ai.ports import AIClassifier
+from src.ai.sqlite_repo import SqliteLocalModelStore
+from src.ai.verdict_cache import CachingClassifier
+from src.domain.models import SystemEvent
+from src.rules.models import RuleType
+from src.rules.service import RuleService
+from src.users.models import User
+from tests.test_rules import make_message, make_rule
+
+ADS = [
+    f"Big sale {i}! Buy cheap crypto signals, join our channel and earn money fast"
+    for i in range(10)
+]
+NON_ADS = [
+    f"Meeting {i} moved to the small room, bring the printed report and laptops"
+    for i in range(10)
+]
+NEW_AD = "Join our channel and earn money fast with cheap crypto signals, big sale"
+NEW_NON_AD = "Please bring laptops, the meeting moved to the small room today"
+AMBIGUOUS = "Weather forecast says rain tomorrow afternoon in the mountains"
+
+_SCHEMA_SQL = """
+CREATE TABLE ai_local_model (
+    feature INTEGER NOT NULL PRIMARY KEY,
+    ad REAL NOT NULL,
+    ham REAL NOT NULL
+);
+"""
+
+
+class ScriptedClassifier(AIClassifier):
+    def __init__(self, ads=()):
+        self.ads = set(ads)
+        self.calls: List[str] = []
+
+    async def classify_is_ad(self, text):
+        self.calls.append(text)
+        return text in self.ads
+
+
+async def trained_model(store=None) -> LocalAdModel:
+    model = LocalAdModel(store)
+    await model.learn_many(ADS + NON_ADS, [True] * len(ADS) + [False] * len(NON_ADS))
+    return model
+
+
+@pytest.fixture()
+def store():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "model.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(_SCHEMA_SQL)
+        conn.close()
+        s = SqliteLocalModelStore(db_path=path)
+        yield s
+        s._pool.close()
+
+
+async def test_model_separates_learned_classes():
+    model = await trained_model()
+
+    assert model.documents == (10, 10)
+    assert model.predict(NEW_AD) > 0.99
+    assert model.predict(NEW_NON_AD) < 0.01
+    assert 0.01 < model.predict(AMBIGUOUS) < 0.99
+
+
+async def test_model_counts_survive_restart(store):
+    await trained_model(store)
+
+    reloaded = LocalAdModel(store)
+    await reloaded.ensure_loaded()
+
+    assert reloaded.documents == (10, 10)
+    assert reloaded.predict(NEW_AD) > 0.99
+
+
+async def test_gate_escalates_until_model_has_enough_examples():
+    inner = ScriptedClassifier(ads=ADS)
+    gate = LocalGateClassifier(inner, LocalAdModel(), min_examples=10)
+
+    for text in ADS + NON_ADS:
+        await gate.classify_is_ad(text)
+
+    assert len(inner.calls) == 20
+    assert gate.stats()["local"] == 0
+    assert gate.stats()["trained_ads"] == 10
+
+
+async def test_gate_resolves_confident_texts_locally():
+    inner = ScriptedClassifier()
+    gate = LocalGateClassifier(
+        inner, await trained_model(), min_examples=10, min_verified=0
+    )
+
+    verdicts = await gate.classify_many([NEW_AD, NEW_NON_AD, AMBIGUOUS])
+
+    assert verdicts == [True, False, False]
+    assert inner.calls == [AMBIGUOUS]
+    stats = gate.stats()
+    assert (stats["local"], stats["escalated"], stats["local_share"]) == (2, 1, 0.667)
+    # Only the escalated verdict is learned
+    assert stats["trained_non_ads"] == 11
+
+
+async def test_gate_verifies_sampled_local_decisions():
+    inner = ScriptedClassifier()  # disagrees: nothing is an ad
+    gate = LocalGateClassifier(
+        inner, await trained_model(), min_examples=10, verify_every=2, min_verified=0
+    )
+
+    assert await gate.classify_is_ad(NEW_AD) is True
+    assert await gate.classify_is_ad(NEW_AD) is False
+
+    assert inner.calls == [NEW_AD]
+    assert gate.stats()["verified"] == 1
+    assert gate.stats()["disagreements"] == 1
+
+
+async def test_manual_read_trains_messages_left_unread_as_non_ads():
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = [
+        make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD)
+    ]
+    user_repo = AsyncMock()
+    user_repo.get_user.return_value = User(
+        ai_api_key="test-key", ai_model="gemini-2.0-flash"
+    )
+    model = LocalAdModel()
+    svc = RuleService(rule_repo, AsyncMock(), AsyncMock(), user_repo, local_model=model)
+    text = NON_ADS[0]
+    event = SystemEvent(
+        type="message",
+        text=text,
+        chat_name="Chat",
+        chat_id=100,
+        message_model=make_message(text=text),
+    )
+
+    with patch("src.rules.service.GeminiClassifier") as gemini:
+        gemini.return_value.classify_is_ad = AsyncMock(return_value=False)
+        await svc.handle_new_message_event(event)
+    assert model.documents == (0, 1)
+
+    other = NON_ADS[1]
+    svc._remember_unread_ai_text(100, None, other)
+    await svc.record_manual_read(100)
+    await svc.record_manual_read(100)  # nothing left to learn
+
+    # The text Gemini already labelled is not counted a second time
+    assert model.documents == (0, 2)
+    assert svc.ai_stats()["local_gate"]["escalated"] == 1
+
+
+async def test_manual_read_does_not_learn_locally_resolved_texts():
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = [
+        make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD)
+    ]
+    user_repo = AsyncMock()
+    user_repo.get_user.return_value = User(
+        ai_api_key="test-key", ai_model="gemini-2.0-flash"
+    )
+    model = await trained_model()
+    svc = RuleService(rule_repo, AsyncMock(), AsyncMock(), user_repo, local_model=model)
+    user = await user_repo.get_user(1)
+    gate = svc._create_ai_classifier(user)
+    gate._min_examples = 10
+    gate._min_verified = 0
+    event = SystemEvent(
+        type="message",
+        text=NEW_NON_AD,
+        chat_name="Chat",
+        chat_id=100,
+        message_model=make_message(text=NEW_NON_AD),
+    )
+
+    with patch("src.rules.service.GeminiClassifier") as gemini:
+        gemini.return_value.classify_is_ad = AsyncMock(return_value=True)
+        await svc.handle_new_message_event(event)
+    await svc.record_manual_read(100)
+
+    assert gate.stats()["local"] == 1
+    assert model.documents == (10, 10)
+
+
+async def test_model_counts_each_text_once():
+    model = LocalAdModel()
+
+    await model.learn_many([ADS[0], ADS[0].upper()], [True, True])
+    await model.learn_many([ADS[0]], [True])
+
+    assert model.documents == (1, 0)
+
+
+async def test_gate_decides_locally_only_after_verified_agreement():
+    inner = ScriptedClassifier(ads={NEW_AD})
+    gate = LocalGateClassifier(
+        inner, await trained_model(), min_examples=10, min_verified=2
+    )
+
+    for _ in range(3):
+        assert await gate.classify_is_ad(NEW_AD) is True
+
+    # The first two confident decisions were checked remotely
+    assert inner.calls == [NEW_AD, NEW_AD]
+    assert gate.stats()["trusted"] is True
+    assert gate.stats()["local"] == 1
+
+
+async def test_gate_stops_deciding_locally_when_it_disagrees():
+    inner = ScriptedClassifier()  # disagrees: nothing is an ad
+    gate = LocalGateClassifier(
+        inner, await trained_model(), min_examples=10, min_verified=2
+    )
+
+    for _ in range(4):
+        assert await gate.classify_is_ad(NEW_AD) is False
+
+    assert len(inner.calls) == 4
+    assert gate.stats()["trusted"] is False
+
+
+def test_local_gate_wraps_cache_and_near_duplicate_stages():
+    svc = RuleService(
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        verdict_cache=AsyncMock(),
+        local_model=LocalAdModel(),
+    )
+
+    classifier = svc._create_ai_classifier(
+        User(ai_api_key="test-key", ai_model="gemini-2.0-flash")
+    )
+
+    assert isinstance(classifier, LocalGateClassifier)
+    assert isinstance(classifier._inner, CachingClassifier)
@@ -0,0 +1,135 @@
+"""Tests for ParsedMessageCache and its use in history loading."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.adapters.telegram.chat_query_ops import ChatQueryOps
+from src.adapters.telegram.event_handlers import EventHandlers
+from src.adapters.telegram.message_cache import ParsedMessageCache
+from src.domain.models import Message, Reaction
+
+EDITED = datetime(2024, 1, 2)
+
+
+def _message(msg_id: int, text: str = "hi") -> Message:
+    return Message(
+        id=msg_id,
+        text=text,
+        date=datetime(2024, 1, 1),
+        sender_name="",
+        is_outgoing=False,
+    )
+
+
+def test_hit_requires_matching_edit_date():
+    cache = ParsedMessageCache()
+    cache.put(1, None, _message(10))
+
+    assert cache.get(1, 10, None).text == "hi"
+    assert cache.get(1, 10, EDITED) is None
+    assert cache.get(2, 10, None) is None
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 2}
+
+
+def test_returned_copies_do_not_leak_mutations():
+    cache = ParsedMessageCache()
+    cache.put(1, None, _message(10))
+
+    cache.get(1, 10, None).text = "changed"
+
+    assert cache.get(1, 10, None).text == "hi"
+
+
+def test_lru_bound_and_invalidate():
+    cache = ParsedMessageCache(max_entries=2)
+    for msg_id in (1, 2, 3):
+        cache.put(1, None, _message(msg_id))
+
+    assert cache.get(1, 1, None) is None
+    cache.invalidate(1, 3)
+    assert cache.get(1, 3, None) is None
+    assert cache.get(1, 2, None) is not None
+
+
+class FakeClient:
+    def __init__(self, messages):
+        self.messages = messages
+
+    async def get_entity(self, chat_id):
+        return SimpleNamespace(id=chat_id)
+
+    async def get_messages(self, entity, **kwargs):
+        return self.messages
+
+
+class CountingParser:
+    def __init__(self):
+        self.parsed = []
+
+    def _cache_message_chat(self, msg_id, chat_id):
+        pass
+
+    async def resolve_senders(self, messages):
+        return {}
+
+    def render_text(self, msg):
+        return msg.message
+
+    def _extract_reactions(self, reactions):
+        return [Reaction(emoji=e, count=1, is_chosen=False) for e in reactions or []]
+
+    async def _parse_message(self, msg, replies_map, chat_id, senders_map, text):
+        self.parsed.append(msg.id)
+        return _message(msg.id, text)
+
+
+def _raw(msg_id, message="hi", edit_date=None, reactions=None):
+    return SimpleNamespace(
+        id=msg_id,
+        message=message,
+        edit_date=edit_date,
+        reactions=reactions,
+        reply_to=None,
+    )
+
+
+async def test_reopening_chat_reuses_parsed_messages():
+    parser = CountingParser()
+    client = FakeClient([_raw(1), _raw(2)])
+    ops = ChatQueryOps(client, parser, media=None)
+
+    await ops.get_messages(100)
+    client.messages = [_raw(1, reactions=["👍"]), _raw(2, "new", edit_date=EDITED)]
+    result = await ops.get_messages(100, ids=[1, 2])
+
+    assert parser.parsed == [1, 2, 2]
+    assert [m.text for m in result] == ["hi", "new"]
+    # Reactions are refreshed from the raw message even on a hit
+    assert [r.emoji for r in result[0].reactions] == ["👍"]
+    assert ops._messages.stats()["hits"] == 1
+
+
+async def test_edit_and_delete_events_invalidate_entries():
+    cache = ParsedMessageCache()
+    cache.put(100, None, _message(1))
+    cache.put(100, None, _message(2))
+    parser = SimpleNamespace(
+        _cache_message_chat=lambda *a: None,
+        _parse_message=AsyncMock(return_value=_message(1)),
+        _msg_id_to_chat_id={},
+    )
+    handlers = EventHandlers(None, parser, None, None, message_cache=cache)
+
+    edited = SimpleNamespace(
+        chat_id=100,
+        message=SimpleNamespace(id=1, reply_to=None),
+        get_chat=AsyncMock(return_value=None),
+    )
+    await handlers._handle_edited_message(edited)
+    deleted = SimpleNamespace(chat_id=100, deleted_ids=[2])
+    handlers._entities.get_display_name = AsyncMock(return_value="Chat")
+    await handlers._handle_deleted_message(deleted)
+
+    assert cache.get(100, 1, None) is None
+    assert cache.get(100, 2, None) is None
@@ -0,0 +1,133 @@
+"""Tests for MessageParser batched sender resolution."""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from telethon import functions, types
+
+from src.adapters.telegram.message_parser import MessageParser
+
+
+class FakeClient:
+    def __init__(self):
+        self.requests = []
+        self.get_entity = AsyncMock()
+        self.input_lookups = 0
+        self.concurrent_lookups = 0
+        self.max_concurrent_lookups = 0
+
+    async def get_input_entity(self, peer):
+        self.input_lookups += 1
+        self.concurrent_lookups += 1
+        self.max_concurrent_lookups = max(
+            self.max_concurrent_lookups, self.concurrent_lookups
+        )
+        await asyncio.sleep(0)
+        self.concurrent_lookups -= 1
+        if isinstance(peer, types.PeerUser):
+            return types.InputPeerUser(user_id=peer.user_id, access_hash=1)
+        return types.InputPeerChannel(channel_id=peer.channel_id, access_hash=1)
+
+    async def __call__(self, request):
+        self.requests.append(request)
+        if isinstance(request, functions.users.GetUsersRequest):
+            return [
+                types.User(id=u.user_id, first_name=f"User {u.user_id}", access_hash=1)
+                for u in request.id
+            ]
+        return SimpleNamespace(
+            chats=[
+                types.Channel(
+                    id=c.channel_id,
+                    title=f"Channel {c.channel_id}",
+                    photo=types.ChatPhotoEmpty(),
+                    date=None,
+                    access_hash=1,
+                )
+                for c in request.id
+            ]
+        )
+
+
+def _msg(msg_id: int, from_id) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=msg_id,
+        from_id=from_id,
+        sender=None,
+        message="hi",
+        entities=[],
+        date=datetime(2024, 1, 1),
+    )
+
+
+def _make_parser(client) -> MessageParser:
+    media = SimpleNamespace(_get_chat_image=AsyncMock(return_value=None))
+    return MessageParser(client, media)
+
+
+async def test_unknown_senders_resolved_in_one_request_per_kind():
+    client = FakeClient()
+    parser = _make_parser(client)
+    messages = [
+        _msg(1, types.PeerUser(10)),
+        _msg(2, types.PeerUser(11)),
+        _msg(3, types.PeerUser(10)),
+        _msg(4, types.PeerChannel(20)),
+    ]
+
+    senders = await parser.resolve_senders(messages)
+
+    assert [type(r) for r in client.requests] == [
+        functions.users.GetUsersRequest,
+        functions.channels.GetChannelsRequest,
+    ]
+    assert len(client.requests[0].id) == 2
+    assert set(senders) == {10, 11, -1000000000020}
+
+    parsed = [await parser._parse_message(m, senders_map=senders) for m in messages]
+    assert [p.sender_name for p in parsed] == [
+        "User 10",
+        "User 11",
+        "User 10",
+        "Channel 20",
+    ]
+    client.get_entity.assert_not_awaited()
+
+
+async def test_cached_senders_skip_the_network():
+    client = FakeClient()
+    parser = _make_parser(client)
+    await parser.resolve_senders([_msg(1, types.PeerUser(10))])
+
+    senders = await parser.resolve_senders([_msg(2, types.PeerUser(10))])
+
+    assert len(client.requests) == 1
+    assert senders[10].first_name == "User 10"
+
+
+async def test_messages_with_sender_need_no_resolution():
+    client = FakeClient()
+    parser = _make_parser(client)
+    msg = _msg(1, types.PeerUser(10))
+    msg.sender = types.User(id=10, first_name="Known", access_hash=1)
+
+    assert await parser.resolve_senders([msg, None]) == {}
+    assert client.requests == []
+
+
+async def test_page_access_hashes_need_no_lookup():
+    client = FakeClient()
+    parser = _make_parser(client)
+    known = _msg(1, types.PeerUser(10))
+    known.input_sender = types.InputPeerUser(user_id=10, access_hash=42)
+    unknown = [_msg(2, types.PeerUser(11)), _msg(3, types.PeerChannel(20))]
+
+    senders = await parser.resolve_senders([known, *unknown])
+
+    assert set(senders) == {10, 11, -1000000000020}
+    assert client.requests[0].id[0] == types.InputUser(user_id=10, access_hash=42)
+    # Only the peers without a hash are looked up, and not one after another
+    assert client.input_lookups == 2
+    assert client.max_concurrent_lookups == 2
@@ -0,0 +1,177 @@
+"""Tests for the FTS5 message search index."""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from quart import Quart
+
+from src.application.interactors import ChatInteractor
+from src.domain.models import Chat, ChatType, Message, SystemEvent
+from src.messages.backfill import job_search_backfill
+from src.messages.sqlite_repo import SqliteMessageSearchIndex
+from src.messages.writer import MessageStoreWriter
+from src.web.routes import register_routes
+
+_SCHEMA_SQL = """
+CREATE TABLE search_docs (
+    rowid INTEGER NOT NULL,
+    chat_id INTEGER NOT NULL,
+    msg_id INTEGER NOT NULL,
+    chat_name TEXT,
+    date TEXT NOT NULL,
+    PRIMARY KEY (rowid),
+    CONSTRAINT uq_search_docs_message UNIQUE (chat_id, msg_id)
+);
+CREATE VIRTUAL TABLE message_fts USING fts5(
+    text, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+@pytest.fixture()
+def index():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "search.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(_SCHEMA_SQL)
+        conn.close()
+        idx = SqliteMessageSearchIndex(db_path=path)
+        yield idx
+        idx._pool.close()
+
+
+def _msg(msg_id: int, text: str) -> Message:
+    return Message(
+        id=msg_id,
+        text=text,
+        date=datetime(2024, 1, 1, 12, 0, msg_id % 60),
+        sender_name="Ann",
+        is_outgoing=False,
+    )
+
+
+def _event(type_: str, chat_id: int, msg: Message, **kwargs) -> SystemEvent:
+    return SystemEvent(
+        type=type_,
+        text="",
+        chat_name=f"Chat {chat_id}",
+        chat_id=chat_id,
+        message_model=msg,
+        **kwargs,
+    )
+
+
+async def test_search_ranks_and_highlights(index):
+    await index.index_messages(
+        1,
+        [
+            _msg(1, "deploy tonight"),
+            _msg(2, "deploy deploy <b>deploy</b> now"),
+            _msg(3, "lunch?"),
+        ],
+        chat_name="Ops",
+    )
+
+    hits = await index.search("deploy")
+
+    assert [h.msg_id for h in hits] == [2, 1]
+    assert hits[0].chat_name == "Ops"
+    assert hits[0].date == datetime(2024, 1, 1, 12, 0, 2)
+    assert "<mark>deploy</mark>" in hits[0].snippet
+    # Message HTML is stripped before indexing, not leaked into snippets
+    assert "<b>" not in hits[0].snippet
+
+
+async def test_search_prefix_diacritics_and_chat_filter(index):
+    await index.index_messages(1, [_msg(1, "Café opening")])
+    await index.index_messages(2, [_msg(1, "cafe closed")])
+
+    assert {h.chat_id for h in await index.search("cafe")} == {1, 2}
+    assert [h.chat_id for h in await index.search("caf", chat_id=2)] == [2]
+    assert await index.search("open") != []
+
+
+async def test_search_tolerates_fts_syntax_in_query(index):
+    await index.index_messages(1, [_msg(1, "a AND b OR c")])
+
+    # Operators and quotes are matched as plain words, never as FTS syntax
+    assert [h.msg_id for h in await index.search('"AND* ) (')] == [1]
+    assert await index.search('NOT "z') == []
+    assert [h.msg_id for h in await index.search("AND b")] == [1]
+    assert await index.search("  ") == []
+
+
+async def test_snippet_escapes_message_text(index):
+    await index.index_messages(1, [_msg(1, "x &lt;script&gt; token")])
+
+    hits = await index.search("token")
+
+    assert "&lt;script&gt;" in hits[0].snippet
+    assert "<script>" not in hits[0].snippet
+
+
+async def test_writer_keeps_index_in_sync_with_events(index):
+    writer = MessageStoreWriter([index])
+
+    await writer.handle_event(_event("message", 5, _msg(10, "old wording")))
+    await writer.flush()
+    await writer.handle_event(_event("edited", 5, _msg(10, "new wording")))
+    await writer.handle_event(_event("message", 5, _msg(11, "other wording")))
+    await writer.flush()
+
+    assert await index.search("old") == []
+    hits = await index.search("wording")
+    assert {h.msg_id for h in hits} == {10, 11}
+    assert hits[0].chat_name == "Chat 5"
+
+    await writer.handle_event(_event("deleted", 5, _msg(10, ""), deleted_ids=[10, 11]))
+    await writer.flush()
+
+    assert await index.search("wording") == []
+
+
+async def test_interactor_indexes_fetched_pages(index):
+    repo = AsyncMock()
+    repo.get_messages.return_value = [_msg(3, "fetched history")]
+    interactor = ChatInteractor(repo, AsyncMock(), AsyncMock(), search_index=index)
+
+    await interactor.get_chat_messages(7)
+    hits = await interactor.search_messages("history", chat_id=7)
+
+    assert [(h.chat_id, h.msg_id) for h in hits] == [(7, 3)]
+
+
+async def test_backfill_walks_pages_of_recent_chats(index):
+    repo = AsyncMock()
+    repo.get_chats.return_value = [
+        Chat(id=9, name="Team", unread_count=0, type=ChatType.GROUP)
+    ]
+    repo.get_messages.side_effect = [
+        [_msg(5, "newest"), _msg(4, "newer")],
+        [_msg(3, "oldest")],
+    ]
+
+    await job_search_backfill(repo, index, asyncio.Event(), chats=5, pages=3)
+
+    assert repo.get_messages.await_args_list[1].kwargs["offset_id"] == 4
+    hits = await index.search("oldest")
+    assert [(h.chat_name, h.msg_id) for h in hits] == [("Team", 3)]
+
+
+@pytest.mark.parametrize("raw, expected", [("-1", 1), ("0", 1), ("500", 100)])
+async def test_search_route_clamps_limit(raw, expected):
+    app = Quart(__name__)
+    register_routes(app)
+    app.tg_adapter = MagicMock()
+    app.chat_interactor = AsyncMock()
+    app.chat_interactor.search_messages.return_value = []
+
+    response = await app.test_client().get(f"/api/search?q=hello&limit={raw}")
+
+    assert response.status_code == 200
+    assert app.chat_interactor.search_messages.await_args.kwargs["limit"] == expected
@@ -0,0 +1,195 @@
+"""Tests for the local SQLite message store and its write-behind writer."""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.adapters.telegram import TelethonAdapter
+from src.application.interactors import ChatInteractor
+from src.domain.models import Message, Reaction, SystemEvent
+from src.messages.sqlite_repo import SqliteMessageStore
+from src.messages.writer import MessageStoreWriter
+
+_SCHEMA_SQL = """
+CREATE TABLE messages (
+    chat_id INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    topic_id INTEGER,
+    prev_id INTEGER,
+    date TEXT NOT NULL,
+    data TEXT NOT NULL,
+    reactions TEXT,
+    PRIMARY KEY (chat_id, id)
+);
+CREATE INDEX ix_messages_chat_topic_id ON messages (chat_id, topic_id, id);
+"""
+
+CHAT = 100
+
+
+@pytest.fixture()
+def store():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "messages.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(_SCHEMA_SQL)
+        conn.close()
+        s = SqliteMessageStore(db_path=path)
+        yield s
+        s._pool.close()
+
+
+def _msg(msg_id: int, text: str = "", **kwargs) -> Message:
+    return Message(
+        id=msg_id,
+        text=text or f"m{msg_id}",
+        date=datetime(2024, 1, 1, 12, 0, msg_id % 60),
+        sender_name="Ann",
+        is_outgoing=False,
+        **kwargs,
+    )
+
+
+def _page(top: int, size: int) -> list[Message]:
+    return [_msg(i) for i in range(top, top - size, -1)]
+
+
+def _event(type_: str, msg: Message, **kwargs) -> SystemEvent:
+    return SystemEvent(
+        type=type_, text="", chat_name="c", chat_id=CHAT, message_model=msg, **kwargs
+    )
+
+
+async def test_first_page_needs_network_once(store):
+    assert await store.get_page(CHAT, 3) is None
+
+    await store.save_page(CHAT, None, _page(10, 3), offset_id=0, limit=3)
+    page = await store.get_page(CHAT, 3)
+
+    assert [m.id for m in page] == [10, 9, 8]
+    assert page[0].date == datetime(2024, 1, 1, 12, 0, 10)
+
+
+async def test_older_page_is_served_only_when_linked(store):
+    await store.save_page(CHAT, None, _page(10, 3), offset_id=0, limit=3)
+    # Nothing known below 8 yet
+    assert await store.get_page(CHAT, 3, offset_id=8) is None
+
+    await store.save_page(CHAT, None, _page(7, 3), offset_id=8, limit=3)
+    assert [m.id for m in await store.get_page(CHAT, 3, offset_id=8)] == [7, 6, 5]
+
+
+async def test_short_page_marks_chat_start(store):
+    await store.save_page(CHAT, None, _page(2, 2), offset_id=0, limit=3)
+
+    assert [m.id for m in await store.get_page(CHAT, 3)] == [2, 1]
+    assert await store.get_page(CHAT, 3, offset_id=1) == []
+
+
+async def test_live_messages_extend_a_known_head(store):
+    await store.save_page(CHAT, None, _page(10, 3), offset_id=0, limit=3)
+    writer = MessageStoreWriter([store])
+
+    await writer.handle_event(_event("message", _msg(11, reply_to_msg_id=9)))
+    await writer.handle_event(_event("message", _msg(12)))
+    await writer.flush()
+
+    page = await store.get_page(CHAT, 3)
+    assert [m.id for m in page] == [12, 11, 10]
+    # Live messages carry no quote; it is filled from the stored original
+    assert page[1].reply_to_text == "m9"
+    assert page[1].reply_to_sender_name == "Ann"
+
+
+async def test_live_messages_in_unknown_chat_do_not_fake_continuity(store):
+    writer = MessageStoreWriter([store])
+    await writer.handle_event(_event("message", _msg(11)))
+    await writer.flush()
+
+    await store.save_page(CHAT, None, _page(10, 3), offset_id=0, limit=3)
+    # 11 was stored before the head was known, so the page is not trusted
+    assert await store.get_page(CHAT, 3) is None
+
+
+async def test_edit_reaction_and_delete_events(store):
+    await store.save_page(CHAT, None, _page(10, 4), offset_id=0, limit=4)
+    writer = MessageStoreWriter([store])
+
+    await writer.handle_event(_event("edited", _msg(10, "edited")))
+    await writer.handle_event(
+        _event(
+            "reaction_update",
+            _msg(9, reactions=[Reaction(emoji="👍", count=2, is_chosen=True)]),
+        )
+    )
+    await writer.handle_event(_event("deleted", _msg(8), deleted_ids=[8]))
+    await writer.flush()
+
+    page = await store.get_page(CHAT, 3)
+    assert [m.id for m in page] == [10, 9, 7]
+    assert page[0].text == "edited"
+    assert page[1].reactions == [Reaction(emoji="👍", count=2, is_chosen=True)]
+
+
+async def test_writer_flushes_periodically(store):
+    await store.save_page(CHAT, None, _page(10, 1), offset_id=0, limit=1)
+    writer = MessageStoreWriter([store], flush_interval=0.01)
+    shutdown = asyncio.Event()
+    task = asyncio.create_task(writer.run(shutdown))
+
+    await writer.handle_event(_event("message", _msg(11)))
+    await asyncio.sleep(0.05)
+    shutdown.set()
+    await task
+
+    assert [m.id for m in await store.get_page(CHAT, 1)] == [11]
+
+
+async def test_interactor_serves_local_pages_and_saves_network_ones():
+    repo = AsyncMock()
+    repo.get_messages = AsyncMock(return_value=_page(10, 3))
+    store = AsyncMock()
+    store.get_page = AsyncMock(return_value=None)
+    interactor = ChatInteractor(repo, AsyncMock(), AsyncMock(), message_store=store)
+
+    await interactor.get_chat_messages(CHAT)
+    store.save_page.assert_awaited_once()
+
+    store.get_page.return_value = _page(10, 3)
+    repo.get_messages.reset_mock()
+    result = await interactor.get_chat_messages(CHAT)
+
+    repo.get_messages.assert_not_awaited()
+    assert [m.id for m in result] == [10, 9, 8]
+
+
+async def test_reconnect_sends_the_next_first_page_to_the_network(
+    store, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)  # the adapter creates its media cache here
+    adapter = TelethonAdapter(session_string=None, api_id=1, api_hash="hash")
+    adapter.add_reconnect_listener(store.reset_live_chats)
+    repo = AsyncMock()
+    repo.get_messages = AsyncMock(return_value=_page(10, 3))
+    interactor = ChatInteractor(repo, AsyncMock(), AsyncMock(), message_store=store)
+    writer = MessageStoreWriter([store])
+
+    await interactor.get_chat_messages(CHAT)
+    await interactor.get_chat_messages(CHAT)
+    assert repo.get_messages.await_count == 1
+
+    # Telethon reconnected by itself; 11 was sent while it was down
+    await adapter.client._handle_auto_reconnect()
+    await writer.handle_event(_event("message", _msg(12)))
+    await writer.flush()
+
+    repo.get_messages.return_value = _page(12, 3)
+    result = await interactor.get_chat_messages(CHAT)
+
+    assert repo.get_messages.await_count == 2
+    assert [m.id for m in result] == [12, 11, 10]
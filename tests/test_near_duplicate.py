@@ -0,0 +1,95 @@
+"""Tests for SimHash near-duplicate reuse of AI ad verdicts."""
+
+from typing import List
+
+import pytest
+
+from src.ai.near_duplicate import NearDuplicateClassifier
+from src.ai.ports import AIClassifier
+from src.ai.simhash import SimHashIndex, hamming, simhash
+
+AD = (
+    "🔥 Earn 500$ per day working from home! No experience needed. Write to "
+    "our manager on WhatsApp +7 999 123 45 67 and start today. Limited places!"
+)
+AD_VARIANT = (
+    "💰 Earn 700$ per day working from home!! No experience needed. Write to "
+    "our manager on Telegram +7 912 555 00 11 and start today. Limited places"
+)
+CHAT = (
+    "Hey everyone, the meeting tomorrow is moved to the small room, please "
+    "bring your laptops and the printed report from last week."
+)
+
+
+class ScriptedClassifier(AIClassifier):
+    def __init__(self, ads=()):
+        self.ads = set(ads)
+        self.calls: List[str] = []
+
+    async def classify_is_ad(self, text):
+        self.calls.append(text)
+        return text in self.ads
+
+
+def test_simhash_is_close_for_variants_and_far_for_unrelated_text():
+    assert hamming(simhash(AD), simhash(AD_VARIANT)) <= 6
+    assert hamming(simhash(AD), simhash(CHAT)) > 12
+
+
+def test_index_finds_nearest_within_threshold_and_evicts():
+    index = SimHashIndex(bands=4, max_distance=2, max_entries=2)
+    index.add(0b1111, True, "a")
+    index.add(1 << 40, True, "b")
+
+    match = index.lookup(0b0111)
+    assert match is not None and (match.sample, match.distance) == ("a", 1)
+    assert index.lookup(0b0000_0000_1111_0000) is None
+
+    index.add(0xFF << 48, True, "c")  # evicts "b", the least recently used
+    assert len(index) == 2
+    assert index.lookup(1 << 40) is None
+
+
+def test_index_rejects_threshold_without_band_guarantee():
+    with pytest.raises(ValueError):
+        SimHashIndex(bands=4, max_distance=4)
+
+
+async def test_variant_of_known_ad_reuses_verdict():
+    inner = ScriptedClassifier(ads={AD})
+    classifier = NearDuplicateClassifier(inner)
+
+    assert await classifier.classify_is_ad(AD) is True
+    assert await classifier.classify_is_ad(AD_VARIANT) is True
+    assert await classifier.classify_is_ad(CHAT) is False
+
+    assert inner.calls == [AD, CHAT]
+    assert classifier.stats()["hits"] == 1
+
+
+async def test_non_ad_verdicts_and_short_texts_are_not_reused():
+    inner = ScriptedClassifier()
+    classifier = NearDuplicateClassifier(inner)
+
+    await classifier.classify_is_ad(CHAT)
+    await classifier.classify_is_ad(CHAT)
+    await classifier.classify_is_ad("buy now")
+    await classifier.classify_is_ad("buy now")
+
+    assert len(inner.calls) == 4
+    assert classifier.stats()["lookups"] == 2
+
+
+async def test_sampled_hits_are_verified_and_false_reuse_counted():
+    inner = ScriptedClassifier(ads={AD})
+    classifier = NearDuplicateClassifier(inner, verify_every=2)
+
+    await classifier.classify_is_ad(AD)
+    await classifier.classify_is_ad(AD_VARIANT)  # hit 1: reused
+    verdict = await classifier.classify_is_ad(AD_VARIANT)  # hit 2: verified
+
+    assert verdict is False
+    assert inner.calls == [AD, AD_VARIANT]
+    assert classifier.stats()["verified"] == 1
+    assert classifier.stats()["false_reuse"] == 1
@@ -1,9 +1,13 @@
 """Tests for AI classification integration in handle_new_message_event (S03)."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from src.ai.ports import AIClassifier
 from src.domain.models import SystemEvent
+from src.infrastructure.tasks import BoundedTaskPool
 from src.rules.models import RuleType
+from src.rules.service import RuleService
 from src.users.models import User
 from tests.test_rules import make_message, make_rule, make_service
 
@@ -36,7 +40,7 @@ def make_event(
 async def test_ai_skipped_when_already_should_read():
     """If an AUTOREAD rule already fired, GeminiClassifier is never instantiated."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AUTOREAD),
         make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD),
     ]
@@ -54,7 +58,7 @@ async def test_ai_skipped_when_already_should_read():
 async def test_ai_skipped_when_ai_autoread_not_enabled():
     """If there is no AI_AUTOREAD rule, GeminiClassifier is never instantiated."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = []  # No rules at all
+    rule_repo.get_all.return_value = []  # No rules at all
     user_repo = AsyncMock()
     user_repo.get_user.return_value = User(
         ai_api_key="test-key", ai_model="gemini-2.0-flash"
@@ -69,7 +73,7 @@ async def test_ai_skipped_when_ai_autoread_not_enabled():
 async def test_ai_skipped_when_no_api_key():
     """AI_AUTOREAD is enabled but user has no api_key — classifier never instantiated."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD),
     ]
     user_repo = AsyncMock()
@@ -84,7 +88,7 @@ async def test_ai_skipped_when_no_api_key():
 async def test_ai_classifies_ad_marks_read():
     """When classifier returns True (ad), message is marked read with ai_ad_detected."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD),
     ]
     user_repo = AsyncMock()
@@ -115,7 +119,7 @@ async def test_ai_classifies_ad_marks_read():
 async def test_ai_classifies_not_ad_skips():
     """When classifier returns False (not ad), message is NOT marked read."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD),
     ]
     user_repo = AsyncMock()
@@ -144,7 +148,7 @@ async def test_ai_classifies_not_ad_skips():
 async def test_ai_failure_logs_warning_skips():
     """On classifier exception, message stays unread (no false positive)."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD),
     ]
     user_repo = AsyncMock()
@@ -173,7 +177,7 @@ async def test_ai_failure_logs_warning_skips():
 
 async def test_ai_classifier_reused_for_same_settings():
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD),
     ]
     user_repo = AsyncMock()
@@ -209,7 +213,7 @@ async def test_startup_scan_no_ai():
     chat = Chat(id=100, name="Test", unread_count=3, type=ChatType.GROUP)
     rule_repo = AsyncMock()
     # AI_AUTOREAD rule present but no AUTOREAD rule
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD),
     ]
     user_repo = AsyncMock()
@@ -233,3 +237,122 @@ async def test_startup_scan_no_ai():
 
     # No AUTOREAD rule, so chat should not have been marked read
     chat_repo.mark_as_read.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Async verdict mode
+# ---------------------------------------------------------------------------
+
+
+class BlockingClassifier(AIClassifier):
+    def __init__(self, verdict: bool):
+        self.verdict = verdict
+        self.release = asyncio.Event()
+
+    async def classify_is_ad(self, text):
+        await self.release.wait()
+        return self.verdict
+
+
+def make_async_service(classifier, rules, chat_repo, action_repo):
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = rules
+    user_repo = AsyncMock()
+    user_repo.get_user.return_value = User(
+        ai_api_key="test-key", ai_model="gemini-2.0-flash"
+    )
+    return RuleService(
+        rule_repo,
+        action_repo,
+        chat_repo,
+        user_repo,
+        ai_classifier_factory=lambda user: classifier,
+        ai_async=True,
+    )
+
+
+async def test_async_mode_dispatches_before_verdict_then_marks_ad_read():
+    classifier = BlockingClassifier(verdict=True)
+    chat_repo = AsyncMock()
+    action_repo = AsyncMock()
+    svc = make_async_service(
+        classifier,
+        [make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD)],
+        chat_repo,
+        action_repo,
+    )
+    event = make_event()
+
+    await svc.handle_new_message_event(event)
+
+    assert event.is_read is False
+    chat_repo.mark_as_read.assert_not_called()
+
+    classifier.release.set()
+    await svc.shutdown()
+
+    chat_repo.mark_as_read.assert_called_once_with(100, None, max_id=1)
+    assert action_repo.add_log.call_args[0][0].reason == "ai_ad_detected"
+    assert svc.ai_stats()["async_verdicts"]["completed"] == 1
+
+
+async def test_async_mode_leaves_non_ads_unread():
+    classifier = BlockingClassifier(verdict=False)
+    classifier.release.set()
+    chat_repo = AsyncMock()
+    action_repo = AsyncMock()
+    svc = make_async_service(
+        classifier,
+        [make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD)],
+        chat_repo,
+        action_repo,
+    )
+
+    await svc.handle_new_message_event(make_event())
+    await svc.shutdown()
+
+    chat_repo.mark_as_read.assert_not_called()
+    action_repo.add_log.assert_not_called()
+
+
+async def test_async_mode_keeps_rule_reads_synchronous():
+    classifier = BlockingClassifier(verdict=True)
+    chat_repo = AsyncMock()
+    svc = make_async_service(
+        classifier,
+        [
+            make_rule(chat_id=100, rule_type=RuleType.AUTOREAD),
+            make_rule(chat_id=100, rule_type=RuleType.AI_AUTOREAD),
+        ],
+        chat_repo,
+        AsyncMock(),
+    )
+    event = make_event()
+
+    await svc.handle_new_message_event(event)
+
+    assert event.is_read is True
+    chat_repo.mark_as_read.assert_called_once_with(100, None, max_id=1)
+    assert svc.ai_stats()["async_verdicts"]["pending"] == 0
+
+
+async def test_task_pool_rejects_jobs_beyond_max_pending():
+    release = asyncio.Event()
+    pool = BoundedTaskPool(MagicMock(), "test", concurrency=1, max_pending=2)
+
+    assert pool.submit(release.wait) is True
+    assert pool.submit(release.wait) is True
+    assert pool.submit(release.wait) is False
+
+    release.set()
+    await pool.shutdown(timeout=1)
+    assert pool.stats() == {"pending": 0, "completed": 2, "rejected": 1}
+
+
+async def test_task_pool_shutdown_cancels_jobs_past_timeout():
+    pool = BoundedTaskPool(MagicMock(), "test", concurrency=1, max_pending=2)
+    pool.submit(asyncio.Event().wait)
+
+    await pool.shutdown(timeout=0.01)
+
+    assert pool.stats() == {"pending": 0, "completed": 0, "rejected": 0}
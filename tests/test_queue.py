@@ -1,16 +1,16 @@
-"""Tests for TelegramWriteQueue."""
+"""Tests for TelegramWriteScheduler."""
 
 import asyncio
 from unittest.mock import patch
 
 import src.infrastructure.telegram_queue as tq_module
-from src.infrastructure.telegram_queue import TelegramWriteQueue
+from src.infrastructure.telegram_queue import TelegramWriteScheduler
 
 
 async def test_enqueued_ops_run_in_order():
     """Operations must execute in FIFO order."""
     results = []
-    queue = TelegramWriteQueue()
+    queue = TelegramWriteScheduler()
     await queue.start()
 
     for i in range(5):
@@ -37,7 +37,7 @@ async def test_flood_wait_retries_operation():
     results = []
     call_count = [0]
 
-    queue = TelegramWriteQueue()
+    queue = TelegramWriteScheduler()
     await queue.start()
 
     async def _op():
@@ -58,7 +58,7 @@ async def test_flood_wait_retries_operation():
 async def test_failing_op_does_not_crash_worker():
     """A failing operation logs the error but the worker continues processing."""
     results = []
-    queue = TelegramWriteQueue()
+    queue = TelegramWriteScheduler()
     await queue.start()
 
     async def _bad():
@@ -79,7 +79,7 @@ async def test_failing_op_does_not_crash_worker():
 
 async def test_queue_size_reflects_pending_ops():
     """queue_size() reports the number of unprocessed items."""
-    queue = TelegramWriteQueue()
+    queue = TelegramWriteScheduler()
     await queue.start()
 
     done = asyncio.Event()
@@ -108,7 +108,7 @@ async def test_queue_size_reflects_pending_ops():
 
 async def test_stop_is_idempotent():
     """Calling stop() on an already-stopped queue does not raise."""
-    queue = TelegramWriteQueue()
+    queue = TelegramWriteScheduler()
     await queue.start()
     await queue.stop()
     await queue.stop()  # second stop should be a no-op
@@ -117,7 +117,7 @@ async def test_stop_is_idempotent():
 async def test_enqueue_before_start_drains_after_start():
     """Items enqueued before start() are processed after the worker launches."""
     results = []
-    queue = TelegramWriteQueue()
+    queue = TelegramWriteScheduler()
 
     async def _op():
         results.append(1)
@@ -130,3 +130,153 @@ async def test_enqueue_before_start_drains_after_start():
     await queue.stop()
 
     assert results == [1]
+
+
+async def test_different_peers_run_concurrently():
+    """A slow operation for one peer does not hold up another peer."""
+    queue = TelegramWriteScheduler()
+    await queue.start()
+    release = asyncio.Event()
+    results = []
+
+    async def _slow():
+        await release.wait()
+        results.append("slow")
+
+    async def _fast():
+        results.append("fast")
+
+    await queue.enqueue(_slow, peer=1)
+    await queue.enqueue(_fast, peer=2)
+    await asyncio.sleep(0.05)
+
+    assert results == ["fast"]
+    release.set()
+    await asyncio.sleep(0.05)
+    await queue.stop()
+    assert results == ["fast", "slow"]
+
+
+async def test_flood_wait_parks_only_affected_method():
+    """While one method is parked, other methods keep flowing."""
+
+    class FakeFloodWait(Exception):
+        seconds = 0.2
+
+    results = []
+    calls = [0]
+    queue = TelegramWriteScheduler()
+    await queue.start()
+
+    async def _react():
+        calls[0] += 1
+        if calls[0] == 1:
+            raise FakeFloodWait()
+        results.append("react")
+
+    async def _react_other_chat():
+        results.append("react2")
+
+    async def _read():
+        results.append("read")
+
+    with patch.object(tq_module, "FloodWaitError", FakeFloodWait):
+        await queue.enqueue(_react, method="send_reaction", peer=1)
+        await asyncio.sleep(0.05)
+        await queue.enqueue(_react_other_chat, method="send_reaction", peer=2)
+        await queue.enqueue(_read, method="read_history", peer=1)
+        await asyncio.sleep(0.05)
+
+        assert results == ["read"]
+        assert queue.stats()["parked_methods"] == ["send_reaction"]
+
+        await asyncio.sleep(0.3)
+
+    await queue.stop()
+    # The parked op kept its place ahead of the newer one
+    assert results == ["read", "react", "react2"]
+    assert queue.stats()["flood_waits"] == 1
+
+
+async def test_higher_priority_runs_first():
+    """User-initiated writes overtake queued background ones."""
+    results = []
+    queue = TelegramWriteScheduler()
+
+    async def _op(name):
+        results.append(name)
+
+    with tq_module.write_priority(tq_module.PRIORITY_BACKGROUND):
+        await queue.enqueue(lambda: _op("autoreact"))
+    await queue.enqueue(lambda: _op("user"), priority=tq_module.PRIORITY_USER)
+
+    await queue.start()
+    await asyncio.sleep(0.05)
+    await queue.stop()
+
+    assert results == ["user", "autoreact"]
+
+
+async def test_peer_bucket_paces_bursts():
+    """Beyond its burst, a peer's operations wait for tokens to refill."""
+    results = []
+    queue = TelegramWriteScheduler(peer_rate=(10.0, 2.0))
+    await queue.start()
+
+    async def _op():
+        results.append(1)
+
+    for _ in range(3):
+        await queue.enqueue(_op, peer=7)
+    await asyncio.sleep(0.03)
+    assert len(results) == 2
+
+    await asyncio.sleep(0.12)
+    await queue.stop()
+    assert len(results) == 3
+
+
+async def test_idle_peer_buckets_are_evicted():
+    """Buckets of peers that were not written to lately do not pile up."""
+    queue = TelegramWriteScheduler(peer_rate=(100.0, 1.0), bucket_sweep_interval=0)
+    await queue.start()
+
+    async def _op():
+        pass
+
+    for peer in range(5):
+        await queue.enqueue(_op, peer=peer)
+    await asyncio.sleep(0.01)
+    assert len(queue._peer_buckets) == 5
+
+    await asyncio.sleep(0.05)
+    await queue.enqueue(_op, peer=99)
+    await asyncio.sleep(0.01)
+    await queue.stop()
+
+    assert set(queue._peer_buckets) == {99}
+
+
+async def test_enqueue_many_keeps_priority_and_fifo_order():
+    """A batch is merged into the queue in (priority, submission) order."""
+    results = []
+    queue = TelegramWriteScheduler()
+
+    async def _op(name):
+        results.append(name)
+
+    await queue.enqueue(lambda: _op("first"))
+    await queue.enqueue_many(
+        [
+            tq_module.WriteJob(lambda: _op("batch-1")),
+            tq_module.WriteJob(lambda: _op("urgent"), priority=tq_module.PRIORITY_USER),
+            tq_module.WriteJob(lambda: _op("batch-2")),
+        ]
+    )
+    assert queue.queue_size() == 4
+
+    await queue.start()
+    await asyncio.sleep(0.05)
+    await queue.stop()
+
+    assert results == ["urgent", "first", "batch-1", "batch-2"]
@@ -4,14 +4,21 @@ from types import SimpleNamespace
 from telethon import functions
 
 from src.adapters.telegram.read_ops import ReadOps
+from src.infrastructure.telegram_queue import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_USER,
+    write_priority,
+)
 
 
 class ManualQueue:
     def __init__(self):
         self.items = []
+        self.tags = []
 
-    async def enqueue(self, coro_fn):
+    async def enqueue(self, coro_fn, **tags):
         self.items.append(coro_fn)
+        self.tags.append(tags)
 
     async def run_next(self):
         await self.items.pop(0)()
@@ -177,3 +184,18 @@ async def test_different_chats_keep_separate_read_all_calls():
     await queue.run_next()
 
     assert client.read_ack_calls == [("peer-100", None), ("peer-200", None)]
+
+
+async def test_reads_are_tagged_with_method_peer_and_merged_priority():
+    queue = ManualQueue()
+    ops = make_ops(FakeClient(), queue, coalesce_delay=0.01)
+
+    with write_priority(PRIORITY_BACKGROUND):
+        await ops.mark_as_read(100, max_id=10)
+    with write_priority(PRIORITY_USER):
+        await ops.mark_as_read(100, max_id=11)
+    await asyncio.sleep(0.03)
+
+    assert queue.tags == [
+        {"method": "read_history", "peer": 100, "priority": PRIORITY_USER}
+    ]
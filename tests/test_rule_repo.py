@@ -0,0 +1,68 @@
+"""Tests for SqliteRuleRepository bulk replace."""
+
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from src.rules.models import Rule, RuleType
+from src.rules.sqlite_repo import SqliteRuleRepository
+
+_SCHEMA_SQL = """
+CREATE TABLE users (id INTEGER PRIMARY KEY);
+INSERT INTO users (id) VALUES (1);
+CREATE TABLE rules (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    rule_type TEXT NOT NULL,
+    chat_id INTEGER NOT NULL,
+    topic_id INTEGER,
+    config TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE UNIQUE INDEX idx_rules_unique_scope
+ON rules (user_id, rule_type, chat_id, COALESCE(topic_id, -1));
+"""
+
+
+@pytest.fixture()
+def repo():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rules.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(_SCHEMA_SQL)
+        conn.close()
+        r = SqliteRuleRepository(db_path=path)
+        yield r
+        r._pool.close()
+
+
+async def test_replace_all_swaps_rule_set(repo):
+    await repo.add(Rule(rule_type=RuleType.AUTOREAD, chat_id=1))
+
+    await repo.replace_all(
+        [
+            Rule(rule_type=RuleType.AUTOREAD, chat_id=2),
+            Rule(rule_type=RuleType.AUTOREACT, chat_id=3, config={"emoji": "👍"}),
+        ]
+    )
+
+    rules = await repo.get_all()
+    assert [(r.chat_id, r.rule_type) for r in rules] == [
+        (2, RuleType.AUTOREAD),
+        (3, RuleType.AUTOREACT),
+    ]
+    assert rules[1].config == {"emoji": "👍"}
+
+
+async def test_replace_all_is_atomic_on_failure(repo):
+    await repo.add(Rule(rule_type=RuleType.AUTOREAD, chat_id=1))
+
+    duplicate = Rule(rule_type=RuleType.AUTOREAD, chat_id=2)
+    with pytest.raises(sqlite3.IntegrityError):
+        await repo.replace_all([duplicate, duplicate])
+
+    rules = await repo.get_all()
+    assert [r.chat_id for r in rules] == [1]
@@ -66,7 +66,7 @@ def make_service(
 ) -> RuleService:
     if rule_repo is None:
         rule_repo = AsyncMock()
-        rule_repo.get_by_chat_and_topic.return_value = []
+        rule_repo.get_all.return_value = []
     if action_repo is None:
         action_repo = AsyncMock()
     if chat_repo is None:
@@ -84,7 +84,7 @@ def make_service(
 
 async def test_is_autoread_enabled_returns_true_when_rule_exists():
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AUTOREAD)
     ]
     svc = make_service(rule_repo=rule_repo)
@@ -93,7 +93,7 @@ async def test_is_autoread_enabled_returns_true_when_rule_exists():
 
 async def test_is_autoread_enabled_returns_false_when_no_rule():
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = []
+    rule_repo.get_all.return_value = []
     svc = make_service(rule_repo=rule_repo)
     assert await svc.is_autoread_enabled(100) is False
 
@@ -101,7 +101,7 @@ async def test_is_autoread_enabled_returns_false_when_no_rule():
 async def test_is_autoread_enabled_topic_specific_takes_priority():
     """Topic-specific rule overrides chat-level absence."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AUTOREAD, topic_id=5)
     ]
     svc = make_service(rule_repo=rule_repo)
@@ -177,6 +177,34 @@ async def test_global_autoread_regex_no_match():
     assert result == ""
 
 
+async def test_global_autoread_invalid_regex_is_ignored():
+    user = User(autoread_regex="([unclosed", autoread_polls=True)
+    svc = make_service(user=user)
+    assert await svc.check_global_autoread_rules(make_message(text="x"), 1) == ""
+    assert (
+        await svc.check_global_autoread_rules(make_message(is_poll=True), 1)
+        == "global_poll"
+    )
+
+
+async def test_global_autoread_matcher_reused_for_same_settings():
+    svc = make_service(user=User(autoread_bots="@MyBot, ,@other"))
+    first = await svc.get_global_autoread_matcher()
+    second = await svc.get_global_autoread_matcher()
+    assert first is second
+    assert first is not None
+    assert first.bot_usernames == frozenset({"mybot", "other"})
+
+
+async def test_global_autoread_matcher_rebuilt_on_new_settings():
+    svc = make_service(user=User(autoread_regex="^ping$"))
+    msg = make_message(text="pong")
+    assert await svc.check_global_autoread_rules(msg, 1) == ""
+
+    svc.user_repo.get_user.return_value = User(autoread_regex="^pong$")
+    assert await svc.check_global_autoread_rules(msg, 1) == "global_regex"
+
+
 # ---------------------------------------------------------------------------
 # apply_autoreact
 # ---------------------------------------------------------------------------
@@ -184,7 +212,7 @@ async def test_global_autoread_regex_no_match():
 
 async def test_apply_autoreact_skips_outgoing():
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(100, RuleType.AUTOREACT, config={"emoji": "👍", "target_users": []})
     ]
     chat_repo = AsyncMock()
@@ -197,7 +225,7 @@ async def test_apply_autoreact_skips_outgoing():
 async def test_apply_autoreact_fires_for_matching_sender():
     sender_id = 42
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(
             100,
             RuleType.AUTOREACT,
@@ -213,7 +241,7 @@ async def test_apply_autoreact_fires_for_matching_sender():
 
 async def test_apply_autoreact_skips_nonmatching_sender():
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(
             100,
             RuleType.AUTOREACT,
@@ -230,7 +258,7 @@ async def test_apply_autoreact_skips_nonmatching_sender():
 async def test_apply_autoreact_fires_for_all_senders_when_no_targets():
     """Empty target_users list means react to everyone."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(100, RuleType.AUTOREACT, config={"emoji": "❤️", "target_users": []})
     ]
     chat_repo = AsyncMock()
@@ -243,7 +271,7 @@ async def test_apply_autoreact_fires_for_all_senders_when_no_targets():
 async def test_apply_autoreact_skips_already_reacted():
     """Does not send reaction if the emoji is already chosen."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(100, RuleType.AUTOREACT, config={"emoji": "👍", "target_users": []})
     ]
     chat_repo = AsyncMock()
@@ -257,7 +285,7 @@ async def test_apply_autoreact_skips_already_reacted():
 async def test_apply_autoreact_album_dedup():
     """Only one reaction is sent per album group_id."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(100, RuleType.AUTOREACT, config={"emoji": "🔥", "target_users": []})
     ]
     chat_repo = AsyncMock()
@@ -280,7 +308,7 @@ async def test_apply_autoreact_album_dedup():
 
 async def test_toggle_rule_creates_new_rule_when_enabled():
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = []
+    rule_repo.get_all.return_value = []
     rule_repo.add.return_value = 1
     svc = make_service(rule_repo=rule_repo)
     result = await svc.toggle_autoread(100, None, enabled=True)
@@ -291,13 +319,111 @@ async def test_toggle_rule_creates_new_rule_when_enabled():
 async def test_toggle_rule_deletes_existing_when_disabled():
     existing = make_rule(100, RuleType.AUTOREAD)
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [existing]
+    rule_repo.get_all.return_value = [existing]
     svc = make_service(rule_repo=rule_repo)
     result = await svc.toggle_autoread(100, None, enabled=False)
     rule_repo.delete.assert_called_once_with(existing.id)
     assert result is None
 
 
+# ---------------------------------------------------------------------------
+# Rule index (in-memory lookups with write-through)
+# ---------------------------------------------------------------------------
+
+
+async def test_rule_index_loaded_once_for_many_lookups():
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = [make_rule(100, RuleType.AUTOREAD)]
+    svc = make_service(rule_repo=rule_repo)
+
+    for _ in range(5):
+        assert await svc.is_autoread_enabled(100) is True
+        assert await svc.is_ai_autoread_enabled(100) is False
+
+    rule_repo.get_all.assert_awaited_once()
+    rule_repo.get_by_chat_and_topic.assert_not_called()
+
+
+async def test_rule_index_topic_falls_back_to_chat_rule():
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = [
+        make_rule(100, RuleType.AUTOREACT, config={"emoji": "👍"}),
+        make_rule(100, RuleType.AUTOREACT, topic_id=5, config={"emoji": "🔥"}),
+    ]
+    svc = make_service(rule_repo=rule_repo)
+
+    topic_rule = await svc.get_rule(100, 5, RuleType.AUTOREACT)
+    other_topic_rule = await svc.get_rule(100, 6, RuleType.AUTOREACT)
+
+    assert topic_rule is not None and topic_rule.config["emoji"] == "🔥"
+    assert other_topic_rule is not None and other_topic_rule.config["emoji"] == "👍"
+
+
+async def test_rule_index_write_through_on_toggle():
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = []
+    rule_repo.add.return_value = 7
+    svc = make_service(rule_repo=rule_repo)
+
+    await svc.toggle_autoread(100, None, enabled=True)
+    assert await svc.is_autoread_enabled(100) is True
+
+    await svc.toggle_autoread(100, None, enabled=False)
+    rule_repo.delete.assert_called_once_with(7)
+    assert await svc.is_autoread_enabled(100) is False
+    rule_repo.get_all.assert_awaited_once()
+
+
+async def test_rule_index_updates_autoreact_config_in_place():
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = [
+        make_rule(100, RuleType.AUTOREACT, config={"emoji": "👍"})
+    ]
+    svc = make_service(rule_repo=rule_repo)
+
+    await svc.set_autoreact(100, None, True, {"emoji": "🔥"})
+
+    rule = await svc.get_rule(100, None, RuleType.AUTOREACT)
+    assert rule is not None and rule.config == {"emoji": "🔥"}
+    rule_repo.update.assert_called_once()
+
+
+async def test_reload_does_not_undo_a_concurrent_toggle():
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = []
+    rule_repo.add.return_value = 7
+    svc = make_service(rule_repo=rule_repo)
+    await svc.load_rules()
+    stored: List[Rule] = []
+
+    async def get_all():
+        snapshot = list(stored)
+        if not stored:
+            # The toggle is written through while this stale snapshot is read
+            rule = await svc.toggle_autoread(100, None, enabled=True)
+            stored.append(rule)
+        return snapshot
+
+    rule_repo.get_all.side_effect = get_all
+    await svc.load_rules()
+
+    assert rule_repo.get_all.await_count == 3
+    assert await svc.is_autoread_enabled(100) is True
+
+
+async def test_delete_rule_removes_from_index():
+    rule = make_rule(100, RuleType.AUTOREAD)
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = [rule]
+    svc = make_service(rule_repo=rule_repo)
+    await svc.load_rules()
+
+    await svc.delete_rule(rule.id)
+
+    rule_repo.delete.assert_called_once_with(rule.id)
+    assert await svc.is_autoread_enabled(100) is False
+
+
 # ---------------------------------------------------------------------------
 # run_startup_scan
 # ---------------------------------------------------------------------------
@@ -316,7 +442,7 @@ async def test_startup_scan_skips_chat_with_no_autoread_rule():
     """Non-forum chat with multiple unread and no rule is skipped (not read)."""
     chat = make_chat(id=1, unread_count=5)
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = []
+    rule_repo.get_all.return_value = []
     action_repo = AsyncMock()
     chat_repo = AsyncMock()
     chat_repo.is_connected = MagicMock(return_value=True)
@@ -327,15 +453,15 @@ async def test_startup_scan_skips_chat_with_no_autoread_rule():
 
     await svc.run_startup_scan()
 
-    chat_repo.mark_as_read.assert_not_called()
-    action_repo.add_log.assert_not_called()
+    chat_repo.mark_many_as_read.assert_not_called()
+    action_repo.add_logs.assert_not_called()
 
 
 async def test_startup_scan_marks_read_chat_with_autoread_rule():
     """Non-forum chat with an autoread rule is marked read and logged."""
     chat = make_chat(id=42, unread_count=7)
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=42, rule_type=RuleType.AUTOREAD)
     ]
     action_repo = AsyncMock()
@@ -348,9 +474,9 @@ async def test_startup_scan_marks_read_chat_with_autoread_rule():
 
     await svc.run_startup_scan()
 
-    chat_repo.mark_as_read.assert_called_once_with(42)
-    action_repo.add_log.assert_called_once()
-    log_call = action_repo.add_log.call_args[0][0]
+    chat_repo.mark_many_as_read.assert_called_once_with([(42, None)])
+    action_repo.add_logs.assert_called_once()
+    (log_call,) = action_repo.add_logs.call_args[0][0]
     assert log_call.action == "startup_read"
     assert log_call.chat_id == 42
     assert log_call.reason == "autoread_rule_startup"
@@ -366,13 +492,10 @@ async def test_startup_scan_forum_chat_checks_topics():
         id=20, name="Topic 20", unread_count=1, chat_type=ChatType.TOPIC
     )
 
-    def rule_side_effect(chat_id, topic_id):
-        if chat_id == 100 and topic_id == 10:
-            return [make_rule(chat_id=100, rule_type=RuleType.AUTOREAD, topic_id=10)]
-        return []
-
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.side_effect = rule_side_effect
+    rule_repo.get_all.return_value = [
+        make_rule(chat_id=100, rule_type=RuleType.AUTOREAD, topic_id=10)
+    ]
     action_repo = AsyncMock()
     chat_repo = AsyncMock()
     chat_repo.is_connected = MagicMock(return_value=True)
@@ -385,13 +508,81 @@ async def test_startup_scan_forum_chat_checks_topics():
     await svc.run_startup_scan()
 
     # Only topic 10 (with rule) should be marked read
-    chat_repo.mark_as_read.assert_called_once_with(100, 10)
-    action_repo.add_log.assert_called_once()
-    log_call = action_repo.add_log.call_args[0][0]
+    chat_repo.mark_many_as_read.assert_called_once_with([(100, 10)])
+    action_repo.add_logs.assert_called_once()
+    (log_call,) = action_repo.add_logs.call_args[0][0]
     assert log_call.action == "startup_read"
     assert "Topic 10" in log_call.chat_name
 
 
+async def test_startup_scan_batches_reads_and_global_rule_lookups():
+    """Single-unread chats are checked against global rules concurrently;
+    all reads and logs are submitted as one batch, failures are skipped."""
+    chats = [
+        make_chat(id=1, unread_count=4),
+        make_chat(id=2, unread_count=1),
+        make_chat(id=3, unread_count=1),
+        make_chat(id=4, unread_count=1),
+    ]
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = [make_rule(chat_id=1, rule_type=RuleType.AUTOREAD)]
+    user_repo = AsyncMock()
+    user_repo.get_user.return_value = User(autoread_self=True)
+    action_repo = AsyncMock()
+    chat_repo = AsyncMock()
+    chat_repo.is_connected = MagicMock(return_value=True)
+    chat_repo.get_all_unread_chats.return_value = chats
+
+    async def _last_message(chat_id, limit):
+        if chat_id == 4:
+            raise RuntimeError("boom")
+        return [make_message(is_outgoing=chat_id == 2)]
+
+    chat_repo.get_messages.side_effect = _last_message
+    svc = make_service(
+        rule_repo=rule_repo,
+        user_repo=user_repo,
+        action_repo=action_repo,
+        chat_repo=chat_repo,
+    )
+
+    await svc.run_startup_scan()
+
+    chat_repo.mark_many_as_read.assert_called_once_with([(1, None), (2, None)])
+    chat_repo.mark_as_read.assert_not_called()
+    logs = action_repo.add_logs.call_args[0][0]
+    assert [(log.chat_id, log.reason) for log in logs] == [
+        (1, "autoread_rule_startup"),
+        (2, "global_self"),
+    ]
+    action_repo.add_log.assert_not_called()
+
+
+async def test_startup_scan_uses_last_message_from_dialog_listing():
+    """Chats listed with their last message need no extra fetch."""
+    chat = make_chat(id=5, unread_count=1)
+    chat.last_message = make_message(is_outgoing=True)
+    rule_repo = AsyncMock()
+    rule_repo.get_all.return_value = []
+    user_repo = AsyncMock()
+    user_repo.get_user.return_value = User(autoread_self=True)
+    action_repo = AsyncMock()
+    chat_repo = AsyncMock()
+    chat_repo.is_connected = MagicMock(return_value=True)
+    chat_repo.get_all_unread_chats.return_value = [chat]
+    svc = make_service(
+        rule_repo=rule_repo,
+        user_repo=user_repo,
+        action_repo=action_repo,
+        chat_repo=chat_repo,
+    )
+
+    await svc.run_startup_scan()
+
+    chat_repo.get_messages.assert_not_called()
+    chat_repo.mark_many_as_read.assert_called_once_with([(5, None)])
+
+
 # ---------------------------------------------------------------------------
 # handle_new_message_event — action type (e.g. pin service messages)
 # ---------------------------------------------------------------------------
@@ -399,7 +590,7 @@ async def test_startup_scan_forum_chat_checks_topics():
 
 async def test_handle_new_message_event_autoread_on_action():
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AUTOREAD)
     ]
     action_repo = AsyncMock()
@@ -424,7 +615,7 @@ async def test_handle_new_message_event_autoread_on_action():
 
 async def test_handle_new_message_event_topic_autoread_uses_message_id():
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(chat_id=100, rule_type=RuleType.AUTOREAD)
     ]
     action_repo = AsyncMock()
@@ -468,7 +659,7 @@ async def test_handle_new_message_event_global_rule_marks_only_current_message()
 async def test_apply_autoreact_skips_service_message():
     """Service messages are never reacted to even with a blanket autoreact rule."""
     rule_repo = AsyncMock()
-    rule_repo.get_by_chat_and_topic.return_value = [
+    rule_repo.get_all.return_value = [
         make_rule(100, RuleType.AUTOREACT, config={"emoji": "👍", "target_users": []})
     ]
     chat_repo = AsyncMock()
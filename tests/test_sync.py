@@ -1,23 +1,28 @@
 """Tests for sync_rules_from_remote() — startup rules sync (S02).
 
 Covers:
-  R010 — Happy path: fetch JSON, delete all local rules, insert remote rules,
+  R010 — Happy path: fetch JSON, replace local rules with remote rules,
           overlay user settings.
   R011 — Failure modes: HTTP error, bad JSON, timeout all log a warning and
           don't raise; startup continues.
-  R012 — Full replace: delete_all() is called before any add().
+  R012 — Full replace: all remote rules land in one replace_all() call.
 
 Technique: httpx.AsyncClient is mocked via unittest.mock.patch on the module
 that imports it (src.rules.sync).  Rule/User repos are AsyncMock instances
 passed as explicit parameters, so no Quart app is needed.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 
 from src.rules.models import Rule, RuleType
-from src.rules.sync import sync_rules_from_remote
+from src.rules.sync import (
+    export_digest,
+    job_periodic_rules_sync,
+    sync_rules_from_remote,
+)
 from src.users.models import User
 
 
@@ -73,8 +78,7 @@ def _make_mock_response(payload: dict, status_code: int = 200) -> MagicMock:
 def _make_repos(user: User | None = None):
     """Return (rule_repo, user_repo) AsyncMock pair."""
     rule_repo = AsyncMock()
-    rule_repo.delete_all = AsyncMock(return_value=None)
-    rule_repo.add = AsyncMock(return_value=1)
+    rule_repo.replace_all = AsyncMock(return_value=None)
 
     user_repo = AsyncMock()
     user_repo.get_user = AsyncMock(return_value=user)
@@ -89,7 +93,7 @@ def _make_repos(user: User | None = None):
 
 
 async def test_happy_path_two_rules_and_user_settings():
-    """R010 + R012: delete_all called first, add called twice with correct Rule
+    """R010 + R012: replace_all called once with both remote rules as Rule
     objects, user settings overlaid via save_user."""
     user = User(
         api_id=12345,
@@ -113,24 +117,17 @@ async def test_happy_path_two_rules_and_user_settings():
     with patch("src.rules.sync.httpx.AsyncClient", return_value=mock_client_instance):
         await sync_rules_from_remote(_URL, rule_repo, user_repo)
 
-    # delete_all must have been called exactly once
-    rule_repo.delete_all.assert_called_once()
+    # replace_all must have been called exactly once with both rules, in order
+    rule_repo.replace_all.assert_called_once()
+    synced = rule_repo.replace_all.call_args[0][0]
+    assert len(synced) == 2
 
-    # add must have been called twice, in order
-    assert rule_repo.add.call_count == 2
-
-    # Verify call order: delete_all before any add
-    manager = MagicMock()
-    manager.attach_mock(rule_repo.delete_all, "delete_all")
-    manager.attach_mock(rule_repo.add, "add")
-    # Simpler: verify delete_all was called before add via position in mock_calls
-    all_calls = rule_repo.mock_calls
-    delete_idx = next(i for i, c in enumerate(all_calls) if c[0] == "delete_all")
-    add_idx = next(i for i, c in enumerate(all_calls) if c[0] == "add")
-    assert delete_idx < add_idx, "delete_all must be called before add()"
+    # Per-rule adds and separate deletes are no longer used
+    rule_repo.add.assert_not_called()
+    rule_repo.delete_all.assert_not_called()
 
-    # Inspect the Rule objects passed to add()
-    first_call_args = rule_repo.add.call_args_list[0][0][0]
+    # Inspect the Rule objects passed to replace_all()
+    first_call_args = synced[0]
     assert isinstance(first_call_args, Rule)
     assert first_call_args.id is None
     assert first_call_args.user_id == 1
@@ -139,7 +136,7 @@ async def test_happy_path_two_rules_and_user_settings():
     assert first_call_args.topic_id is None
     assert first_call_args.config == {}
 
-    second_call_args = rule_repo.add.call_args_list[1][0][0]
+    second_call_args = synced[1]
     assert isinstance(second_call_args, Rule)
     assert second_call_args.id is None
     assert second_call_args.user_id == 1
@@ -172,8 +169,8 @@ async def test_happy_path_two_rules_and_user_settings():
 # ---------------------------------------------------------------------------
 
 
-async def test_empty_rules_list_no_add_calls():
-    """R010 + R012: rules=[] → delete_all called, no add calls, user settings
+async def test_empty_rules_list_replaces_with_empty_set():
+    """R010 + R012: rules=[] → replace_all([]) clears local rules, user settings
     still updated."""
     payload = {"rules": [], "user_settings": _EXPORT_USER_SETTINGS}
     user = User()
@@ -188,8 +185,7 @@ async def test_empty_rules_list_no_add_calls():
     with patch("src.rules.sync.httpx.AsyncClient", return_value=mock_client_instance):
         await sync_rules_from_remote(_URL, rule_repo, user_repo)
 
-    rule_repo.delete_all.assert_called_once()
-    rule_repo.add.assert_not_called()
+    rule_repo.replace_all.assert_called_once_with([])
     user_repo.save_user.assert_called_once()
 
 
@@ -213,8 +209,8 @@ async def test_no_user_row_rules_synced_save_user_not_called():
         await sync_rules_from_remote(_URL, rule_repo, user_repo)
 
     # Rules must still be synced
-    rule_repo.delete_all.assert_called_once()
-    assert rule_repo.add.call_count == 2
+    rule_repo.replace_all.assert_called_once()
+    assert len(rule_repo.replace_all.call_args[0][0]) == 2
 
     # But no ghost user should be created
     user_repo.save_user.assert_not_called()
@@ -251,8 +247,7 @@ async def test_http_error_logs_warning_no_repo_calls(caplog):
         # Must NOT raise — failure is non-fatal
         await sync_rules_from_remote(_URL, rule_repo, user_repo)
 
-    rule_repo.delete_all.assert_not_called()
-    rule_repo.add.assert_not_called()
+    rule_repo.replace_all.assert_not_called()
     user_repo.get_user.assert_not_called()
     user_repo.save_user.assert_not_called()
 
@@ -264,8 +259,8 @@ async def test_http_error_logs_warning_no_repo_calls(caplog):
 # ---------------------------------------------------------------------------
 
 
-async def test_bad_json_no_rules_key_no_delete_all_called():
-    """R011: response.json() raises ValueError → warning logged, delete_all
+async def test_bad_json_no_rules_key_no_replace_all_called():
+    """R011: response.json() raises ValueError → warning logged, replace_all
     never called (data was never parsed cleanly)."""
     rule_repo, user_repo = _make_repos()
 
@@ -281,8 +276,7 @@ async def test_bad_json_no_rules_key_no_delete_all_called():
     with patch("src.rules.sync.httpx.AsyncClient", return_value=mock_client_instance):
         await sync_rules_from_remote(_URL, rule_repo, user_repo)
 
-    rule_repo.delete_all.assert_not_called()
-    rule_repo.add.assert_not_called()
+    rule_repo.replace_all.assert_not_called()
     user_repo.save_user.assert_not_called()
 
 
@@ -291,9 +285,9 @@ async def test_bad_json_no_rules_key_no_delete_all_called():
 # ---------------------------------------------------------------------------
 
 
-async def test_missing_rules_key_in_payload_no_add_delete_still_called():
+async def test_missing_rules_key_in_payload_replace_still_called():
     """R010 + R012: if payload has no 'rules' key, .get('rules', []) returns
-    [] — delete_all IS called (full replace) but add is not."""
+    [] — replace_all IS called with an empty set (full replace)."""
     payload = {"user_settings": _EXPORT_USER_SETTINGS}  # no "rules" key
     user = User()
     rule_repo, user_repo = _make_repos(user=user)
@@ -307,9 +301,8 @@ async def test_missing_rules_key_in_payload_no_add_delete_still_called():
     with patch("src.rules.sync.httpx.AsyncClient", return_value=mock_client_instance):
         await sync_rules_from_remote(_URL, rule_repo, user_repo)
 
-    # delete_all called (full replace semantics even for empty remote set)
-    rule_repo.delete_all.assert_called_once()
-    rule_repo.add.assert_not_called()
+    # full replace semantics even for empty remote set
+    rule_repo.replace_all.assert_called_once_with([])
 
 
 # ---------------------------------------------------------------------------
@@ -331,8 +324,7 @@ async def test_network_timeout_logs_warning_no_repo_calls():
     with patch("src.rules.sync.httpx.AsyncClient", return_value=mock_client_instance):
         await sync_rules_from_remote(_URL, rule_repo, user_repo)
 
-    rule_repo.delete_all.assert_not_called()
-    rule_repo.add.assert_not_called()
+    rule_repo.replace_all.assert_not_called()
     user_repo.get_user.assert_not_called()
     user_repo.save_user.assert_not_called()
 
@@ -462,3 +454,135 @@ async def test_ai_fields_synced_from_export():
     assert saved_user.ai_model == "gpt-4o"
     assert saved_user.ai_api_key == "sk-synced-key"
     assert saved_user.ai_prompt == "synced prompt"
+
+
+# ---------------------------------------------------------------------------
+# Conditional / incremental sync (ETag + content hash + diff)
+# ---------------------------------------------------------------------------
+
+
+def _patched_client(response: MagicMock) -> AsyncMock:
+    client = AsyncMock()
+    client.get = AsyncMock(return_value=response)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=False)
+    return client
+
+
+def _make_state_repo(values: dict | None = None) -> AsyncMock:
+    values = values or {}
+    state_repo = AsyncMock()
+    state_repo.get_value = AsyncMock(side_effect=lambda key: values.get(key))
+    return state_repo
+
+
+async def test_sends_if_none_match_and_skips_on_304():
+    rule_repo, user_repo = _make_repos(user=User())
+    state_repo = _make_state_repo({"rules_sync_etag": '"abc"'})
+    response = _make_mock_response({}, status_code=304)
+    client = _patched_client(response)
+
+    with patch("src.rules.sync.httpx.AsyncClient", return_value=client):
+        changed = await sync_rules_from_remote(_URL, rule_repo, user_repo, state_repo)
+
+    assert changed is False
+    assert client.get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+    response.raise_for_status.assert_not_called()
+    rule_repo.replace_all.assert_not_called()
+    rule_repo.apply_diff.assert_not_called()
+    user_repo.save_user.assert_not_called()
+    state_repo.set_values.assert_not_called()
+
+
+async def test_identical_content_hash_skips_rewrite():
+    rule_repo, user_repo = _make_repos(user=User())
+    state_repo = _make_state_repo({"rules_sync_hash": export_digest(_EXPORT_PAYLOAD)})
+    client = _patched_client(_make_mock_response(_EXPORT_PAYLOAD))
+
+    with patch("src.rules.sync.httpx.AsyncClient", return_value=client):
+        changed = await sync_rules_from_remote(_URL, rule_repo, user_repo, state_repo)
+
+    assert changed is False
+    rule_repo.get_all.assert_not_called()
+    rule_repo.replace_all.assert_not_called()
+    user_repo.save_user.assert_not_called()
+
+
+async def test_changed_export_applies_only_diff_and_stores_state():
+    local = [
+        Rule(id=1, rule_type=RuleType.AUTOREAD, chat_id=111),  # unchanged
+        Rule(id=2, rule_type=RuleType.AUTOREACT, chat_id=222, topic_id=5),  # config
+        Rule(id=3, rule_type=RuleType.AUTOREAD, chat_id=333),  # gone remotely
+    ]
+    payload = {
+        "rules": _EXPORT_RULES
+        + [{"rule_type": "ai_autoread", "chat_id": 444, "topic_id": None}],
+        "user_settings": _EXPORT_USER_SETTINGS,
+    }
+    rule_repo, user_repo = _make_repos(user=User())
+    rule_repo.get_all = AsyncMock(return_value=local)
+    state_repo = _make_state_repo({"rules_sync_hash": "stale"})
+    response = _make_mock_response(payload)
+    response.headers = {"ETag": '"new"'}
+
+    with patch(
+        "src.rules.sync.httpx.AsyncClient", return_value=_patched_client(response)
+    ):
+        changed = await sync_rules_from_remote(_URL, rule_repo, user_repo, state_repo)
+
+    assert changed is True
+    rule_repo.replace_all.assert_not_called()
+    inserts, updates, delete_ids = rule_repo.apply_diff.call_args[0]
+    assert [(r.rule_type, r.chat_id) for r in inserts] == [(RuleType.AI_AUTOREAD, 444)]
+    assert [(r.id, r.config) for r in updates] == [(2, {"emoji": "👍"})]
+    assert delete_ids == [3]
+    state_repo.set_values.assert_called_once_with(
+        {"rules_sync_etag": '"new"', "rules_sync_hash": export_digest(payload)}
+    )
+
+
+# ---------------------------------------------------------------------------
+# Periodic background sync
+# ---------------------------------------------------------------------------
+
+
+async def test_periodic_sync_reloads_rules_only_on_change():
+    shutdown = asyncio.Event()
+    results = iter([False, True])
+    on_change = AsyncMock()
+
+    async def fake_sync(*args, **kwargs):
+        try:
+            return next(results)
+        except StopIteration:
+            shutdown.set()
+            return False
+
+    rule_repo, user_repo = _make_repos()
+    with patch("src.rules.sync.sync_rules_from_remote", side_effect=fake_sync) as sync:
+        await asyncio.wait_for(
+            job_periodic_rules_sync(
+                _URL,
+                rule_repo,
+                user_repo,
+                None,
+                on_change=on_change,
+                shutdown_event=shutdown,
+                interval=0.001,
+            ),
+            timeout=1.0,
+        )
+
+    assert sync.await_count == 3
+    on_change.assert_awaited_once()
+
+
+async def test_periodic_sync_stops_on_shutdown_without_polling():
+    shutdown = asyncio.Event()
+    shutdown.set()
+    rule_repo, user_repo = _make_repos()
+    with patch("src.rules.sync.sync_rules_from_remote") as sync:
+        await job_periodic_rules_sync(
+            _URL, rule_repo, user_repo, None, AsyncMock(), shutdown, interval=60
+        )
+    sync.assert_not_called()
@@ -0,0 +1,83 @@
+"""Tests for CachedUserRepository: read-through caching and invalidation."""
+
+import dataclasses
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.users.cached_repo import CachedUserRepository
+from src.users.models import User
+
+
+def _make_repo(user: User | None = None):
+    inner = AsyncMock()
+    inner.get_user = AsyncMock(return_value=user)
+    return CachedUserRepository(inner), inner
+
+
+async def test_get_user_hits_inner_repo_once():
+    repo, inner = _make_repo(User(autoread_regex="x"))
+
+    first = await repo.get_user(1)
+    second = await repo.get_user(1)
+
+    assert first is second
+    inner.get_user.assert_awaited_once_with(1)
+
+
+async def test_missing_user_is_cached_until_saved():
+    repo, inner = _make_repo(None)
+
+    assert await repo.get_user(1) is None
+    assert await repo.get_user(1) is None
+    inner.get_user.assert_awaited_once()
+
+    inner.get_user.return_value = User()
+    await repo.save_user(User())
+    assert await repo.get_user(1) == User()
+
+
+async def test_save_user_invalidates_snapshot():
+    repo, inner = _make_repo(User(autoread_polls=False))
+    await repo.get_user(1)
+
+    updated = User(autoread_polls=True)
+    inner.get_user.return_value = updated
+    await repo.save_user(updated)
+
+    inner.save_user.assert_awaited_once_with(updated)
+    assert (await repo.get_user(1)).autoread_polls is True
+    assert inner.get_user.await_count == 2
+
+
+async def test_delete_user_invalidates_snapshot():
+    repo, inner = _make_repo(User())
+    await repo.get_user(1)
+
+    inner.get_user.return_value = None
+    await repo.delete_user(1)
+
+    assert await repo.get_user(1) is None
+
+
+async def test_read_racing_a_save_is_not_cached():
+    repo, inner = _make_repo(None)
+    stale = User(autoread_self=False)
+
+    async def slow_get(user_id):
+        # A save lands while the read is in flight
+        await repo.save_user(User(autoread_self=True))
+        return stale
+
+    inner.get_user.side_effect = slow_get
+    assert await repo.get_user(1) is stale
+
+    inner.get_user.side_effect = None
+    inner.get_user.return_value = User(autoread_self=True)
+    assert (await repo.get_user(1)).autoread_self is True
+
+
+def test_user_snapshot_is_immutable():
+    user = User()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        user.autoread_polls = True  # type: ignore[misc]
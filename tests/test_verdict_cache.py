@@ -0,0 +1,127 @@
+"""Tests for AI verdict caching by normalized text."""
+
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+
+from src.ai.ports import AIClassifier, VerdictCache
+from src.ai.verdict_cache import CachingClassifier, normalize_text
+
+
+class MemoryVerdictCache(VerdictCache):
+    def __init__(self):
+        self.data: Dict[str, bool] = {}
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bool]]:
+        return [self.data.get(k) for k in keys]
+
+    async def set_many(self, verdicts: Dict[str, bool]) -> None:
+        self.data.update(verdicts)
+
+
+class BrokenVerdictCache(VerdictCache):
+    async def get_many(self, keys):
+        raise ConnectionError("valkey down")
+
+    async def set_many(self, verdicts):
+        raise ConnectionError("valkey down")
+
+
+class CountingClassifier(AIClassifier):
+    def __init__(self, delay: float = 0):
+        self.calls: List[List[str]] = []
+        self.delay = delay
+
+    async def classify_is_ad(self, text):
+        return (await self.classify_many([text]))[0]
+
+    async def classify_many(self, texts):
+        self.calls.append(list(texts))
+        await asyncio.sleep(self.delay)
+        return ["buy" in t.lower() for t in texts]
+
+
+def test_normalize_text_ignores_markup_whitespace_and_tracking():
+    a = 'BUY <b>now</b>!\n\n<a href="x">https://shop.example/item?utm_source=chat1</a>'
+    b = "buy now!   https://shop.example/item?utm_source=chat2#top"
+
+    assert normalize_text(a) == normalize_text(b)
+    assert normalize_text(a) == "buy now! https://shop.example/item"
+    assert normalize_text("buy now") != normalize_text("buy later")
+
+
+async def test_repeated_text_costs_one_classification():
+    inner = CountingClassifier()
+    classifier = CachingClassifier(inner, MemoryVerdictCache(), "m", "p")
+
+    assert await classifier.classify_is_ad("Buy <i>now</i>") is True
+    assert await classifier.classify_is_ad("buy   now") is True
+
+    assert inner.calls == [["Buy <i>now</i>"]]
+
+
+async def test_model_or_prompt_change_invalidates_verdicts():
+    cache = MemoryVerdictCache()
+    inner = CountingClassifier()
+
+    await CachingClassifier(inner, cache, "m1", "p").classify_is_ad("buy")
+    await CachingClassifier(inner, cache, "m1", "p").classify_is_ad("buy")
+    await CachingClassifier(inner, cache, "m2", "p").classify_is_ad("buy")
+    await CachingClassifier(inner, cache, "m1", "other").classify_is_ad("buy")
+
+    assert len(inner.calls) == 3
+
+
+async def test_concurrent_copies_share_one_request():
+    inner = CountingClassifier(delay=0.01)
+    classifier = CachingClassifier(inner, MemoryVerdictCache(), "m", None)
+
+    results = await asyncio.gather(
+        *(
+            classifier.classify_is_ad(f"BUY now  {'' if i % 2 else ' '}")
+            for i in range(5)
+        )
+    )
+
+    assert results == [True] * 5
+    assert len(inner.calls) == 1
+
+
+async def test_classify_many_only_sends_misses():
+    inner = CountingClassifier()
+    classifier = CachingClassifier(inner, MemoryVerdictCache(), "m", None)
+    await classifier.classify_is_ad("buy this")
+
+    result = await classifier.classify_many(["buy this", "hello", "HELLO", "buy that"])
+
+    assert result == [True, False, False, True]
+    assert inner.calls[-1] == ["hello", "buy that"]
+
+
+async def test_cache_outage_falls_through_to_classifier():
+    inner = CountingClassifier()
+    classifier = CachingClassifier(inner, BrokenVerdictCache(), "m", None)
+
+    assert await classifier.classify_is_ad("buy") is True
+    assert await classifier.classify_is_ad("buy") is True
+    assert len(inner.calls) == 2
+
+
+async def test_classifier_errors_reach_concurrent_waiters():
+    class Failing(CountingClassifier):
+        async def classify_many(self, texts):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("quota")
+
+    classifier = CachingClassifier(Failing(), MemoryVerdictCache(), "m", None)
+
+    results = await asyncio.gather(
+        classifier.classify_is_ad("x"),
+        classifier.classify_is_ad("x"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        await classifier.classify_is_ad("x")
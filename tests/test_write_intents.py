@@ -0,0 +1,307 @@
+"""Tests for persisted Telegram write intents and their replay."""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from quart import Quart
+from telethon import functions, types
+
+from src.adapters.telegram.read_ops import ReadOps
+from src.adapters.telegram.write_intents import (
+    ReactionIntent,
+    ReadIntent,
+    SqliteWriteIntentStore,
+)
+from src.adapters.telegram.write_ops import WriteOps
+from src.infrastructure.telegram_queue import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_NORMAL,
+    PRIORITY_USER,
+)
+from src.web.routes import register_routes
+
+_SCHEMA_SQL = """
+CREATE TABLE pending_reads (
+    chat_id INTEGER NOT NULL,
+    topic_key INTEGER NOT NULL,
+    max_id INTEGER,
+    priority INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (chat_id, topic_key)
+);
+CREATE TABLE pending_reaction_ops (
+    id INTEGER PRIMARY KEY,
+    chat_id INTEGER NOT NULL,
+    msg_id INTEGER NOT NULL,
+    emoji TEXT NOT NULL,
+    present BOOLEAN,
+    priority INTEGER NOT NULL,
+    created_at TEXT NOT NULL
+);
+"""
+
+
+@pytest.fixture()
+def store():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "intents.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(_SCHEMA_SQL)
+        conn.close()
+        s = SqliteWriteIntentStore(db_path=path)
+        yield s
+        s._pool.close()
+
+
+class ManualQueue:
+    def __init__(self):
+        self.items = []
+
+    async def enqueue(self, coro_fn, **tags):
+        self.items.append(coro_fn)
+
+
+class FakeClient:
+    def __init__(self):
+        self.read_ack_calls = []
+        self.chosen = []
+        self.reaction_requests = []
+
+    async def get_input_entity(self, chat_id):
+        return f"peer-{chat_id}"
+
+    async def get_entity(self, peer):
+        return SimpleNamespace(title=str(peer))
+
+    async def send_read_acknowledge(self, entity, max_id=None):
+        self.read_ack_calls.append((entity, max_id))
+
+    async def get_messages(self, entity, ids=None):
+        results = [
+            SimpleNamespace(chosen=True, reaction=types.ReactionEmoji(emoticon=e))
+            for e in self.chosen
+        ]
+        return [SimpleNamespace(id=ids[0], reactions=SimpleNamespace(results=results))]
+
+    async def __call__(self, request):
+        assert isinstance(request, functions.messages.SendReactionRequest)
+        self.chosen = [r.emoticon for r in request.reaction]
+        self.reaction_requests.append(list(self.chosen))
+
+
+class FakeParser:
+    async def _parse_message(self, msg, chat_id=None):
+        return msg
+
+
+def _write_ops(client, queue, store):
+    return WriteOps(
+        client=client,
+        parser=FakeParser(),
+        write_queue=queue,
+        dispatch_fn=None,
+        get_topic_name_fn=_no_topic_name,
+        intent_store=store,
+    )
+
+
+async def _no_topic_name(chat_id, topic_id):
+    return None
+
+
+async def test_read_intents_merge_like_pending_reads(store):
+    await store.save_reads([ReadIntent(1, None, 10, PRIORITY_BACKGROUND)])
+    await store.save_reads([ReadIntent(1, None, 15, PRIORITY_USER)])
+    await store.save_reads([ReadIntent(1, None, 12, PRIORITY_NORMAL)])
+    await store.save_reads([ReadIntent(1, 7, 5, PRIORITY_NORMAL)])
+    await store.save_reads([ReadIntent(2, None, 3, PRIORITY_NORMAL)])
+    await store.save_reads([ReadIntent(2, None, None, PRIORITY_NORMAL)])
+    await store.save_reads([ReadIntent(2, None, 9, PRIORITY_NORMAL)])
+
+    reads, reactions = await store.load()
+
+    assert set(reads) == {
+        ReadIntent(1, None, 15, PRIORITY_USER),
+        ReadIntent(1, 7, 5, PRIORITY_NORMAL),
+        ReadIntent(2, None, None, PRIORITY_NORMAL),
+    }
+    assert reactions == []
+
+    await store.delete_read(1, 7)
+    reads, _ = await store.load()
+    assert (1, 7) not in {(r.chat_id, r.topic_id) for r in reads}
+
+
+async def test_reaction_intents_are_stored_per_write(store):
+    first = await store.save_reaction(ReactionIntent(1, 5, "👍", PRIORITY_BACKGROUND))
+    second = await store.save_reaction(ReactionIntent(1, 5, "👍", PRIORITY_BACKGROUND))
+    assert first != second
+
+    await store.resolve_reaction(first, True)
+    await store.delete_reaction(first)
+
+    _, reactions = await store.load()
+    assert reactions == [
+        ReactionIntent(1, 5, "👍", PRIORITY_BACKGROUND, present=None, intent_id=second)
+    ]
+
+
+async def test_read_intent_lives_until_the_read_is_sent(store):
+    queue = ManualQueue()
+    client = FakeClient()
+    ops = ReadOps(
+        client=client,
+        write_queue=queue,
+        dispatch_fn=None,
+        get_topic_name_fn=_no_topic_name,
+        intent_store=store,
+    )
+
+    await ops.mark_as_read(100, max_id=10)
+    reads, _ = await store.load()
+    assert reads == [ReadIntent(100, None, 10, PRIORITY_NORMAL)]
+
+    await queue.items.pop(0)()
+
+    assert client.read_ack_calls == [("peer-100", 10)]
+    assert await store.load() == ([], [])
+
+
+async def test_read_intent_survives_a_transient_failure(store):
+    queue = ManualQueue()
+    client = FakeClient()
+    failures = [ConnectionError("reconnecting")]
+
+    async def send_read_acknowledge(entity, max_id=None):
+        if failures:
+            raise failures.pop()
+        client.read_ack_calls.append((entity, max_id))
+
+    client.send_read_acknowledge = send_read_acknowledge
+    ops = ReadOps(
+        client=client,
+        write_queue=queue,
+        dispatch_fn=None,
+        get_topic_name_fn=_no_topic_name,
+        intent_store=store,
+    )
+
+    await ops.mark_as_read(100, max_id=10)
+    await queue.items.pop(0)()
+
+    reads, _ = await store.load()
+    assert reads == [ReadIntent(100, None, 10, PRIORITY_NORMAL)]
+
+    # The key is released, so the next request sends it again
+    await ops.mark_as_read(100, max_id=10)
+    await queue.items.pop(0)()
+    assert client.read_ack_calls == [("peer-100", 10)]
+    assert await store.load() == ([], [])
+
+
+async def test_restore_pending_replays_stored_intents(store):
+    await store.save_reads([ReadIntent(100, None, 10, PRIORITY_BACKGROUND)])
+    intent_id = await store.save_reaction(ReactionIntent(100, 5, "👍", PRIORITY_USER))
+    queue = ManualQueue()
+    client = FakeClient()
+    ops = _write_ops(client, queue, store)
+
+    await ops.restore_pending()
+    await asyncio.sleep(0)
+
+    assert len(queue.items) == 2
+    await queue.items.pop(0)()
+    assert client.read_ack_calls == [("peer-100", 10)]
+    reads, reactions = await store.load()
+    assert reads == []
+    # Replay keeps the original priority and does not store the intent again
+    assert reactions == [
+        ReactionIntent(100, 5, "👍", PRIORITY_USER, present=None, intent_id=intent_id)
+    ]
+
+    await queue.items.pop(0)()
+    assert client.reaction_requests == [["👍"]]
+    assert await store.load() == ([], [])
+
+
+async def test_reaction_replay_after_crash_does_not_toggle_back(store):
+    queue = ManualQueue()
+    client = FakeClient()
+    ops = _write_ops(client, queue, store)
+    await ops.send_reaction(100, 5, "👍")
+
+    # Simulate a crash after the request succeeded but before the intent
+    # was forgotten
+    forget = ops._forget_reaction
+
+    async def crash(intent):
+        raise asyncio.CancelledError
+
+    ops._forget_reaction = crash
+    with pytest.raises(asyncio.CancelledError):
+        await queue.items.pop(0)()
+    assert client.chosen == ["👍"]
+    _, reactions = await store.load()
+    assert [r.present for r in reactions] == [True]
+
+    ops._forget_reaction = forget
+    await ops.restore_pending()
+    await queue.items.pop(0)()
+
+    assert client.chosen == ["👍"]
+    assert client.reaction_requests == [["👍"]]
+    assert await store.load() == ([], [])
+
+
+async def test_quick_reaction_toggles_keep_their_own_intents(store):
+    queue = ManualQueue()
+    client = FakeClient()
+    ops = _write_ops(client, queue, store)
+
+    await ops.send_reaction(100, 5, "👍")
+    await ops.send_reaction(100, 5, "👍")
+    _, reactions = await store.load()
+    assert len(reactions) == 2
+
+    await queue.items.pop(0)()
+    _, reactions = await store.load()
+    # Finishing the first toggle leaves the second one stored
+    assert [r.intent_id for r in reactions] == [reactions[0].intent_id]
+    assert reactions[0].present is None
+
+    await queue.items.pop(0)()
+    assert client.reaction_requests == [["👍"], []]
+    assert client.chosen == []
+    assert await store.load() == ([], [])
+
+
+async def test_account_reset_discards_pending_writes(store):
+    await store.save_reads([ReadIntent(100, None, 10, PRIORITY_BACKGROUND)])
+    await store.save_reaction(ReactionIntent(100, 5, "👍", PRIORITY_USER))
+    old_ops = _write_ops(FakeClient(), ManualQueue(), store)
+
+    app = Quart(__name__)
+    register_routes(app)
+    app.user_repo = AsyncMock()
+    app.tg_adapter = MagicMock()
+    app.tg_adapter.disconnect = AsyncMock()
+    app.tg_adapter.discard_pending_writes = AsyncMock(
+        side_effect=old_ops.discard_pending
+    )
+
+    response = await app.test_client().post("/api/settings/reset")
+
+    assert response.status_code == 200
+    app.tg_adapter.disconnect.assert_awaited_once()
+    app.user_repo.delete_user.assert_awaited_once_with(1)
+
+    # The adapter of the next login has nothing to replay
+    queue = ManualQueue()
+    await _write_ops(FakeClient(), queue, store).restore_pending()
+    assert queue.items == []
+    assert await store.load() == ([], [])